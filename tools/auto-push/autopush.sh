@@ -13,6 +13,27 @@ echo "📝 Generating sitemap..."
 npx tsx scripts/generate-sitemap.ts
 echo "✓ Sitemap generated"
 
+# Refresh the blog full-text search index read by the search box on blog/index.html.
+# Over budget (BUDGET_KB) only warns: the index is still written and searchable, so the day's article is pushed anyway.
+# The size is printed to stderr by build_search_index.py; raise --budget-kb or trim the index when this shows up.
+echo "🔎 Building search index..."
+if ! python3 tools/build_search_index.py > /dev/null; then
+  echo "⚠ Search index over budget (size above). Pushing anyway." >&2
+else
+  echo "✓ Search index built"
+fi
+
+# Page weight gate: fail on pages that newly exceed the budget or got heavier than the recorded baseline
+# (report: .cache/page_weight.md / accept current state: python3 tools/page_weight.py --baseline --update-baseline,
+#  then commit tools/page_weight_baseline.json). A missing baseline fails the gate instead of being recreated.
+echo "⚖️  Checking page weight..."
+if ! python3 tools/page_weight.py --baseline tools/page_weight_baseline.json \
+     --json .cache/page_weight_report.json --md .cache/page_weight.md > /dev/null; then
+  echo "✗ Page weight budget exceeded (see .cache/page_weight.md). Skipping push."
+  exit 1
+fi
+echo "✓ Page weight OK"
+
 # Stage all changes (including untracked)
 git add -A
 
@@ -1,6 +1,5 @@
 import os
 import sys
-import shutil
 import datetime
 import re
 import argparse
@@ -9,6 +8,9 @@ import random
 from pathlib import Path
 from PIL import Image
 import google.generativeai as genai
+from keyword_classifier import compile_classifier
+from site_writer import SiteWriter
+import image_dims
 
 sys.path.append("/Users/satoshioka/youtube-project-share/transcription-system/_apps/production")
 try:
@@ -21,6 +23,7 @@ except ImportError:
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 BLOG_ROOT = PROJECT_ROOT / "blog"
 POSTS_DIR = BLOG_ROOT / "posts"
+OUT = SiteWriter(PROJECT_ROOT)
 
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
 if GEMINI_API_KEY:
@@ -185,17 +188,19 @@ TEMPLATE_HTML = """<!DOCTYPE html>
 </html>
 """
 
+# (slug, ラベル) ごとの判定キーワード。上にあるものが優先。
+CATEGORY_RULES = [
+    (('nisa', '新NISA'), ['nisa']),
+    (('mutual-fund', '投資信託'), ['fund', 'mutual', 'trust', 'kabu']),
+    (('life-plan', 'ライフプラン'), ['life', 'plan', 'retire']),
+]
+_classify_category = compile_classifier(CATEGORY_RULES, ('asset', '資産運用'))
+
 def determine_category(text_path):
     filename = text_path.name.lower()
     content = text_path.read_text(encoding='utf-8').lower()
-    
-    if 'nisa' in filename or 'nisa' in content:
-        return 'nisa', '新NISA'
-    if any(x in filename or x in content for x in ['fund', 'mutual', 'trust', 'kabu']):
-        return 'mutual-fund', '投資信託'
-    if any(x in filename or x in content for x in ['life', 'plan', 'retire']):
-        return 'life-plan', 'ライフプラン'
-    return 'asset', '資産運用'
+    # 改行はどのキーワードにも含まれないので、ファイル名と本文をまたいだ誤ヒットは起きない
+    return _classify_category(f"{filename}\n{content}")
 
 def get_next_slug(category):
     # すべて posts/ ディレクトリの中に保存する
@@ -249,7 +254,7 @@ def crop_to_16_9(image_path):
                 top = (height - target_height) // 2
                 bottom = top + target_height
                 img_cropped = img.crop((0, top, width, bottom))
-                img_cropped.save(image_path)
+                OUT.save_image(img_cropped, image_path, img.format)
     except Exception as e:
         print(f"Warning: Failed to crop image to 16:9: {e}")
 
@@ -273,8 +278,7 @@ def generate_section_image(heading_text, output_path):
         response = model.generate_content(img_input)
         for part in response.candidates[0].content.parts:
             if part.inline_data:
-                with open(output_path, "wb") as f:
-                    f.write(part.inline_data.data)
+                OUT.write_bytes(output_path, part.inline_data.data)
                 crop_to_16_9(output_path)
                 print(f"✅ Section image saved and cropped to 16:9 at {output_path}")
                 break
@@ -394,7 +398,7 @@ def update_sitemap(slug, title, image_name):
   </url>\n"""
         if '</urlset>' in content:
             content = content.replace('</urlset>', new_entry + '</urlset>')
-            sitemap_file.write_text(content, encoding='utf-8')
+            OUT.write_text(sitemap_file, content)
             print(f"Updated sitemap.xml")
 
 def generate_thumbnail_image(slug, title, output_path):
@@ -427,8 +431,7 @@ def generate_thumbnail_image(slug, title, output_path):
         image_saved = False
         for part in response.candidates[0].content.parts:
             if part.inline_data:
-                with open(output_path, "wb") as f:
-                    f.write(part.inline_data.data)
+                OUT.write_bytes(output_path, part.inline_data.data)
                 crop_to_16_9(output_path)
                 print(f"✅ Thumbnail saved and cropped to 16:9 at {output_path}")
                 image_saved = True
@@ -454,12 +457,12 @@ def push_to_github(commit_message):
 def main():
     # 🔒 封印（2026-06-04 りょう指示）：このツールが生成する旧デザイン
     #   （紫テーマ #667eea・jpgの見出し画像挿入・.highlight下線・max-width 800px）は使用禁止。
-    #   新デザインは tools/build_solo_articles2.py を使うこと。
+    #   新デザインは tools/article_engine.py（記事ソースは content/articles/<slug>.md）を使うこと。
     #   - テンプレ／参考記事：blog/2026/sp500-vs-fang-plus/sp500-vs-fang-plus.html（紺 #1a3a5c）
     #   - 見出しはインラインSVG（section-visual）、ヘッダーは webp 16:9（gen_solo_heroes.py 系）
     #   どうしても旧ツールが必要な場合のみ、この封印ガードを一時的に外すこと。
     print("⛔ auto_blog_generator.py は封印されています（旧デザインのため使用禁止）。")
-    print("   → 新デザインは tools/build_solo_articles2.py / 参考記事 blog/2026/sp500-vs-fang-plus/ を使用してください。")
+    print("   → 新デザインは tools/article_engine.py / 参考記事 blog/2026/sp500-vs-fang-plus/ を使用してください。")
     sys.exit(1)
     parser = argparse.ArgumentParser(description="Auto Blog Generator")
     parser.add_argument("text_file", help="Path to input text file")
@@ -507,7 +510,7 @@ def main():
     if args.image:
         src_img = Path(args.image)
         if src_img.exists():
-            shutil.copy(src_img, image_file)
+            OUT.copy(src_img, image_file)
             print(f"Copied image to {image_file}")
         else:
              print("Provided image not found, generating thumbnail.")
@@ -525,8 +528,10 @@ def main():
         category_label=cat_label,
         body_content=body_html
     )
-    
-    (target_dir / f"{slug}.html").write_text(html_content, encoding='utf-8')
+    # 1200x675 の決め打ちを、クロップ後の実寸（本文画像・og:image）に合わせる
+    html_content, _ = image_dims.fix_html(html_content, (target_dir / f"{slug}.html").relative_to(PROJECT_ROOT).as_posix(),
+                                          PROJECT_ROOT)
+    OUT.write_text(target_dir / f"{slug}.html", html_content)
     print(f"Generated HTML: {target_dir / f'{slug}.html'}")
 
     update_sitemap(slug, title, image_name)
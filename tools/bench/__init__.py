@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+"""サイト生成ツールのベンチマーク群。合成コーパスは corpus.py、各ベンチは bench_*.py。
+実行は tools/ から `python3 -m bench.bench_blog_meta` のように。"""
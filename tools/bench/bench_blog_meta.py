@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""blog_meta（head だけ読む1パス抽出）と、従来の collect() 正規表現4本の比較ベンチ。
+  python3 -m bench.bench_blog_meta --n 5000
+結果が一致しない記事があれば件数を出す。"""
+import re, sys, time, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import blog_meta
+from bench import corpus
+
+def legacy(p):
+    """旧 build_blog_index.collect() の抽出部分そのまま（比較用に凍結）。"""
+    h = p.read_text(encoding="utf-8", errors="ignore")
+    t = re.search(r"<title>(.*?)</title>", h, re.S)
+    title = re.sub(r"\s+", " ", t.group(1)).strip() if t else ""
+    c = (re.search(r'article:section"\s+content="(.*?)"', h) or
+         re.search(r'class="article-category">(.*?)<', h) or
+         re.search(r'class="blog-tag">(.*?)<', h))
+    d = re.search(r'article:published_time"\s+content="(.*?)"', h)
+    return title, c.group(1).strip() if c else "", d.group(1).strip() if d else "", len(h.encode())
+
+def streaming(p):
+    m = blog_meta.extract(p)
+    return m["title"], m["section"] or m["category"], m["published_time"], m["bytes_read"]
+
+def run(fn, files):
+    t0 = time.perf_counter()
+    out = [fn(p) for p in files]
+    return time.perf_counter() - t0, out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=5000, help="合成記事数")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    tmp = corpus.tempdir()
+    try:
+        blog = corpus.make_blog(tmp, args.n)
+        files = sorted(blog.glob("**/*.html"))
+        best = {}
+        for name, fn in (("legacy-regex", legacy), ("blog_meta", streaming)):
+            best[name] = min(run(fn, files) for _ in range(args.repeat))
+        (tl, ol), (ts, om) = best["legacy-regex"], best["blog_meta"]
+        diff = sum(a[:3] != b[:3] for a, b in zip(ol, om))
+        read_l = sum(x[3] for x in ol); read_s = sum(x[3] for x in om)
+        print(f"articles: {len(files)}")
+        print(f"  legacy-regex: {tl*1000:8.1f}ms  {tl/len(files)*1e6:7.1f}us/article  read {read_l/1048576:.1f}MB")
+        print(f"  blog_meta   : {ts*1000:8.1f}ms  {ts/len(files)*1e6:7.1f}us/article  read {read_s/1048576:.1f}MB")
+        print(f"  speedup x{tl/ts:.2f} / 不一致 {diff}件")
+        return 0 if not diff else 1
+    finally:
+        corpus.cleanup(tmp)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""build_blog_index.collect() の並列スキャン（--jobs）のスケーリング計測。
+  python3 -m bench.bench_blog_scan --n 10000
+コールドキャッシュ相当（use_cache=False）で jobs=1,2,4,…,CPU数 を測り、render() 出力が直列と一致するかも確認する。"""
+import os, sys, time, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import build_blog_index as bbi
+from bench import corpus
+
+def job_counts(limit):
+    n, out = 1, []
+    while n < limit:
+        out.append(n); n *= 2
+    return out + [limit]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=10000, help="合成記事数")
+    ap.add_argument("--max-jobs", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+    tmp = corpus.tempdir()
+    try:
+        blog = corpus.make_blog(tmp, args.n)
+        ref = None; base = None; bad = 0
+        print(f"articles: {args.n} / cpu: {os.cpu_count()}")
+        for j in job_counts(args.max_jobs):
+            t0 = time.perf_counter()
+            html = bbi.render(bbi.collect(use_cache=False, jobs=j, blog=blog))
+            dt = time.perf_counter() - t0
+            ref = ref or html; base = base or dt
+            same = html == ref
+            bad += not same
+            print(f"  jobs={j:<3d} {dt*1000:8.0f}ms  x{base/dt:5.2f}  {'identical' if same else 'DIFFERENT'}")
+        return 0 if not bad else 1
+    finally:
+        corpus.cleanup(tmp)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""カテゴリ判定のベンチ：旧 detect()（全キーワードを in で総当たり）と、keyword_classifier を使う現行の detect()。
+  python3 -m bench.bench_classifier --n 100000
+実記事のタイトル・カテゴリ・パスをシャッフルして組み合わせた n 件で測り、判定結果の一致も確認する。"""
+import sys, time, random, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import build_blog_index as bbi
+
+def legacy_detect(title, cat, path):
+    """旧 build_blog_index.detect()（比較用に凍結）。"""
+    hay = f"{title} {path}".lower()
+    src = f"{cat} {hay}".lower()
+    for name, kws in bbi.BUCKETS:
+        for kw in kws:
+            if kw in src:
+                return name
+    return bbi.DEFAULT_BUCKET
+
+def samples(n, seed=0):
+    rnd = random.Random(seed)
+    arts = bbi.collect(use_cache=False)
+    metas = [bbi.parse(bbi.BLOG / a["rel"], bbi.blog_meta.extract(bbi.BLOG / a["rel"])) for a in arts]
+    titles = [m["title"] for m in metas] + ["日々の家計メモ", "老後に向けた住まいの話"]
+    cats = [m["cat"] for m in metas] + [""]
+    rels = [a["rel"] for a in arts] + ["2026/misc/misc.html"]
+    return [(rnd.choice(titles), rnd.choice(cats), rnd.choice(rels)) for _ in range(n)]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=100000)
+    args = ap.parse_args()
+    xs = samples(args.n)
+    res = {}
+    for name, fn in (("legacy-detect", legacy_detect), ("compiled", bbi.detect)):
+        t0 = time.perf_counter()
+        res[name] = [fn(*x) for x in xs]
+        dt = time.perf_counter() - t0
+        print(f"  {name:14s} {dt*1000:8.1f}ms  {dt/len(xs)*1e6:6.2f}us/title")
+    diff = sum(a != b for a, b in zip(res["legacy-detect"], res["compiled"]))
+    print(f"titles: {len(xs)} / 不一致 {diff}件")
+    return 0 if not diff else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""全文検索インデックスのサイズとクエリ遅延のベンチ。
+  python3 -m bench.bench_search --n 1000
+合成ブログから build_search_index.build() でインデックスを作り、代表クエリを
+コールド（必要なシャードをディスクから読む）／ウォーム（シャード読み込み済み）で測る。"""
+import sys, json, time, argparse, statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import build_search_index as bsi
+from bench import corpus
+
+QUERIES = ["新NISA", "オルカン 取り崩し", "債券 50代", "インフレ対策", "S&P500 FANG+", "年金 繰り下げ",
+           "ゴールド", "生活防衛資金", "SBI証券 定期売却", "暴落 売らない"]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=1000, help="合成記事数")
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+    tmp = corpus.tempdir()
+    try:
+        blog = corpus.make_blog(tmp, args.n)
+        t0 = time.perf_counter()
+        files, _ = bsi.build(blog=blog, use_cache=False)
+        t_build = time.perf_counter() - t0
+        out = tmp / "search"
+        for name, text in files.items():
+            (out / name).parent.mkdir(parents=True, exist_ok=True)
+            (out / name).write_text(text, encoding="utf-8")
+        docs = json.loads(files["docs.json"])
+        total = sum(len(t.encode()) for t in files.values())
+        shard_kb = [len(t.encode()) / 1024 for n, t in files.items() if n.startswith("shards/")]
+        print(f"docs: {len(docs)} / build {t_build*1000:.0f}ms / index {total/1024:.0f}KB "
+              f"(shard avg {statistics.mean(shard_kb):.1f}KB, max {max(shard_kb):.1f}KB)")
+        disk = bsi.disk_loader(out)
+        warm = {i: disk(i) for i in range(bsi.SHARDS)}
+        for q in QUERIES:
+            need = {bsi.shard_of(g) for g in bsi.bigrams(bsi.normalize(q))}
+            fetch_kb = sum(shard_kb[i] for i in need)
+            cold, hot = [], []
+            for _ in range(args.repeat):
+                t = time.perf_counter(); rows = bsi.search(q, disk, docs); cold.append(time.perf_counter() - t)
+                t = time.perf_counter(); bsi.search(q, warm.__getitem__, docs); hot.append(time.perf_counter() - t)
+            print(f"  {q:16s} hits {len(rows):2d}  shards {len(need):2d} ({fetch_kb:6.1f}KB)  "
+                  f"cold {statistics.median(cold)*1000:6.2f}ms  warm {statistics.median(hot)*1000:6.2f}ms")
+        return 0
+    finally:
+        corpus.cleanup(tmp)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""記事ページ組み立ての比較ベンチ: 旧 page()（入れ子の f-string・フィールドごとに何度も esc）と
+page_template のコンパイル済み SKELETON。
+  python3 -m bench.bench_templates --n 2000
+content/articles/ の実記事を1回だけ parse し、両方で n 回ずつ描画して1ページあたりの時間を出す。
+準備コスト（旧: 参考記事の正規表現抽出、新: コンパイル／.cache からの読み込み）も別に測る。出力が1バイトでも違えば終了コード 1。"""
+import re, sys, time, tempfile, argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import article_engine as ae
+import page_template
+import shared_css
+from page_template import esc
+
+PROFILE_URL = "/assets/shared/blog_profile_ryo.0123456789.jpg"
+
+# ---- 旧 article_engine の head()/page() そのまま（比較用に凍結）
+def legacy_extract(tpl_text):
+    # 参考記事が shared_css で書き換え済みでも元の <style> を使う
+    return (shared_css.full_style(tpl_text, ae.ROOT),
+            re.search(r'(<a class="youtube-channel-banner".*?</a>)', tpl_text, re.S).group(1))
+
+def legacy_head(a, jl, style):
+    title, desc = esc(a["title"]), esc(a["description"])
+    return f"""<!DOCTYPE html>
+<html lang="ja">
+<head>
+{ae.GA}
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>{title}</title>
+  <meta name="description" content="{desc}">
+  <meta name="keywords" content="{esc(a["keywords"])}">
+  <link rel="canonical" href="{a["url"]}">
+  <meta property="og:type" content="article">
+  <meta property="og:url" content="{a["url"]}">
+  <meta property="og:title" content="{title}">
+  <meta property="og:description" content="{desc}">
+  <meta property="og:image" content="{a["image"]}">
+  <meta property="og:image:width" content="1200">
+  <meta property="og:image:height" content="675">
+  <meta property="og:image:alt" content="{title}">
+  <meta property="og:site_name" content="未来投資navi">
+  <meta property="article:published_time" content="{a["date"]}">
+  <meta property="article:author" content="りょう">
+  <meta property="article:section" content="{esc(a["section"])}">
+  <meta name="twitter:card" content="summary_large_image">
+  <meta name="twitter:site" content="@investment_navi">
+  <meta name="twitter:creator" content="@investment_navi">
+  <meta name="twitter:title" content="{title}">
+  <meta name="twitter:description" content="{desc}">
+  <meta name="twitter:image" content="{a["image"]}">
+  <meta name="twitter:image:alt" content="{title}">
+{jl}
+{style}
+</head>"""
+
+def legacy_jl_article(a):
+    return f"""  <script type="application/ld+json">
+  {{ "@context":"https://schema.org","@type":"Article","headline":"{esc(a["title"])}","description":"{esc(a["description"])}","image":"{a["image"]}","author":{{"@type":"Person","name":"りょう"}},"publisher":{{"@type":"Organization","name":"未来投資navi","logo":{{"@type":"ImageObject","url":"{ae.BASE}/images/logo.png"}}}},"datePublished":"{a["date"]}","dateModified":"{a.get("modified", a["date"])}","mainEntityOfPage":{{"@type":"WebPage","@id":"{a["url"]}"}} }}
+  </script>"""
+
+def legacy_jl_bc(a):
+    return f"""  <script type="application/ld+json">
+  {{ "@context":"https://schema.org","@type":"BreadcrumbList","itemListElement":[{{"@type":"ListItem","position":1,"name":"ホーム","item":"{ae.BASE}/"}},{{"@type":"ListItem","position":2,"name":"ブログ","item":"{ae.BASE}/blog/"}},{{"@type":"ListItem","position":3,"name":"{esc(a["title"])}","item":"{a["url"]}"}}] }}
+  </script>"""
+
+def legacy_cta_box():
+    return f"""      <div class="cta-box">
+        <h3>{ae.CTA_H}</h3>
+        <p>{ae.CTA_B}</p>
+        <a href="{ae.LINE}" target="_blank" rel="noopener noreferrer" class="cta-button">公式LINEで無料相談する</a>
+      </div>"""
+
+def legacy_author(profile_url):
+    return f"""    <div class="author-box">
+      <img class="author-photo" src="{profile_url}" alt="りょう｜未来投資navi" width="72" height="72">
+      <div class="author-info">
+        <h4>りょう｜未来投資navi</h4>
+        <p>FP資格保有の現役投資家。自己資産4,000万円・<strong>運用益1,000万円以上</strong>の実績をもとに、50〜60代の投資初心者に向けた「守りながら増やす」資産設計を提案。YouTubeチャンネル「未来投資navi」で発信中。</p>
+      </div>
+    </div>"""
+
+def legacy_page(a, style, banner, profile_url):
+    jl = [legacy_jl_article(a), legacy_jl_bc(a)] + ([ae.jl_faq(a["faq"]).lstrip("\n")] if a["faq"] else [])
+    toc = "\n".join(f'        <li><a href="#{i}">{esc(t)}</a></li>' for i, t in a["toc"])
+    y, m, d = (int(x) for x in a["date"].split("-"))
+    return f"""{legacy_head(a, chr(10).join(jl), style)}
+<body>
+  <div class="container">
+    <div class="hero-image">
+      <img src="./{a["hero"]}" alt="{esc(a["title"])}" width="1280" height="720">
+    </div>
+    <header class="article-header">
+      <span class="article-category">{a["category"]}</span>
+      <h1 class="article-title">{esc(a["title"])}</h1>
+      <div class="article-meta"><span>未来投資navi 編集部</span><span>{y}年{m}月{d}日</span><span>約{a["charcount"]}字</span></div>
+    </header>
+    <div class="lead">{a["lead"]}</div>
+
+{banner}
+
+    <nav class="toc"><div class="toc-title">この記事の目次</div><ol>
+{toc}
+    </ol></nav>
+    <article>
+{a["body"]}
+
+{legacy_cta_box()}
+    </article>
+{legacy_author(profile_url)}
+    <div class="seo-note">採用キーワード: {esc(a["seo_note"])}</div>
+  </div>
+</body>
+</html>
+"""
+
+def best(fn, repeat):
+    out = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        out.append(time.perf_counter() - t0)
+    return min(out)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=2000, help="記事ごとの描画回数")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    tpl_raw = ae.TPL.read_bytes()
+    tpl_text = tpl_raw.decode("utf-8")
+    arts = [ae.parse(p) for p in ae.sources()]
+    style, banner = legacy_extract(tpl_text)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Path(tmp) / "page_template.json"
+        load = lambda: page_template.load(ae.SKELETON, ae.sha1(tpl_raw), lambda: ae.template_consts(tpl_raw), cache)
+        def cold():
+            cache.unlink(missing_ok=True)
+            return load()
+        t_compile = best(cold, args.repeat)
+        t_load = best(load, args.repeat)
+        tpl, hit = load()
+    t_extract = best(lambda: legacy_extract(tpl_text), args.repeat)
+    ctx = {"page": tpl, "profile_url": PROFILE_URL}
+    diff = sum(legacy_page(a, style, banner, PROFILE_URL) != ae.page(a, ctx) for a in arts)
+    pages = len(arts) * args.n
+    def old():
+        for a in arts:
+            for _ in range(args.n):
+                legacy_page(a, style, banner, PROFILE_URL)
+    def new():
+        for a in arts:
+            for _ in range(args.n):
+                ae.page(a, ctx)
+    t_old = best(old, args.repeat)
+    t_new = best(new, args.repeat)
+    size = sum(len(ae.page(a, ctx)) for a in arts) // len(arts)
+    print(f"articles: {len(arts)} x {args.n} renders / avg {size/1024:.0f}K chars / {len(tpl.parts)} chunks, {len(tpl.slots)} slots")
+    print(f"  setup  legacy regex extract {t_extract*1000:7.2f}ms | compile {t_compile*1000:7.2f}ms | cached load {t_load*1000:7.2f}ms (hit={hit})")
+    print(f"  legacy page()   : {t_old/pages*1e6:7.1f}us/page")
+    print(f"  compiled render : {t_new/pages*1e6:7.1f}us/page")
+    print(f"  speedup x{t_old/t_new:.2f} / 不一致 {diff}件")
+    return 0 if not diff else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
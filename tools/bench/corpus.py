@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""ベンチ用の合成ブログツリーを作る。実記事HTMLをひな形に、タイトルとパスだけ変えて n 本複製する。
+make_site() はさらにヒーロー画像・プロフィール画像・sitemap.xml・記事エンジン用のテンプレ・記事ソースと
+tools/ のコピーまで置いた「ミニリポジトリ」を作る（ツールを丸ごとサブプロセスで走らせる用）。"""
+import io, re, random, shutil, tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+BLOG = ROOT / "blog"
+TOOLS = ROOT / "tools"
+PROFILE_NAME = "blog_profile_ryo.jpg"
+# 記事エンジン（article_engine.py）が読むテンプレ記事と記事ソース
+BUILDER_TPL = "blog/2026/index-vs-individual-stock"
+ARTICLE_SRC = "content/articles"
+HARDCODED_ROOT_RE = re.compile(r'^ROOT = Path\("[^"]*"\)$', re.M)
+PARA_RE = re.compile(rb"<p>[^<]{40,}</p>")
+HERO_RE = re.compile(rb'<img\b[^>]*\bsrc="\./([^"/]+\.webp)"')
+
+def templates():
+    """実記事（index.html 以外）の中身一覧。"""
+    return [p.read_bytes() for p in sorted(BLOG.glob("**/*.html")) if p.name != "index.html"]
+
+def paragraphs(tpls):
+    """水増し用の本文段落（実記事の <p> から）。"""
+    return sorted({m.group(0) for raw in tpls for m in PARA_RE.finditer(raw)})
+
+def pad(raw, size, paras, rnd):
+    """本文末尾（</article> か </body> の手前）に実記事の段落を足して size バイト前後にする。"""
+    if len(raw) >= size or not paras:
+        return raw
+    fill = []
+    n = len(raw)
+    while n < size:
+        p = rnd.choice(paras)
+        fill.append(p)
+        n += len(p) + 1
+    at = raw.rfind(b"</article>")
+    at = at if at >= 0 else raw.rfind(b"</body>")
+    at = at if at >= 0 else len(raw)
+    return raw[:at] + b"\n".join(fill) + b"\n" + raw[at:]
+
+def image_pool():
+    """実在のヒーロー WebP 全部とプロフィール JPEG のバイト列。"""
+    heroes = [p.read_bytes() for p in sorted(BLOG.glob("**/*.webp"))]
+    profile = next(BLOG.glob(f"**/{PROFILE_NAME}")).read_bytes()
+    return heroes, profile
+
+def raw_photo(webp):
+    """WebP をデコードして大きめの PNG に戻す（optimize_blog_images の変換対象になる 256KB 超の写真）。"""
+    from PIL import Image
+    with Image.open(io.BytesIO(webp)) as im:
+        im = im.convert("RGB")
+        w, h = im.size
+        im = im.resize((w * 2, h * 2))  # 元写真は最大幅 1280 超のことが多い
+        buf = io.BytesIO()
+        im.save(buf, "PNG", compress_level=1)
+    return buf.getvalue()
+
+def make_blog(dest, n, seed=0, html_kb=None, images=False, photo_ratio=0.0):
+    """dest/blog/YYYY/slug/slug.html を n 本作り、dest/blog を返す。
+    html_kb を渡すと本文を水増しして記事1本をそのサイズにそろえる。
+    images=True なら記事ごとにヒーロー WebP とプロフィール JPEG も置き、
+    photo_ratio の割合で未変換の写真 PNG（256KB 超）も置く。"""
+    rnd = random.Random(seed)
+    tpls = templates()
+    paras = paragraphs(tpls) if html_kb else []
+    heroes, profile = image_pool() if images else ([], b"")
+    photos = {}
+    blog = Path(dest) / "blog"
+    for i in range(n):
+        raw = tpls[i % len(tpls)]
+        slug = f"synthetic-{i:06d}"
+        year = 2025 + rnd.randrange(2)
+        raw = re.sub(rb"<title>", f"<title>[{i}] ".encode(), raw, count=1)
+        if html_kb:
+            raw = pad(raw, html_kb * 1024, paras, rnd)
+        d = blog / str(year) / slug
+        d.mkdir(parents=True, exist_ok=True)
+        (d / f"{slug}.html").write_bytes(raw)
+        if images:
+            k = i % len(heroes)
+            hero = HERO_RE.search(raw)  # ひな形記事が参照しているヒーロー名で置く（<img> から辿れるように）
+            name = hero.group(1).decode() if hero else f"blog_{slug.replace('-', '_')}_header.webp"
+            (d / name).write_bytes(heroes[k])
+            (d / PROFILE_NAME).write_bytes(profile)
+            if rnd.random() < photo_ratio:
+                if k not in photos:
+                    photos[k] = raw_photo(heroes[k])
+                (d / f"{slug}-photo.png").write_bytes(photos[k])
+    return blog
+
+def stage_tools(dest):
+    """tools/*.py を dest/tools にコピーし、ハードコードされた ROOT を dest に向ける。"""
+    out = Path(dest) / "tools"
+    out.mkdir(parents=True, exist_ok=True)
+    for p in TOOLS.glob("*.py"):
+        src = p.read_text(encoding="utf-8")
+        src = HARDCODED_ROOT_RE.sub("ROOT = Path(__file__).resolve().parent.parent", src)
+        (out / p.name).write_text(src, encoding="utf-8")
+    return out
+
+def make_site(dest, n, seed=0, html_kb=60, photo_ratio=0.1):
+    """ツールをそのまま走らせられる合成サイト一式を dest に作る。戻り値: dest/tools"""
+    dest = Path(dest)
+    make_blog(dest, n, seed=seed, html_kb=html_kb, images=True, photo_ratio=photo_ratio)
+    tpl = dest / BUILDER_TPL
+    shutil.copytree(ROOT / BUILDER_TPL, tpl, dirs_exist_ok=True)
+    shutil.copytree(ROOT / ARTICLE_SRC, dest / ARTICLE_SRC, dirs_exist_ok=True)
+    shutil.copy(ROOT / "sitemap.xml", dest / "sitemap.xml")
+    return stage_tools(dest)
+
+def tree_bytes(root):
+    return sum(p.stat().st_size for p in Path(root).rglob("*") if p.is_file())
+
+def tempdir():
+    return Path(tempfile.mkdtemp(prefix="mtn-bench-"))
+
+def cleanup(d):
+    shutil.rmtree(d, ignore_errors=True)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""サイト生成ツール一式を合成サイトで走らせ、実時間・CPU時間・ピークRSS を JSON に残すベンチスイート。
+  python3 -m bench.suite --scale 1 10 [--out results.json] [--compare old.json]
+--scale は今の記事数に対する倍率。倍率ごとに corpus.make_site() で
+ミニリポジトリ（60KB 前後の記事HTML・ヒーロー WebP・プロフィール JPEG・一部未変換の写真 PNG）を作り、
+各ツールをサブプロセスで実行して os.wait4 の rusage で測る（--jobs の子プロセスぶんも CPU 時間に入る）。
+結果の既定の置き場所は .cache/bench/<コミット>.json。--compare で別コミットの結果と比べる。"""
+import os, sys, json, time, argparse, platform, subprocess, tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from bench import corpus
+
+RESULT_VERSION = 1
+OUT_DIR = corpus.ROOT / ".cache" / "bench"
+# (名前, コマンド, --jobs を渡せるか, 計測前に1回空走りするか)。
+# warm はキャッシュを作る1回目を捨てて2回目を測る。optimize_blog_images は画像を書き換えるので最後に置く。
+TOOLS = [
+    ("build_blog_index (cold)", ["build_blog_index.py", "--no-cache"], True, False),
+    ("build_blog_index (warm)", ["build_blog_index.py"], True, True),
+    ("build_search_index (cold)", ["build_search_index.py", "--no-cache"], True, False),
+    ("build_search_index (warm)", ["build_search_index.py"], True, True),
+    ("check_links (cold)", ["check_links.py", "--no-cache"], True, False),
+    ("check_links (warm)", ["check_links.py"], True, True),
+    ("article_engine (cold)", ["article_engine.py", "--force"], True, False),
+    ("article_engine (warm)", ["article_engine.py"], True, True),
+    ("dedup_assets", ["dedup_assets.py"], False, False),
+    ("dedup_assets (rerun)", ["dedup_assets.py"], False, False),
+    ("shared_css", ["shared_css.py"], False, False),
+    ("html_minify", ["html_minify.py"], False, False),
+    ("optimize_blog_images", ["optimize_blog_images.py"], True, False),
+    ("optimize_blog_images (rerun)", ["optimize_blog_images.py"], True, False),
+]
+
+# 計測用の小さなランチャー。ベンチ本体（合成コーパス生成で大きくなったプロセス）から直接 fork すると、
+# Linux では fork 時点の親の RSS が子の ru_maxrss に乗ってしまうので、素の python を1段挟んで測る。
+LAUNCHER = """import os, sys, json, time, subprocess
+t0 = time.perf_counter()
+p = subprocess.Popen(sys.argv[1:], stdout=subprocess.DEVNULL)
+_, status, ru = os.wait4(p.pid, 0)
+print(json.dumps([time.perf_counter() - t0, ru.ru_utime + ru.ru_stime, ru.ru_maxrss, os.waitstatus_to_exitcode(status)]))
+"""
+
+def measure(argv, cwd):
+    """戻り値: {wall_s, cpu_s, max_rss_mb, rc, stderr}。ピークRSS は子（と待ち合わせた孫）の最大値。"""
+    with tempfile.TemporaryFile() as err:
+        out = subprocess.run([sys.executable, "-c", LAUNCHER] + argv, cwd=cwd, stdout=subprocess.PIPE, stderr=err)
+        wall, cpu, rss, rc = json.loads(out.stdout)
+        err.seek(0)
+        tail = err.read().decode("utf-8", errors="replace").strip().splitlines()[-3:]
+    rss_kb = rss if sys.platform != "darwin" else rss / 1024  # macOS はバイト単位
+    return {"wall_s": round(wall, 4), "cpu_s": round(cpu, 4), "max_rss_mb": round(rss_kb / 1024, 1),
+            "rc": rc, "stderr": tail if rc else []}
+
+def run_scale(n, jobs, seed):
+    tmp = corpus.tempdir()
+    try:
+        t0 = time.perf_counter()
+        tools = corpus.make_site(tmp, n, seed=seed)
+        gen = time.perf_counter() - t0
+        size = corpus.tree_bytes(tmp / "blog")
+        print(f"\n== {n} articles ({size/1048576:.0f}MB, generated in {gen:.1f}s) ==")
+        rows = []
+        for name, cmd, has_jobs, prime in TOOLS:
+            argv = [sys.executable, str(tools / cmd[0])] + cmd[1:] + (["--jobs", str(jobs)] if has_jobs and jobs > 1 else [])
+            if prime:
+                measure(argv, tmp)
+            r = measure(argv, tmp)
+            r["tool"] = name
+            rows.append(r)
+            print(f"  {name:<30s} wall {r['wall_s']:8.2f}s  cpu {r['cpu_s']:8.2f}s  rss {r['max_rss_mb']:7.1f}MB"
+                  + (f"  rc={r['rc']}" if r["rc"] else ""))
+            for line in r["stderr"]:
+                print(f"      {line}")
+        return {"articles": n, "corpus_bytes": size, "results": rows}
+    finally:
+        corpus.cleanup(tmp)
+
+def commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=corpus.ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def compare(old, new):
+    """同じ記事数・同じツールの行どうしで比を出す（<1 なら速く／小さくなった）。"""
+    prev = {(s["articles"], r["tool"]): r for s in old["scales"] for r in s["results"]}
+    print(f"\n== vs {old['commit']} ==")
+    for s in new["scales"]:
+        for r in s["results"]:
+            o = prev.get((s["articles"], r["tool"]))
+            if not o:
+                continue
+            ratio = lambda k: r[k] / o[k] if o[k] else float("nan")
+            print(f"  {s['articles']:>6d} {r['tool']:<30s} wall x{ratio('wall_s'):5.2f}  "
+                  f"cpu x{ratio('cpu_s'):5.2f}  rss x{ratio('max_rss_mb'):5.2f}")
+
+def main():
+    ap = argparse.ArgumentParser(description="合成サイトでツール一式の時間・メモリを測る")
+    ap.add_argument("--scale", type=float, nargs="+", default=[1, 10], help="今の記事数に対する倍率（複数可）")
+    ap.add_argument("--jobs", type=int, default=1, help="--jobs 対応ツールに渡す並列数")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", help="結果 JSON の書き出し先（既定 .cache/bench/<コミット>.json）")
+    ap.add_argument("--compare", metavar="JSON", help="比較対象の過去の結果")
+    args = ap.parse_args()
+    base = len(corpus.templates())
+    rev = commit()
+    result = {"version": RESULT_VERSION, "commit": rev, "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "python": platform.python_version(), "platform": platform.platform(), "cpu": os.cpu_count(),
+              "jobs": args.jobs, "seed": args.seed, "scales": []}
+    for s in args.scale:
+        result["scales"].append(run_scale(max(1, round(base * s)), args.jobs, args.seed))
+    out = Path(args.out) if args.out else OUT_DIR / f"{rev}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, ensure_ascii=False, indent=1), encoding="utf-8")
+    print(f"\nresults: {out}")
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text(encoding="utf-8")), result)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
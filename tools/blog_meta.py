@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""記事HTMLのメタ情報を <head> だけ読んで抜く共通エクストラクタ。
+- ファイルは CHUNK バイトずつ読み、</head> が見えた時点で読むのをやめる
+- article:section が head に無い記事だけ、本文の最初の article-category / blog-tag まで読み進める
+- title / article:section / article:published_time / canonical / og:image を1回のトークナイズで拾う
+値は従来の正規表現と同じく「生のまま」（実体参照のデコードはしない）。
+"""
+import io, re
+
+CHUNK = 8192
+HEAD_END = b"</head>"
+MARKERS = (b'class="article-category">', b'class="blog-tag">')
+
+TOKEN = re.compile(r"<title>(?P<title>.*?)</title>|<(?:meta|link)\b(?P<attrs>[^>]*)>", re.S | re.I)
+ATTR = re.compile(r'([\w:-]+)\s*=\s*"([^"]*)"')
+WS = re.compile(r"\s+")
+
+FIELDS = ("title", "section", "published_time", "canonical", "og_image")
+
+def _read_until(fp, buf, needles, start):
+    """buf[start:] 以降にいずれかの needle が出るまで読み足す。戻り値: (buf, 位置, needle)。見つからなければ位置=-1。"""
+    keep = max(len(n) for n in needles) - 1
+    while True:
+        hits = [(i, n) for n in needles if (i := buf.find(n, start)) >= 0]
+        if hits:
+            i, n = min(hits)
+            return buf, i, n
+        chunk = fp.read(CHUNK)
+        if not chunk:
+            return buf, -1, None
+        start = max(start, len(buf) - keep)
+        buf += chunk
+
+def tokenize_head(head):
+    """<head> 部分の文字列から FIELDS を1パスで拾う。"""
+    meta = dict.fromkeys(FIELDS, "")
+    for m in TOKEN.finditer(head):
+        if m.group("title") is not None:
+            if not meta["title"]:
+                meta["title"] = WS.sub(" ", m.group("title")).strip()
+            continue
+        a = dict((k.lower(), v) for k, v in ATTR.findall(m.group("attrs")))
+        key = a.get("property") or a.get("name") or ""
+        if key == "article:section" and not meta["section"]:
+            meta["section"] = a.get("content", "").strip()
+        elif key == "article:published_time" and not meta["published_time"]:
+            meta["published_time"] = a.get("content", "").strip()
+        elif key == "og:image" and not meta["og_image"]:
+            meta["og_image"] = a.get("content", "").strip()
+        elif a.get("rel") == "canonical" and not meta["canonical"]:
+            meta["canonical"] = a.get("href", "").strip()
+    return meta
+
+def extract_stream(fp):
+    """バイナリストリームからメタを抜く。戻り値の dict には category（本文マーカー）と bytes_read も入る。"""
+    buf, end, _ = _read_until(fp, b"", (HEAD_END,), 0)
+    head = buf if end < 0 else buf[:end]
+    meta = tokenize_head(head.decode("utf-8", errors="ignore"))
+    meta["category"] = ""
+    if not meta["section"] and end >= 0:
+        buf, i, n = _read_until(fp, buf, MARKERS, end)
+        if i >= 0:
+            buf, j, _ = _read_until(fp, buf, (b"<",), i + len(n))
+            text = buf[i + len(n):j if j >= 0 else len(buf)]
+            meta["category"] = text.decode("utf-8", errors="ignore").strip()
+    meta["bytes_read"] = len(buf)
+    return meta
+
+def extract(path):
+    with open(path, "rb") as fp:
+        return extract_stream(fp)
+
+def extract_bytes(raw):
+    return extract_stream(io.BytesIO(raw))
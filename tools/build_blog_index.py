@@ -1,7 +1,15 @@
 #!/usr/bin/env python3
-# ブログ一覧ハブ blog/index.html を、実在する記事ファイルから機械生成する。
-# リンクは実ファイルパスから作るので原理的にリンク切れが出ない。生成後に存在検証も行う。
-import re, pathlib, sys, html as _html
+# ブログ一覧ハブ blog/index.html・カテゴリ別ページ blog/category/<slug>/・一覧データ blog/index.json を、
+# 実在する記事ファイルから機械生成する。リンクは実ファイルパスから作るので原理的にリンク切れが出ない。生成後に存在検証も行う。
+# --watch で blog/ を監視（inotify、使えなければポーリング）し、保存された記事だけ読み直して一覧と sitemap.xml を更新し続ける。
+# 書き出す HTML は shared_css で <style> を共有 CSS に出し、html_minify で空白・コメントを詰める（一括パスと同じ規則）。
+import re, json, argparse, time, datetime, pathlib, sys, html as _html
+from concurrent.futures import ProcessPoolExecutor
+import blog_meta, file_cache
+from keyword_classifier import compile_classifier
+from site_writer import SiteWriter
+from html_minify import minify
+import shared_css
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 BLOG = ROOT / "blog"
@@ -20,81 +28,229 @@ BUCKETS = [
 ]
 DEFAULT_BUCKET = "資産運用"
 ORDER = [b[0] for b in BUCKETS] + [DEFAULT_BUCKET]
+# カテゴリ別ページ blog/category/<slug>/ の URL 用スラッグ
+SLUGS = {
+    "新NISA": "nisa", "米国株・指数": "us-stocks", "投資信託・オルカン": "funds", "債券・資産防衛": "bonds",
+    "ゴールド・コモディティ": "commodities", "地域・新興国株": "regions", "年金・ライフプラン": "pension",
+    "証券口座・制度": "brokerage", DEFAULT_BUCKET: "general",
+}
+CATEGORY_DIR = "category"       # blog/category/ 以下は生成物なので記事として拾わない
+MANIFEST = "index.json"         # ハブの「もっと見る」が遅延読み込みする一覧データ
+MANIFEST_VERSION = 1
+TOP_PER_BUCKET = 5              # トップの blog/index.html に出す各カテゴリの件数
+PAGE_SIZE = 20                  # カテゴリ別ページ1枚あたりの件数
+
+_classify = compile_classifier(BUCKETS, DEFAULT_BUCKET)
 
 def detect(title, cat, path):
-    hay = f"{title} {path}".lower()
     # 明示カテゴリを優先的にバケットへ寄せる
-    src = f"{cat} {hay}".lower()
-    for name, kws in BUCKETS:
-        for kw in kws:
-            if kw in src:
-                return name
-    return DEFAULT_BUCKET
-
-def collect():
+    return _classify(f"{cat} {title} {path}".lower())
+
+# 記事メタの永続キャッシュ（file_cache）。rel -> {mtime, size, sha1, data=parse() の結果}。
+CACHE = ROOT / ".cache" / "blog_index.json"
+CACHE_VERSION = 3
+
+def parse(p, meta):
+    """blog_meta の抽出結果から表示タイトル・カテゴリ・日付を作る（バケット判定前の生メタ）。"""
+    raw = meta["title"]
+    title = raw.split("｜")[0].split("|")[0].split("【")[0].strip() if raw else ""
+    title = title or p.stem
+    # 元タイトル（装飾含む）も表示用に保持
+    disp = raw.split("｜")[0].split("|")[0].strip() if raw else p.stem
+    return {"title": title, "disp": disp, "cat": meta["section"] or meta["category"],
+            "date": meta["published_time"][:10], "canonical": meta["canonical"], "og_image": meta["og_image"]}
+
+def scan_bytes(p, raw):
+    """キャッシュミス時の解析（file_cache.refresh から、プロセスプール経由でも呼ばれる）。"""
+    return parse(p, blog_meta.extract_bytes(raw))
+
+def scan_head(p):
+    """キャッシュ無しなら全体を読む必要もない（head だけストリームで読む）。"""
+    return parse(p, blog_meta.extract(p))
+
+def collect(use_cache=True, stats=None, jobs=1, blog=BLOG, cache_path=CACHE):
+    paths = [p for p in sorted(blog.glob("**/*.html"))
+             if p.name != "index.html" and p.relative_to(blog).parts[0] != CATEGORY_DIR]
+    items = [(p.relative_to(blog).as_posix(), p) for p in paths]
+    if use_cache:
+        cache = file_cache.load(cache_path, CACHE_VERSION)
+        fresh, st = file_cache.refresh(items, cache, scan_bytes, jobs=jobs)
+        metas = {rel: ent["data"] for rel, ent in fresh.items()}
+        # 消えた記事は fresh に載らない＝キャッシュからも落ちる
+        if fresh != cache:
+            file_cache.save(cache_path, CACHE_VERSION, fresh)
+    else:
+        if jobs > 1 and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as ex:
+                res = list(ex.map(scan_head, paths, chunksize=max(1, len(paths) // (jobs * 8))))
+        else:
+            res = [scan_head(p) for p in paths]
+        metas = {rel: m for (rel, _), m in zip(items, res)}
+        st = {"hit": 0, "parsed": len(paths), "dropped": 0}
     arts = []
-    for p in sorted(BLOG.glob("**/*.html")):
-        if p.name == "index.html":
-            continue
-        h = p.read_text(encoding="utf-8", errors="ignore")
-        t = re.search(r"<title>(.*?)</title>", h, re.S)
-        title = re.sub(r"\s+", " ", t.group(1)).strip() if t else p.stem
-        title = title.split("｜")[0].split("|")[0].split("【")[0].strip() or p.stem
-        # 元タイトル（装飾含む）も表示用に保持
-        disp = re.sub(r"\s+", " ", t.group(1)).strip().split("｜")[0].split("|")[0].strip() if t else p.stem
-        c = (re.search(r'article:section"\s+content="(.*?)"', h) or
-             re.search(r'class="article-category">(.*?)<', h) or
-             re.search(r'class="blog-tag">(.*?)<', h))
-        cat = c.group(1).strip() if c else ""
-        d = re.search(r'article:published_time"\s+content="(.*?)"', h)
-        date = d.group(1).strip()[:10] if d else ""
-        rel = p.relative_to(BLOG).as_posix()
-        bucket = detect(title, cat, rel)
-        arts.append({"rel": rel, "title": disp, "date": date, "bucket": bucket})
+    for rel, _ in items:
+        m = metas[rel]
+        bucket = detect(m["title"], m["cat"], rel)
+        arts.append({"rel": rel, "title": m["disp"], "date": m["date"], "bucket": bucket})
+    if stats is not None:
+        stats.update(st)
     return arts
 
-def render(arts):
+def group(arts):
+    """[(カテゴリ名, 新しい順の記事リスト), …] を ORDER 順で返す（空カテゴリは除く）。"""
     groups = {}
     for a in arts:
         groups.setdefault(a["bucket"], []).append(a)
     for g in groups.values():
         g.sort(key=lambda x: x["date"], reverse=True)
+    return [(name, groups[name]) for name in ORDER if name in groups]
+
+def render_items(items, prefix=""):
+    lis = []
+    for a in items:
+        dt = a["date"] or ""
+        lis.append(
+            f'        <li><a href="{prefix}{a["rel"]}"><span class="bi-title">{_html.escape(a["title"])}</span>'
+            f'<span class="bi-date">{dt}</span></a></li>'
+        )
+    return "\n".join(lis)
+
+def render(arts, top=TOP_PER_BUCKET):
+    """トップのハブ。各カテゴリ新着 top 件だけ載せ、残りはカテゴリ別ページ／index.json の遅延読み込みに任せる。"""
     total = len(arts)
     sections = []
-    for name in ORDER:
-        if name not in groups:
-            continue
-        items = groups[name]
-        lis = []
-        for a in items:
-            dt = a["date"] or ""
-            lis.append(
-                f'        <li><a href="{a["rel"]}"><span class="bi-title">{_html.escape(a["title"])}</span>'
-                f'<span class="bi-date">{dt}</span></a></li>'
-            )
+    for i, (name, items) in enumerate(group(arts)):
+        more = ""
+        if len(items) > top:
+            more = (f'\n      <a class="bi-more" href="{CATEGORY_DIR}/{SLUGS[name]}/" data-bucket="{ORDER.index(name)}">'
+                    f'もっと見る（全{len(items)}記事）</a>')
         sections.append(
             f'    <section class="bi-cat">\n'
             f'      <h2>{_html.escape(name)} <span class="bi-count">{len(items)}</span></h2>\n'
-            f'      <ul class="bi-list">\n' + "\n".join(lis) + "\n      </ul>\n    </section>"
+            f'      <ul class="bi-list">\n' + render_items(items[:top]) + f"\n      </ul>{more}\n    </section>"
         )
-    body = "\n".join(sections)
-    return TEMPLATE.format(total=total, body=body, base=BASE)
+    body = SEARCH_FORM + "\n".join(sections)
+    return TEMPLATE.format(
+        page_title="ブログ記事一覧 | 未来投資navi",
+        description="未来投資naviのブログ記事一覧。新NISA・オルカン・米国株・債券・年金など、50代60代の投資初心者に向けた資産運用の記事をカテゴリ別にまとめています。",
+        og_description="50代60代の投資初心者に向けた資産運用の記事をカテゴリ別にまとめています。",
+        path="blog/index.html", home="../index.html", home_label="トップページへ戻る",
+        heading="ブログ記事一覧",
+        lead=f"50代・60代の投資初心者に向けた資産運用の記事を、カテゴリ別にまとめています（全{total}記事）。",
+        body=body, script=MORE_SCRIPT.replace("{top}", str(top)) + SEARCH_SCRIPT, base=BASE)
+
+def page_name(n):
+    return "index.html" if n == 1 else f"page-{n}.html"
+
+def render_category(name, items, size=PAGE_SIZE):
+    """カテゴリ1つ分のページ群。戻り値: [(ファイル名, html), …]"""
+    slug = SLUGS[name]
+    pages = max(1, -(-len(items) // size))
+    out = []
+    for n in range(1, pages + 1):
+        chunk = items[(n - 1) * size:n * size]
+        nav = []
+        if pages > 1:
+            if n > 1:
+                nav.append(f'<a href="{page_name(n - 1)}">← 前へ</a>')
+            nav += [f'<span class="bi-cur">{k}</span>' if k == n else f'<a href="{page_name(k)}">{k}</a>'
+                    for k in range(1, pages + 1)]
+            if n < pages:
+                nav.append(f'<a href="{page_name(n + 1)}">次へ →</a>')
+        pager = f'\n    <nav class="bi-pager">{"".join(nav)}</nav>' if nav else ""
+        body = ('    <section class="bi-cat">\n      <ul class="bi-list">\n'
+                + render_items(chunk, prefix="../../") + f"\n      </ul>\n    </section>{pager}")
+        suffix = f"（{n}/{pages}ページ）" if pages > 1 else ""
+        title = f"{name}の記事一覧{suffix} | 未来投資navi"
+        out.append((page_name(n), TEMPLATE.format(
+            page_title=_html.escape(title),
+            description=_html.escape(f"未来投資naviの「{name}」カテゴリの記事一覧{suffix}。50代60代の投資初心者に向けた資産運用の記事をまとめています。"),
+            og_description=_html.escape(f"「{name}」カテゴリの記事一覧です。"),
+            path=f"blog/{CATEGORY_DIR}/{slug}/{page_name(n)}", home="../../index.html", home_label="ブログ記事一覧へ戻る",
+            heading=_html.escape(name), lead=f"「{_html.escape(name)}」の記事を新しい順に並べています（全{len(items)}記事）。",
+            body=body, script="", base=BASE)))
+    return out
+
+def render_manifest(arts):
+    """ハブ用の軽量一覧。articles は fields 順の配列で、カテゴリ→新しい順に並ぶ（ページと同じ順）。"""
+    rows = [[a["title"], a["date"], ORDER.index(name), a["rel"]] for name, items in group(arts) for a in items]
+    data = {"version": MANIFEST_VERSION, "fields": ["title", "date", "bucket", "path"],
+            "buckets": ORDER, "articles": rows}
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+# 「もっと見る」：index.json を初回クリック時にだけ取得し、同じカテゴリの続きを {top} 件ずつ差し込む。
+# JS が無ければ普通のリンクとしてカテゴリ別ページへ飛ぶ。
+MORE_SCRIPT = """  <script>
+  (function(){
+    var step={top}, data=null;
+    function load(){ return data || (data = fetch('index.json').then(function(r){ return r.json(); })); }
+    function esc(s){ return s.replace(/[&<>"]/g, function(c){ return {'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;'}[c]; }); }
+    document.addEventListener('click', function(e){
+      var btn = e.target.closest && e.target.closest('.bi-more');
+      if (!btn || !window.fetch) return;
+      e.preventDefault();
+      load().then(function(m){
+        var b = +btn.dataset.bucket, ul = btn.previousElementSibling;
+        var rows = m.articles.filter(function(a){ return a[2] === b; });
+        var shown = ul.children.length, next = rows.slice(shown, shown + step);
+        ul.insertAdjacentHTML('beforeend', next.map(function(a){
+          return '        <li><a href="' + esc(a[3]) + '"><span class="bi-title">' + esc(a[0]) + '</span><span class="bi-date">' + a[1] + '</span></a></li>';
+        }).join(''));
+        if (shown + next.length >= rows.length) btn.remove();
+      }).catch(function(){ location.href = btn.href; });
+    });
+  })();
+  </script>
+"""
+
+# 全文検索（build_search_index.py が作る search/ を使う）。search.js が読めてから欄を出すので、
+# JS が無い・インデックスが未生成のときは何も表示されない。入力中は一覧の代わりに結果を出す。
+SEARCH_FORM = """    <form class="bi-search" role="search" hidden>
+      <input type="search" name="q" placeholder="記事を検索（例: 新NISA 取り崩し）" aria-label="ブログ記事を検索" autocomplete="off">
+      <ul class="bi-list bi-results" aria-live="polite"></ul>
+    </form>
+"""
+SEARCH_SCRIPT = """  <script defer src="search/search.js"></script>
+  <script>
+  document.addEventListener('DOMContentLoaded', function(){
+    var form = document.querySelector('.bi-search');
+    if (!form || !window.MiraiSearch) return;
+    var input = form.q, out = form.querySelector('.bi-results'), cats = document.querySelectorAll('.bi-cat'), timer = 0, seq = 0;
+    function esc(s){ return String(s).replace(/[&<>"]/g, function(c){ return {'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;'}[c]; }); }
+    function show(list){ for (var i = 0; i < cats.length; i++) cats[i].hidden = !list; }
+    function run(){
+      var q = input.value.trim(), n = ++seq;
+      if (!q) { out.innerHTML = ''; show(true); return; }
+      MiraiSearch.query(q, 20).then(function(rows){
+        if (n !== seq) return;
+        show(false);
+        out.innerHTML = rows.length ? rows.map(function(r){
+          return '<li><a href="' + esc(r[0]) + '"><span class="bi-title">' + esc(r[1]) + '</span><span class="bi-date">' + esc(r[2] || '') + '</span></a></li>';
+        }).join('') : '<li class="bi-none">該当する記事がありません</li>';
+      });
+    }
+    form.hidden = false;
+    form.addEventListener('submit', function(e){ e.preventDefault(); run(); });
+    input.addEventListener('input', function(){ clearTimeout(timer); timer = setTimeout(run, 200); });
+  });
+  </script>
+"""
 
 TEMPLATE = """<!DOCTYPE html>
 <html lang="ja">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>ブログ記事一覧 | 未来投資navi</title>
-  <meta name="description" content="未来投資naviのブログ記事一覧。新NISA・オルカン・米国株・債券・年金など、50代60代の投資初心者に向けた資産運用の記事をカテゴリ別にまとめています。">
-  <link rel="canonical" href="{base}/blog/index.html">
+  <title>{page_title}</title>
+  <meta name="description" content="{description}">
+  <link rel="canonical" href="{base}/{path}">
   <meta property="og:type" content="website">
-  <meta property="og:url" content="{base}/blog/index.html">
-  <meta property="og:title" content="ブログ記事一覧 | 未来投資navi">
-  <meta property="og:description" content="50代60代の投資初心者に向けた資産運用の記事をカテゴリ別にまとめています。">
+  <meta property="og:url" content="{base}/{path}">
+  <meta property="og:title" content="{page_title}">
+  <meta property="og:description" content="{og_description}">
   <meta property="og:site_name" content="未来投資navi">
   <script type="application/ld+json">
-  {{ "@context":"https://schema.org","@type":"CollectionPage","name":"ブログ記事一覧 | 未来投資navi","url":"{base}/blog/index.html" }}
+  {{ "@context":"https://schema.org","@type":"CollectionPage","name":"{page_title}","url":"{base}/{path}" }}
   </script>
   <style>
     *,*::before,*::after{{box-sizing:border-box;margin:0;padding:0}}
@@ -115,28 +271,143 @@ TEMPLATE = """<!DOCTYPE html>
     .bi-title{{flex:1}}
     .bi-list a:hover .bi-title{{color:#1a3a5c;text-decoration:underline}}
     .bi-date{{flex-shrink:0;font-size:12px;color:#aaa;font-variant-numeric:tabular-nums}}
+    .bi-more{{display:block;margin-top:12px;padding:10px;text-align:center;font-size:14px;color:#1a3a5c;border:1px solid #c9d6e3;border-radius:6px;text-decoration:none}}
+    .bi-more:hover{{background:#f3f6fa}}
+    .bi-pager{{display:flex;flex-wrap:wrap;justify-content:center;gap:8px;font-size:14px}}
+    .bi-pager a,.bi-pager span{{padding:6px 12px;border:1px solid #c9d6e3;border-radius:6px;color:#1a3a5c;text-decoration:none}}
+    .bi-pager .bi-cur{{background:#1a3a5c;color:#fff}}
+    .bi-search{{margin-bottom:32px}}
+    .bi-search input{{width:100%;padding:10px 14px;font-size:16px;border:1px solid #c9d6e3;border-radius:6px;background:#fff}}
+    .bi-results:not(:empty){{margin-top:12px}}
+    .bi-none{{padding:12px 4px;font-size:14px;color:#888}}
     @media(max-width:600px){{.bi-head h1{{font-size:21px}}.bi-list a{{flex-direction:column;gap:2px}}.bi-date{{font-size:11px}}}}
   </style>
 </head>
 <body>
   <div class="container">
     <header class="bi-head">
-      <a class="home" href="../index.html">← トップページへ戻る</a>
-      <h1>ブログ記事一覧</h1>
-      <p>50代・60代の投資初心者に向けた資産運用の記事を、カテゴリ別にまとめています（全{total}記事）。</p>
+      <a class="home" href="{home}">← {home_label}</a>
+      <h1>{heading}</h1>
+      <p>{lead}</p>
     </header>
 {body}
   </div>
-</body>
+{script}</body>
 </html>
 """
 
+SITEMAP = ROOT / "sitemap.xml"
+URL_BLOCK_RE = re.compile(r"[ \t]*<url>\s*<loc>\s*(https?://[^/<]+)?/?([^<]*?)\s*</loc>.*?</url>\n?", re.S)
+LASTMOD_RE = re.compile(r"<lastmod>[^<]*</lastmod>")
+
+def mtime_date(p):
+    """scripts/generate-sitemap.ts と同じく更新日時（UTC）の日付を lastmod にする。"""
+    return datetime.datetime.fromtimestamp(p.stat().st_mtime, datetime.timezone.utc).strftime("%Y-%m-%d")
+
+def update_sitemap(changed, w, arts, sitemap=SITEMAP):
+    """sitemap.xml を変わった記事の分だけ書き換える（丸ごと作り直すのは scripts/generate-sitemap.ts）。
+    changed は blog/ からの相対パスの集合（None を含めば全記事）。
+    既存エントリは lastmod を更新、消えた記事のエントリは削除、未掲載の新記事は末尾に追加する。
+    削除するのはファイルが実際に無くなった blog/*.html だけ（blog/index.html 等の記事以外のページは arts に無いため）。"""
+    text = sitemap.read_text(encoding="utf-8")
+    live = {"blog/" + a["rel"] for a in arts}
+    everything = None in changed
+    changed = {"blog/" + r for r in changed if r}
+    seen, touched = set(), False
+    def fix(m):
+        nonlocal touched
+        path = m.group(2)
+        if path.startswith("blog/") and path.endswith(".html") and path not in live and \
+                (everything or path in changed or any(path.startswith(c + "/") for c in changed)) and \
+                not (ROOT / path).exists():
+            touched = True
+            return ""  # 記事ファイル（またはそのフォルダ）ごと消えた
+        seen.add(path)
+        if path == "blog/" and changed:
+            date = mtime_date(BLOG / "index.html")
+        elif path in live and (everything or path in changed):
+            date = mtime_date(ROOT / path)
+        else:
+            return m.group(0)
+        block = LASTMOD_RE.sub(f"<lastmod>{date}</lastmod>", m.group(0), count=1)
+        touched |= block != m.group(0)
+        return block
+    text = URL_BLOCK_RE.sub(fix, text)
+    host = next((m.group(1) for m in URL_BLOCK_RE.finditer(text) if m.group(1)), BASE)
+    added = [p for p in sorted(changed & live) if p not in seen]
+    if added:
+        text = text.replace("</urlset>", "".join(
+            f"  <url>\n    <loc>{host}/{p}</loc>\n    <lastmod>{mtime_date(ROOT / p)}</lastmod>\n"
+            f"    <changefreq>weekly</changefreq>\n    <priority>0.8</priority>\n  </url>\n" for p in added) + "</urlset>")
+    if touched or added:
+        w.write_text(sitemap, text)
+    return len(added)
+
+def build(args, use_cache=True):
+    """一覧・カテゴリ別ページ・index.json を書く。戻り値: (記事リスト, SiteWriter, キャッシュ統計, カテゴリページ数)"""
+    stats = {}
+    arts = collect(use_cache=use_cache, stats=stats, jobs=args.jobs)
+    w = SiteWriter(ROOT)
+    w.write_text(BLOG / "index.html", minify(shared_css.apply(w, render(arts, top=args.top), "blog/index.html")))
+    w.write_text(BLOG / MANIFEST, render_manifest(arts))
+    # カテゴリ別ページ。件数が減って余ったページ・消えたカテゴリは削除する。
+    pages = set()
+    for name, items in group(arts):
+        d = BLOG / CATEGORY_DIR / SLUGS[name]
+        for fname, html in render_category(name, items, size=args.page_size):
+            w.write_text(d / fname, minify(shared_css.apply(w, html, (d / fname).relative_to(ROOT).as_posix())))
+            pages.add(d / fname)
+    for p in (BLOG / CATEGORY_DIR).glob("*/*.html"):
+        if p not in pages:
+            w.remove(p)
+    return arts, w, stats, len(pages)
+
+def relevant(rel):
+    """監視で拾うパス：記事 HTML と（丸ごと消える・移動する）記事フォルダ。自分の生成物と隠しファイルは除く。"""
+    parts = rel.split("/")
+    if any(x.startswith(".") for x in parts) or parts[0] in (CATEGORY_DIR, "search") or rel in ("index.html", MANIFEST):
+        return False
+    return rel.endswith(".html") or "." not in parts[-1]
+
+def watch(args):
+    """blog/ を監視し、保存のたびに変わった記事だけ読み直して一覧（と sitemap.xml）を更新する。"""
+    import fs_watch
+    arts, w, stats, _ = build(args)
+    print(f"initial build: {len(arts)} articles / {w.summary()}")
+    def on_change(rels):
+        t0 = time.perf_counter()
+        arts, w, stats, _ = build(args)
+        added = update_sitemap(rels, w, arts) if SITEMAP.exists() else 0
+        ms = (time.perf_counter() - t0) * 1000
+        shown = "（イベント取りこぼし・全体を再確認）" if None in rels else ", ".join(sorted(rels)[:3]) + (" …" if len(rels) > 3 else "")
+        print(f"[{time.strftime('%H:%M:%S')}] {shown}")
+        print(f"  refreshed in {ms:.0f}ms: parsed {stats['parsed']} / dropped {stats['dropped']} / "
+              f"{w.summary()}" + (f" / sitemap +{added}" if added else ""))
+    fs_watch.watch(BLOG, on_change, relevant, debounce=args.debounce, poll=args.poll, interval=args.interval)
+    return 0
+
 def main():
-    arts = collect()
+    ap = argparse.ArgumentParser(description="blog/index.html とカテゴリ別ページ・index.json を実在記事から生成")
+    ap.add_argument("--no-cache", action="store_true", help="メタキャッシュを使わず全記事を再パース")
+    ap.add_argument("--jobs", type=int, default=1, help="記事の読み込みを N プロセスで並列化（出力は直列と同一）")
+    ap.add_argument("--top", type=int, default=TOP_PER_BUCKET, help="トップページに出す各カテゴリの件数")
+    ap.add_argument("--page-size", type=int, default=PAGE_SIZE, help="カテゴリ別ページ1枚あたりの件数")
+    ap.add_argument("--watch", action="store_true", help="blog/ を監視し、保存のたびに一覧と sitemap.xml を更新し続ける")
+    ap.add_argument("--poll", action="store_true", help="--watch で inotify を使わずポーリングする")
+    ap.add_argument("--interval", type=float, default=0.5, help="ポーリング間隔（秒）")
+    ap.add_argument("--debounce", type=float, default=0.3, help="連続した変更をまとめる待ち時間（秒）")
+    args = ap.parse_args()
+    if args.watch:
+        return watch(args)
+    t0 = time.perf_counter()
+    arts, w, stats, npages = build(args, use_cache=not args.no_cache)
     out = BLOG / "index.html"
-    out.write_text(render(arts), encoding="utf-8")
-    print(f"wrote {out} ({len(arts)} articles)")
-    # 存在検証
+    ms = (time.perf_counter() - t0) * 1000
+    print(f"built {out} ({len(arts)} articles, {npages} category pages, {ms:.0f}ms)")
+    print(f"  files: {w.summary()}")
+    if not args.no_cache:
+        print(f"  cache: hit {stats['hit']} / parsed {stats['parsed']} / dropped {stats['dropped']}")
+    # 存在検証（トップ・カテゴリ別ページから張るリンクはすべて記事の実ファイル）
     missing = [a["rel"] for a in arts if not (BLOG / a["rel"]).exists()]
     print("リンク切れ:", len(missing))
     for m in missing:
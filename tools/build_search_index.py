@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""ブログ全文検索インデックス（日本語文字バイグラム）をビルド時に作る。
+出力 blog/search/:
+  meta.json    … バージョン・シャード数・文書数（クライアントが最初に読む）
+  docs.json    … 文書ID順の [パス, タイトル, 日付]
+  shards/NN.json … バイグラム → 差分符号化したポスティング [Δ文書ID, 出現回数, Δ文書ID, 出現回数, …]
+  search.js    … シャードを必要な分だけ fetch して検索する小さなクライアント（blog/index.html の検索欄が読む）
+シャードはバイグラム先頭文字のコードポイント % SHARDS で振り分けるので、
+ブラウザはクエリに出てくるバイグラムの先頭文字ぶんのシャードしか取りに行かない。
+本文抽出は記事ごとに内容ハッシュで .cache/search_index.json にキャッシュ（変わった記事だけ再抽出）。
+  python3 tools/build_search_index.py [--jobs N] [--budget-kb 2048] [--query "新NISA 取り崩し"]
+"""
+import re, sys, json, time, argparse, unicodedata
+from html.parser import HTMLParser
+import blog_meta, file_cache
+import build_blog_index as bbi
+from site_writer import SiteWriter
+
+ROOT = bbi.ROOT
+BLOG = bbi.BLOG
+OUT_DIR = BLOG / "search"
+SHARDS = 64
+INDEX_VERSION = 1
+BUDGET_KB = 2048            # 出力合計のサイズ予算（超えたら終了コード 1）
+CACHE = ROOT / ".cache" / "search_index.json"
+CACHE_VERSION = 1
+SKIP_TAGS = {"script", "style", "svg", "noscript", "nav", "footer", "template", "head"}
+RUN_RE = re.compile(r"\w+")
+
+def normalize(text):
+    """NFKC + 小文字化。全角英数も半角にそろう。"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+def bigrams(text):
+    """正規化済みテキストを記号・空白で区切り、各ランの中で2文字ずつずらして切る（1文字だけのランは捨てる）。"""
+    out = []
+    for run in RUN_RE.findall(text):
+        out += [run[i:i + 2] for i in range(len(run) - 1)]
+    return out
+
+def shard_of(gram):
+    return ord(gram[0]) % SHARDS
+
+class BodyText(HTMLParser):
+    """<body> の可読テキストだけを集める（script/style/svg/nav 等の中身は捨てる）。"""
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.skip = 0
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self.skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS and self.skip:
+            self.skip -= 1
+
+    def handle_data(self, data):
+        if not self.skip:
+            self.parts.append(data)
+
+def extract_doc(p, raw):
+    """1記事分：表示用メタとバイグラム出現回数（file_cache から、プロセスプール経由でも呼ばれる）。"""
+    meta = bbi.parse(p, blog_meta.extract_bytes(raw))
+    parser = BodyText()
+    parser.feed(raw.decode("utf-8", errors="ignore"))
+    parser.close()
+    tf = {}
+    for g in bigrams(normalize(meta["disp"] + "\n" + " ".join(parser.parts))):
+        tf[g] = tf.get(g, 0) + 1
+    return {"title": meta["disp"], "date": meta["date"], "tf": tf}
+
+def articles(blog=BLOG):
+    return [p for p in sorted(blog.glob("**/*.html"))
+            if p.name != "index.html" and p.relative_to(blog).parts[0] not in (bbi.CATEGORY_DIR, OUT_DIR.name)]
+
+def build(blog=BLOG, jobs=1, use_cache=True, cache_path=CACHE):
+    """戻り値: (出力ファイル名 -> 文字列 の dict, キャッシュ統計)"""
+    items = [(p.relative_to(blog).as_posix(), p) for p in articles(blog)]
+    cache = file_cache.load(cache_path, CACHE_VERSION) if use_cache else {}
+    fresh, stats = file_cache.refresh(items, cache, extract_doc, jobs=jobs)
+    if use_cache and fresh != cache:
+        file_cache.save(cache_path, CACHE_VERSION, fresh)
+    docs, postings = [], {}
+    for doc_id, (rel, _) in enumerate(items):
+        d = fresh[rel]["data"]
+        docs.append([rel, d["title"], d["date"]])
+        for g, n in d["tf"].items():
+            postings.setdefault(g, []).append((doc_id, n))
+    shards = [{} for _ in range(SHARDS)]
+    for g in sorted(postings):
+        flat, prev = [], 0
+        for doc_id, n in postings[g]:   # doc_id は昇順に積まれている
+            flat += [doc_id - prev, n]
+            prev = doc_id
+        shards[shard_of(g)][g] = flat
+    dump = lambda o: json.dumps(o, ensure_ascii=False, separators=(",", ":")) + "\n"
+    files = {"meta.json": dump({"version": INDEX_VERSION, "shards": SHARDS, "docs": len(docs), "terms": len(postings)}),
+             "docs.json": dump(docs)}
+    for i, sh in enumerate(shards):
+        files[f"shards/{i:02d}.json"] = dump(sh)
+    files["search.js"] = CLIENT_JS.replace("__SHARDS__", str(SHARDS))
+    return files, stats
+
+def decode(flat):
+    """差分符号化ポスティングを {doc_id: 出現回数} に戻す。"""
+    out, doc = {}, 0
+    for i in range(0, len(flat), 2):
+        doc += flat[i]
+        out[doc] = flat[i + 1]
+    return out
+
+def search(query, load_shard, docs, limit=10):
+    """クライアント（search.js）と同じ手順の参照実装。load_shard(i) -> dict。
+    クエリの全バイグラムを含む文書（AND）を、出現回数の合計が多い順に返す。"""
+    grams = sorted(set(bigrams(normalize(query))))
+    if not grams:
+        return []
+    shards = {i: load_shard(i) for i in sorted({shard_of(g) for g in grams})}
+    hit = None
+    for g in grams:
+        post = decode(shards[shard_of(g)].get(g, []))
+        hit = post if hit is None else {d: hit[d] + n for d, n in post.items() if d in hit}
+        if not hit:
+            return []
+    ranked = sorted(hit.items(), key=lambda x: (-x[1], x[0]))[:limit]
+    return [docs[d] + [score] for d, score in ranked]
+
+def disk_loader(out_dir=OUT_DIR):
+    return lambda i: json.loads((out_dir / "shards" / f"{i:02d}.json").read_text(encoding="utf-8"))
+
+CLIENT_JS = """// 未来投資navi ブログ検索クライアント（tools/build_search_index.py が生成）
+// 使い方: MiraiSearch.query('新NISA 取り崩し').then(function(rows){ ... })  rows = [[path, title, date, score], …]
+(function(global){
+  var SHARDS = __SHARDS__, base = (document.currentScript && document.currentScript.src || '').replace(/[^/]*$/, '');
+  var cache = {}, docs = null;
+  function get(name){ return cache[name] || (cache[name] = fetch(base + name).then(function(r){ return r.json(); })); }
+  function bigrams(q){
+    var out = {}, runs = q.normalize('NFKC').toLowerCase().match(/[\\p{L}\\p{N}_]+/gu) || [];
+    runs.forEach(function(run){ var c = Array.from(run); for (var i = 0; i + 1 < c.length; i++) out[c[i] + c[i + 1]] = 1; });
+    return Object.keys(out).sort();
+  }
+  function shardOf(g){ return g.codePointAt(0) % SHARDS; }
+  function pad(i){ return (i < 10 ? '0' : '') + i; }
+  function decode(flat){ var m = {}, d = 0; for (var i = 0; i < flat.length; i += 2){ d += flat[i]; m[d] = flat[i + 1]; } return m; }
+  function query(q, limit){
+    var grams = bigrams(q); limit = limit || 10;
+    if (!grams.length) return Promise.resolve([]);
+    var need = {}; grams.forEach(function(g){ need[shardOf(g)] = 1; });
+    docs = docs || get('docs.json');
+    return Promise.all([docs].concat(Object.keys(need).map(function(i){ return get('shards/' + pad(+i) + '.json'); }))).then(function(res){
+      var d = res[0], sh = {}; Object.keys(need).forEach(function(i, k){ sh[i] = res[k + 1]; });
+      var hit = null;
+      for (var j = 0; j < grams.length; j++){
+        var post = decode(sh[shardOf(grams[j])][grams[j]] || []), next = {};
+        if (hit === null) next = post; else for (var k in post) if (k in hit) next[k] = hit[k] + post[k];
+        hit = next; if (!Object.keys(hit).length) return [];
+      }
+      return Object.keys(hit).sort(function(a, b){ return hit[b] - hit[a] || a - b; }).slice(0, limit)
+        .map(function(k){ return d[k].concat([hit[k]]); });
+    });
+  }
+  global.MiraiSearch = { query: query };
+})(window);
+"""
+
+def main():
+    ap = argparse.ArgumentParser(description="ブログ全文検索インデックス（バイグラム・シャード分割）を生成")
+    ap.add_argument("--jobs", type=int, default=1, help="本文抽出を N プロセスで並列化")
+    ap.add_argument("--no-cache", action="store_true", help="抽出キャッシュを使わず全記事を読み直す")
+    ap.add_argument("--budget-kb", type=int, default=BUDGET_KB, help="出力合計のサイズ予算(KB)")
+    ap.add_argument("--query", help="生成後にこのクエリで検索して結果を表示")
+    args = ap.parse_args()
+    t0 = time.perf_counter()
+    files, stats = build(jobs=args.jobs, use_cache=not args.no_cache)
+    w = SiteWriter(ROOT)
+    for name, text in files.items():
+        w.write_text(OUT_DIR / name, text)
+    for p in (OUT_DIR / "shards").glob("*.json"):
+        if f"shards/{p.name}" not in files:
+            w.remove(p)
+    sizes = {name: len(text.encode("utf-8")) for name, text in files.items()}
+    shard_sizes = [n for name, n in sizes.items() if name.startswith("shards/")]
+    total = sum(sizes.values())
+    meta = json.loads(files["meta.json"])
+    ms = (time.perf_counter() - t0) * 1000
+    print(f"built {OUT_DIR} ({meta['docs']} docs, {meta['terms']} bigrams, {ms:.0f}ms)")
+    print(f"  cache: hit {stats['hit']} / parsed {stats['parsed']} / dropped {stats['dropped']}")
+    print(f"  files: {w.summary()}")
+    print(f"  size: total {total/1024:.0f}KB / docs.json {sizes['docs.json']/1024:.0f}KB / "
+          f"shard avg {sum(shard_sizes)/len(shard_sizes)/1024:.1f}KB max {max(shard_sizes)/1024:.1f}KB")
+    over = total > args.budget_kb * 1024
+    if over:
+        print(f"検索インデックスが予算超過: {total/1024:.0f}KB > {args.budget_kb}KB（{OUT_DIR.relative_to(ROOT)}）", file=sys.stderr)
+    if args.query:
+        for path, title, date, score in search(args.query, disk_loader(), json.loads(files["docs.json"])):
+            print(f"  {score:5d}  {date or '----------'}  {title}  ({path})")
+    return 1 if over else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""サイト全体のリンク・アセット参照チェッカー。
+対象: ルート直下の *.html / blog/ / app/ 以下の全HTML と sitemap.xml。
+- 内部の href / src / srcset / og:image / twitter:image / og:url / canonical をすべて実ファイルに解決し、無いものを報告
+- どのページからもリンクされていない HTML（孤立ページ）を報告（sitemap に載っているかも併記）
+- https://eva-solution.com と https://eva-solution.netlify.app はどちらも自サイトとして扱う
+- ファイルごとの抽出結果は内容ハッシュで .cache/check_links.json にキャッシュ（1記事直しただけの再実行はほぼ一瞬）
+- --jobs N で抽出をプロセス並列化
+  python3 tools/check_links.py [--jobs 4] [--json report.json]
+終了コード: 参照切れがあれば 1。
+"""
+import os, re, sys, json, time, argparse, posixpath
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit, unquote
+import file_cache
+
+ROOT = Path(__file__).resolve().parent.parent
+SCAN_DIRS = ["blog", "app"]                       # ルート直下の *.html に加えて再帰的に見る
+SITEMAP = "sitemap.xml"
+SITE_HOSTS = {"eva-solution.com", "www.eva-solution.com", "eva-solution.netlify.app"}
+SKIP_SCHEMES = ("mailto:", "tel:", "javascript:", "data:", "sms:")
+# どこからもリンクされなくて当然のページ
+ORPHAN_EXEMPT = {"index.html", "404.html"}
+ORPHAN_EXEMPT_RE = re.compile(r"(^|/)google[0-9a-f]+\.html$")  # Search Console の所有権確認
+CACHE = ROOT / ".cache" / "check_links.json"
+CACHE_VERSION = 1
+
+# (タグ, 属性) -> 参照の種類。meta/link は property・rel で個別に見る。
+URL_ATTRS = {("a", "href"): "link", ("area", "href"): "link", ("img", "src"): "asset", ("script", "src"): "asset",
+             ("iframe", "src"): "link", ("source", "src"): "asset", ("video", "src"): "asset",
+             ("video", "poster"): "asset", ("audio", "src"): "asset", ("form", "action"): "link"}
+SRCSET_TAGS = {"img", "source"}
+META_PROPS = {"og:image", "og:image:url", "og:image:secure_url", "twitter:image", "og:url"}
+LINK_RELS = {"canonical", "stylesheet", "icon", "shortcut icon", "apple-touch-icon", "preload", "manifest", "alternate"}
+
+class RefParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.refs = []  # [kind, url, line]
+
+    def add(self, kind, url):
+        if url and url.strip():
+            self.refs.append([kind, url.strip(), self.getpos()[0]])
+
+    def handle_starttag(self, tag, attrs):
+        a = {k: v for k, v in attrs if v is not None}
+        for (t, attr), kind in URL_ATTRS.items():
+            if t == tag and attr in a:
+                self.add(kind, a[attr])
+        if tag in SRCSET_TAGS and "srcset" in a:
+            for cand in a["srcset"].split(","):
+                self.add("asset", cand.strip().split(" ")[0])
+        if tag == "meta":
+            prop = a.get("property") or a.get("name") or ""
+            if prop in META_PROPS:
+                self.add("canonical" if prop == "og:url" else "asset", a.get("content", ""))
+        elif tag == "link":
+            rel = a.get("rel", "").lower()
+            if rel == "canonical":
+                self.add("canonical", a.get("href", ""))
+            elif rel in LINK_RELS and not a.get("hreflang"):
+                self.add("asset", a.get("href", ""))
+
+    handle_startendtag = handle_starttag
+
+LOC_RE = re.compile(r"<(loc|image:loc)>\s*(.*?)\s*</\1>", re.S)
+
+def extract_refs(p, raw):
+    """1ファイル分の参照を抜く（file_cache から、プロセスプール経由でも呼ばれる）。"""
+    text = raw.decode("utf-8", errors="ignore")
+    if p.suffix == ".xml":
+        refs = []
+        for m in LOC_RE.finditer(text):
+            line = text.count("\n", 0, m.start()) + 1
+            refs.append(["sitemap" if m.group(1) == "loc" else "asset", m.group(2), line])
+        return refs
+    parser = RefParser()
+    try:
+        parser.feed(text)
+        parser.close()
+    except Exception:  # 壊れたHTMLでも拾えた分だけ返す
+        pass
+    return parser.refs
+
+def resolve(page_rel, url):
+    """参照URLをサイトルートからの相対パスに解決する。外部・対象外なら None。"""
+    if url.startswith(SKIP_SCHEMES) or url.startswith("#") or "{" in url:
+        return None
+    parts = urlsplit(url)
+    if parts.scheme and parts.scheme not in ("http", "https"):
+        return None
+    if parts.netloc:
+        if parts.netloc.lower() not in SITE_HOSTS:
+            return None
+        path = parts.path or "/"
+    else:
+        path = parts.path
+        if not path:
+            return None  # "?x=1" だけ等
+    path = unquote(path)
+    if not path.startswith("/"):
+        path = posixpath.join(posixpath.dirname("/" + page_rel), path)
+    trailing = path.endswith("/")
+    rel = posixpath.normpath(path).lstrip("/")
+    if not rel:
+        return ""  # サイトルート
+    return rel + "/" if trailing else rel
+
+def target_exists(rel, files, dirs):
+    """Netlify の配信規則どおりに実体を探す。戻り値: 実ファイルの相対パス or None。"""
+    if rel == "" or rel.endswith("/"):
+        cand = rel + "index.html"
+        return cand if cand in files else None
+    if rel in files:
+        return rel
+    if rel in dirs and rel + "/index.html" in files:
+        return rel + "/index.html"
+    if rel + ".html" in files:  # pretty URL
+        return rel + ".html"
+    return None
+
+def site_files(root=ROOT):
+    """サイトに載る全ファイルとディレクトリ（.git 等の隠しディレクトリと node_modules は降りない）。"""
+    files, dirs = set(), set()
+    for d, subdirs, names in os.walk(root):
+        subdirs[:] = [s for s in subdirs if not s.startswith(".") and s != "node_modules"]
+        rel = Path(d).relative_to(root).as_posix()
+        prefix = "" if rel == "." else rel + "/"
+        dirs.update(prefix + s for s in subdirs)
+        files.update(prefix + n for n in names)
+    return files, dirs
+
+def pages(root=ROOT):
+    out = sorted(root.glob("*.html"))
+    for d in SCAN_DIRS:
+        out += sorted((root / d).rglob("*.html"))
+    sm = root / SITEMAP
+    if sm.exists():
+        out.append(sm)
+    return out
+
+def check(root=ROOT, jobs=1, use_cache=True, cache_path=CACHE):
+    t0 = time.perf_counter()
+    srcs = pages(root)
+    items = [(p.relative_to(root).as_posix(), p) for p in srcs]
+    cache = file_cache.load(cache_path, CACHE_VERSION) if use_cache else {}
+    fresh, stats = file_cache.refresh(items, cache, extract_refs, jobs=jobs)
+    if use_cache and fresh != cache:
+        file_cache.save(cache_path, CACHE_VERSION, fresh)
+    files, dirs = site_files(root)
+    missing, inbound, in_sitemap, hosts = [], {}, set(), {}
+    for rel, ent in fresh.items():
+        for kind, url, line in ent["data"]:
+            host = urlsplit(url).netloc.lower()
+            if host in SITE_HOSTS:
+                hosts[host] = hosts.get(host, 0) + 1
+            target = resolve(rel, url)
+            if target is None:
+                continue
+            found = target_exists(target, files, dirs)
+            if not found:
+                missing.append({"page": rel, "line": line, "kind": kind, "url": url, "target": target})
+                continue
+            if kind == "sitemap":
+                in_sitemap.add(found)
+            elif kind == "link" and found != rel and found.endswith(".html"):
+                inbound.setdefault(found, set()).add(rel)
+    html_pages = [rel for rel, _ in items if rel.endswith(".html")]
+    orphans = [{"page": rel, "in_sitemap": rel in in_sitemap} for rel in html_pages
+               if rel not in inbound and rel not in ORPHAN_EXEMPT and not ORPHAN_EXEMPT_RE.search(rel)]
+    return {"pages": len(html_pages), "refs": sum(len(e["data"]) for e in fresh.values()),
+            "missing": missing, "orphans": orphans, "hosts": hosts, "cache": stats,
+            "ms": round((time.perf_counter() - t0) * 1000)}
+
+def main():
+    ap = argparse.ArgumentParser(description="サイト全体のリンク・アセット参照チェック")
+    ap.add_argument("--jobs", type=int, default=1, help="抽出を N プロセスで並列化")
+    ap.add_argument("--no-cache", action="store_true", help="抽出キャッシュを使わない")
+    ap.add_argument("--json", metavar="PATH", help="結果を JSON で書き出す")
+    ap.add_argument("--orphans", action="store_true", help="孤立ページを1件ずつ表示")
+    args = ap.parse_args()
+    r = check(jobs=args.jobs, use_cache=not args.no_cache)
+    c = r["cache"]
+    print(f"checked {r['pages']} pages / {r['refs']} refs ({r['ms']}ms, cache hit {c['hit']} / parsed {c['parsed']})")
+    print("  base URL: " + ", ".join(f"{h} {n}" for h, n in sorted(r["hosts"].items())))
+    print(f"参照切れ: {len(r['missing'])}")
+    for m in r["missing"]:
+        print(f"  MISSING {m['page']}:{m['line']} [{m['kind']}] {m['url']}")
+    print(f"孤立ページ: {len(r['orphans'])}（うち sitemap 未掲載 {sum(not o['in_sitemap'] for o in r['orphans'])}）")
+    if args.orphans:
+        for o in r["orphans"]:
+            print(f"  ORPHAN {o['page']}{'' if o['in_sitemap'] else '  (sitemap にも無し)'}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(r, ensure_ascii=False, indent=1), encoding="utf-8")
+    return 0 if not r["missing"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
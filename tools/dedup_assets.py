@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""中身が同じ画像を1つの共有ファイルにまとめる（プロフィール写真・仮置きヒーローなど記事ごとのコピー）。
+- blog/ と images/ の画像を内容ハッシュでまとめ、2か所以上にあるもの（または既に共有済みのもの）を
+  assets/shared/<名前>.<ハッシュ10桁><拡張子> に1つだけ置き、元のコピーを消す
+  → URL が1つになるのでブラウザのキャッシュもサイト全体で1回で済む（名前に中身のハッシュ＝長期キャッシュ可）
+- ルート直下・blog/・app/ の HTML と sitemap.xml の参照（src / srcset / og:image / JSON-LD / <image:loc>）を
+  check_links.resolve() で実ファイルに解決し、移したファイルを指すものだけ /assets/shared/… に書き換える
+- 幅違いの派生ファイル（*-360w.webp 等）は元画像に従うので対象外
+ハッシュは .cache/dedup_assets.json に stat キーでキャッシュ（再実行は stat だけ）。
+  python3 tools/dedup_assets.py [--dry-run]
+記事ビルダーは share() で共有ファイルを直接参照し、locate() で移動済みの元ファイルを探す。
+"""
+import os, re, sys, hashlib, argparse
+from pathlib import Path
+from urllib.parse import urlsplit
+import file_cache
+from check_links import resolve, pages
+from site_writer import SiteWriter
+
+ROOT = Path(__file__).resolve().parent.parent
+SCAN_DIRS = ["blog", "images"]
+SHARED_DIR = "assets/shared"
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".avif", ".gif", ".svg"}
+VARIANT_RE = re.compile(r"-\d+w\.(webp|avif)$")
+HASH_LEN = 10
+SHARED_RE = re.compile(rf"\.([0-9a-f]{{{HASH_LEN}}})\.[^.]+$")
+CACHE = ROOT / ".cache" / "dedup_assets.json"
+CACHE_VERSION = 1
+VALUE_RE = re.compile(r'"([^"<>]*)"|<image:loc>([^<]*)</image:loc>')
+SRCSET_RE = re.compile(r"\s\d+(?:\.\d+)?[wx]\s*(,|$)")
+
+def shared_rel(name, digest):
+    stem, suffix = os.path.splitext(name)
+    return f"{SHARED_DIR}/{stem}.{digest[:HASH_LEN]}{suffix.lower()}"
+
+def share(w, data, name):
+    """data を共有置き場に置き（同じ中身があれば何もしない）、サイトルートからの URL を返す。"""
+    rel = shared_rel(name, hashlib.sha1(data).hexdigest())
+    w.write_bytes(ROOT / rel, data)
+    return "/" + rel
+
+def locate(path, root=ROOT):
+    """元の場所にあればそれを、dedup で共有置き場へ移されていればそちらを返す。"""
+    path = Path(path)
+    if path.exists():
+        return path
+    hits = sorted((root / SHARED_DIR).glob(f"{path.stem}.*{path.suffix.lower()}"), key=lambda p: p.stat().st_mtime)
+    if not hits:
+        raise FileNotFoundError(path)
+    return hits[-1]
+
+def posixname(rel):
+    return rel.rsplit("/", 1)[-1]
+
+def _none(p, raw):
+    return 0  # 欲しいのは file_cache が付ける sha1 だけ
+
+def images(root=ROOT):
+    out = []
+    for d in SCAN_DIRS:
+        out += [p for p in sorted((root / d).rglob("*"))
+                if p.suffix.lower() in IMAGE_EXTS and not VARIANT_RE.search(p.name) and p.is_file()]
+    return out
+
+def plan(root=ROOT, use_cache=True):
+    """戻り値: {元の相対パス: 共有先の相対パス}"""
+    items = [(p.relative_to(root).as_posix(), p) for p in images(root)]
+    cache = file_cache.load(CACHE, CACHE_VERSION) if use_cache else {}
+    fresh, _ = file_cache.refresh(items, cache, _none)
+    if use_cache and fresh != cache:
+        file_cache.save(CACHE, CACHE_VERSION, fresh)
+    shared = {}
+    for p in (root / SHARED_DIR).glob("*"):
+        m = SHARED_RE.search(p.name)
+        if m:
+            shared[m.group(1)] = p.relative_to(root).as_posix()
+    groups = {}
+    for rel, ent in fresh.items():
+        groups.setdefault(ent["sha1"], []).append(rel)
+    moves = {}
+    for digest, rels in groups.items():
+        target = shared.get(digest[:HASH_LEN])
+        if len(rels) < 2 and not target:
+            continue
+        if not target:
+            names = [posixname(r) for r in rels]
+            name = min(set(names), key=lambda n: (-names.count(n), n))  # いちばん多い名前
+            target = shared_rel(name, digest)
+        for rel in rels:
+            moves[rel] = target
+    return moves
+
+def fix_url(page_rel, url, moves):
+    target = resolve(page_rel, url)
+    if target not in moves:
+        return url
+    parts = urlsplit(url)
+    new = "/" + moves[target]
+    if parts.netloc:
+        new = f"{parts.scheme}://{parts.netloc}{new}"
+    return new + (f"?{parts.query}" if parts.query else "") + (f"#{parts.fragment}" if parts.fragment else "")
+
+def fix_value(page_rel, v, moves):
+    if SRCSET_RE.search(v):
+        out = []
+        for cand in v.split(","):
+            bits = cand.split()
+            if bits:
+                bits[0] = fix_url(page_rel, bits[0], moves)
+            out.append(" ".join(bits))
+        return ", ".join(out)
+    s = v.strip()
+    if not s or any(c.isspace() for c in s):
+        return v
+    return v.replace(s, fix_url(page_rel, s, moves))
+
+def rewrite(text, page_rel, moves):
+    def repl(m):
+        if m.group(1) is not None:
+            return '"' + fix_value(page_rel, m.group(1), moves) + '"'
+        return "<image:loc>" + fix_value(page_rel, m.group(2), moves) + "</image:loc>"
+    return VALUE_RE.sub(repl, text)
+
+def run(w, root=ROOT, use_cache=True, dry_run=False):
+    """戻り値: (移したファイル数, 共有ファイル数, 書き換えたページ数, 減ったバイト数)"""
+    moves = plan(root, use_cache)
+    if not moves:
+        return 0, 0, 0, 0
+    names = {posixname(r) for r in moves}
+    changed = 0
+    for page in pages(root):
+        rel = page.relative_to(root).as_posix()
+        text = page.read_text(encoding="utf-8")
+        if not any(n in text for n in names):
+            continue  # 移すファイル名が1つも出てこないページは解析しない
+        new = rewrite(text, rel, moves)
+        if new != text:
+            changed += 1
+            if not dry_run:
+                w.write_text(page, new)
+            print(f"  refs: {rel}")
+    saved = 0
+    for src, dst in sorted(moves.items()):
+        size = (root / src).stat().st_size
+        if dry_run:
+            print(f"  move {src} -> {dst}")
+            continue
+        if not (root / dst).exists():
+            w.write_bytes(root / dst, (root / src).read_bytes())
+        else:
+            saved += size
+        w.remove(root / src)
+    return len(moves), len(set(moves.values())), changed, saved
+
+def main():
+    ap = argparse.ArgumentParser(description="中身が同じ画像を assets/shared/ の1ファイルにまとめ、参照を書き換える")
+    ap.add_argument("--dry-run", action="store_true", help="書き換え対象の表示だけ")
+    ap.add_argument("--no-cache", action="store_true", help="ハッシュのキャッシュを使わない")
+    args = ap.parse_args()
+    w = SiteWriter(ROOT)
+    moved, shared, changed, saved = run(w, use_cache=not args.no_cache, dry_run=args.dry_run)
+    print(f"moved {moved} files -> {shared} shared / refs updated in {changed} pages / saved {saved/1024:.0f}KB")
+    print(f"  files: {w.summary()}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""ファイル単位の解析結果を .cache/ に持つ共通キャッシュ。
+エントリは key -> {mtime, size, sha1, data}。
+- stat（mtime_ns・サイズ）が一致すれば読まない
+- stat が違っても内容ハッシュが同じなら fn を呼ばない（touch だけされたファイル）
+- 一覧に無いキーは結果に載らない＝消えたファイルは自然にキャッシュから落ちる
+fn(path, raw_bytes) はプロセスプールからも呼ばれるのでモジュールトップレベルの関数にすること。
+"""
+import os, json, hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+def load(path, version):
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != version:
+        return {}
+    return data.get("files", {})
+
+def save(path, version, files):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": version, "files": files}, ensure_ascii=False,
+                              separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+def _load(path, sha1, fn):
+    st = path.stat()
+    raw = path.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()
+    data = None if digest == sha1 else fn(path, raw)
+    return {"sha1": digest, "data": data, "mtime": st.st_mtime_ns, "size": st.st_size}
+
+def refresh(items, cache, fn, jobs=1):
+    """items=[(key, path), …] を cache と突き合わせ、変わったものだけ fn で解析し直す。
+    jobs>1 ならプロセス並列（map は入力順で返すので結果は直列と同じ）。
+    戻り値: (新しいキャッシュ dict（items 順）, stats={hit, parsed, dropped})"""
+    fresh, todo = {}, []
+    hit = parsed = 0
+    for key, p in items:
+        ent = cache.get(key)
+        if ent:
+            st = p.stat()
+            if ent["mtime"] == st.st_mtime_ns and ent["size"] == st.st_size:
+                fresh[key] = ent
+                hit += 1
+                continue
+        fresh[key] = None  # 順序を items 順に保つための仮置き
+        todo.append((key, p, ent))
+    args = [(p, (ent or {}).get("sha1", ""), fn) for _, p, ent in todo]
+    if jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            results = list(ex.map(_load, *zip(*args), chunksize=max(1, len(todo) // (jobs * 8))))
+    else:
+        results = [_load(*a) for a in args]
+    for (key, _, ent), res in zip(todo, results):
+        if res["data"] is None:
+            res["data"] = ent["data"]
+            hit += 1
+        else:
+            parsed += 1
+        fresh[key] = res
+    return fresh, {"hit": hit, "parsed": parsed, "dropped": len(cache.keys() - fresh.keys())}
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""ディレクトリ監視（Linux は inotify、それ以外・失敗時はポーリング）。外部ライブラリ不要。
+watch(root, on_change) は変更をまとめて（debounce 秒静かになるまで待って）
+on_change(相対パスの set) を呼び続ける。Ctrl+C で終わる。
+relevant(rel) で拾うパスを絞る（自分が書き出すファイルを除外しないと無限ループになる）。
+on_change が例外を投げても（壊れた記事のパース失敗など）トレースバックを出して監視は続ける。
+"""
+import os, sys, time, select, struct, ctypes, ctypes.util, traceback
+from pathlib import Path
+
+IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO = 0x2, 0x8, 0x40, 0x80
+IN_CREATE, IN_DELETE, IN_DELETE_SELF, IN_Q_OVERFLOW, IN_ISDIR = 0x100, 0x200, 0x400, 0x4000, 0x40000000
+MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MODIFY
+EVENT = struct.Struct("iIII")
+
+class Inotify:
+    def __init__(self, root):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify は Linux のみ")
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.root = Path(root)
+        self.dirs = {}  # wd -> Path
+        for d, subdirs, _ in os.walk(self.root):
+            subdirs[:] = [s for s in subdirs if not s.startswith(".")]
+            self.add(Path(d))
+
+    def add(self, d):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(d), MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {d}")
+        self.dirs[wd] = d
+
+    def read(self, timeout):
+        """timeout 秒以内に来たイベントの絶対パス集合。タイムアウトなら空集合。"""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        buf = os.read(self.fd, 65536)
+        out, i = set(), 0
+        while i < len(buf):
+            wd, mask, _, n = EVENT.unpack_from(buf, i)
+            name = buf[i + EVENT.size:i + EVENT.size + n].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            i += EVENT.size + n
+            if mask & IN_Q_OVERFLOW:
+                out.add(None)  # 取りこぼし：呼び出し側で全体を見直す
+                continue
+            base = self.dirs.get(wd)
+            if base is None:
+                continue
+            p = base / name if name else base
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and not name.startswith("."):
+                # 新しい記事フォルダ：監視を足し、監視前に置かれた中身も変更として拾う
+                for d, subdirs, files in os.walk(p):
+                    subdirs[:] = [s for s in subdirs if not s.startswith(".")]
+                    self.add(Path(d))
+                    out.update(Path(d) / f for f in files)
+            if mask & IN_DELETE_SELF:
+                self.dirs.pop(wd, None)
+            out.add(p)
+        return out
+
+class Poller:
+    """inotify が使えないときの代替。interval 秒ごとに (mtime, size) のスナップショットを比べる。"""
+    def __init__(self, root, interval=0.5):
+        self.root, self.interval = Path(root), interval
+        self.snap = self.scan()
+
+    def scan(self):
+        snap = {}
+        for d, subdirs, files in os.walk(self.root):
+            subdirs[:] = [s for s in subdirs if not s.startswith(".")]
+            for f in files:
+                p = Path(d) / f
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                snap[p] = (st.st_mtime_ns, st.st_size)
+        return snap
+
+    def read(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic())))
+            snap = self.scan()
+            changed = {p for p in snap.keys() | self.snap.keys() if snap.get(p) != self.snap.get(p)}
+            self.snap = snap
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+def open_watcher(root, poll=False, interval=0.5):
+    """inotify を試し、ダメならポーリング。戻り値: (watcher, 方式名)"""
+    if not poll:
+        try:
+            return Inotify(root), "inotify"
+        except (OSError, AttributeError) as e:
+            print(f"  inotify が使えないためポーリングに切り替え: {e}")
+    return Poller(root, interval), f"polling {interval}s"
+
+def watch(root, on_change, relevant=lambda rel: True, debounce=0.3, poll=False, interval=0.5):
+    root = Path(root)
+    w, how = open_watcher(root, poll, interval)
+    print(f"watching {root} ({how}, debounce {debounce}s) — Ctrl+C で終了")
+    try:
+        while True:
+            batch = w.read(None)
+            while True:  # 連続保存などのバーストは静かになるまでまとめる
+                more = w.read(debounce)
+                if not more:
+                    break
+                batch |= more
+            if None in batch:
+                rels = {None}
+            else:
+                rels = {p.relative_to(root).as_posix() for p in batch if p != root}
+                rels = {r for r in rels if relevant(r)}
+            if rels:
+                try:
+                    on_change(rels)
+                except Exception:
+                    traceback.print_exc()
+                    print(f"[{time.strftime('%H:%M:%S')}] 更新に失敗（監視は継続）", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\nstopped")
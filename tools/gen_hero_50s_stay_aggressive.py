@@ -4,6 +4,8 @@
 テーマ: 50代が長期の資産形成（新NISA・全世界株式）で前向きに攻める。落ち着いた信頼感、navy×gold。"""
 import os, io, sys
 from pathlib import Path
+from site_writer import SiteWriter
+from quality_search import save_webp
 
 OUT = Path("/Users/satoshioka/mirai-toushi-navi/blog/2026/50s-stay-aggressive/blog_50s-stay-aggressive_header.webp")
 MODEL = "gemini-3-pro-image-preview"
@@ -69,6 +71,5 @@ else:
 img = img.resize((nw, nh), Image.LANCZOS)
 left, top = (nw-tw)//2, (nh-th)//2
 img = img.crop((left, top, left+tw, top+th))
-OUT.parent.mkdir(parents=True, exist_ok=True)
-img.save(OUT, "WEBP", quality=82, method=6)
+save_webp(SiteWriter(), img, OUT, 82, raw=data)
 print(f"[OK] saved {OUT} ({OUT.stat().st_size} bytes, {img.width}x{img.height})")
@@ -3,6 +3,7 @@
 文字・ロゴ・実在UI・人物の顔は出さない編集系ヒーロー写真。"""
 import os, io, sys
 from pathlib import Path
+from site_writer import SiteWriter
 
 OUT = Path("/Users/satoshioka/mirai-toushi-navi/blog/2026/nisa-50s/blog_nisa-50s_header.png")
 MODEL = "gemini-3-pro-image-preview"
@@ -56,6 +57,5 @@ else:
 img = img.resize((nw, nh), Image.LANCZOS)
 left, top = (nw-tw)//2, (nh-th)//2
 img = img.crop((left, top, left+tw, top+th))
-OUT.parent.mkdir(parents=True, exist_ok=True)
-img.save(OUT, "PNG")
+SiteWriter().save_image(img, OUT, "PNG")
 print(f"[OK] saved {OUT} ({OUT.stat().st_size} bytes)")
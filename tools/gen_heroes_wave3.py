@@ -2,6 +2,9 @@
 """第3波: nisa2 / nisa3 / nisa5 のヘッダー写真をGemini画像生成で作成。出力は16:9 WebP。"""
 import os, sys
 from pathlib import Path
+from site_writer import SiteWriter
+from quality_search import save_webp
+from image_decode import open_scaled
 
 ROOT = Path("/Users/satoshioka/mirai-toushi-navi")
 KEY_FILES = [Path("/Users/satoshioka/youtube-project-share/.env"), ROOT / ".env"]
@@ -52,11 +55,11 @@ BASE_RULES = """
 MAXW = 1280
 WEBP_Q = 82
 
-def save_compact_webp(raw_bytes, out_path):
+def save_compact_webp(raw_bytes, out_path, writer=None):
     import io
     from PIL import Image
     out_path = out_path.with_suffix(".webp")
-    img = Image.open(io.BytesIO(raw_bytes))
+    img = open_scaled(io.BytesIO(raw_bytes), MAXW)  # 大きい元画像は縮小デコード
     if img.mode not in ("RGB", "RGBA"):
         img = img.convert("RGB")
     w, h = img.size
@@ -66,7 +69,7 @@ def save_compact_webp(raw_bytes, out_path):
         img = img.crop((0, top, w, top + th))
     if img.width > MAXW:
         img = img.resize((MAXW, round(img.height * MAXW / img.width)), Image.LANCZOS)
-    img.save(out_path, "WEBP", quality=WEBP_Q, method=6)
+    save_webp(writer or SiteWriter(), img, out_path, WEBP_Q, raw=raw_bytes)  # WEBP_QUALITY_TARGET があれば q を探索
     return out_path
 
 def main():
@@ -5,6 +5,7 @@ import time
 from pathlib import Path
 from PIL import Image
 import io
+from site_writer import SiteWriter
 
 ROOT = Path("/Users/satoshioka/mirai-toushi-navi")
 sys.path.append(str(ROOT))
@@ -82,7 +83,7 @@ def main():
     top_bytes = generate_image(client, top_prompt_suffix, REF_IMAGE)
     if top_bytes:
         img = Image.open(io.BytesIO(top_bytes))
-        img.save(TOP_IMAGE_OUT, "PNG")
+        SiteWriter().save_image(img, TOP_IMAGE_OUT, "PNG")
         print(f"SUCCESS: Saved top image to {TOP_IMAGE_OUT} ({len(top_bytes)//1024} KB)\n")
     else:
         print("FAILED to generate top image.\n")
@@ -96,7 +97,7 @@ def main():
     bottom_bytes = generate_image(client, bottom_prompt_suffix, REF_IMAGE)
     if bottom_bytes:
         img = Image.open(io.BytesIO(bottom_bytes))
-        img.save(BOTTOM_IMAGE_OUT, "PNG")
+        SiteWriter().save_image(img, BOTTOM_IMAGE_OUT, "PNG")
         print(f"SUCCESS: Saved bottom image to {BOTTOM_IMAGE_OUT} ({len(bottom_bytes)//1024} KB)\n")
     else:
         print("FAILED to generate bottom image.\n")
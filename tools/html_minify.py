@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""HTML の最小化（ビルダーの出力の最後に通す段、またはサイト全体への一括パス）。
+入力を先頭から1回だけなめるトークンのストリームで、feed() で少しずつ渡しても丸ごと渡しても同じ結果になる。
+- 空白は「描画が変わらない」ものだけ詰める。テキスト中の空白の連続は1文字（改行を含めば改行、なければ半角空白）にし、
+  消すのはブロックの開始直後・終了直前、<br> の前後、<head> の中、SVG の <text> 以外、表の行・セルの間だけ。
+  日本語の「今日は\\n明日は」の改行はブラウザでは空白として描画されるので消さない。全角空白（U+3000）は空白扱いしない。
+  ブロック要素どうしの間（</div>\\n<div>）は inline-block で並べている箇所があるので1文字残す
+- <head> の中はタグの間の改行を残す（image_dims の og:image など、行頭で探す道具があるため）
+- コメントは消す（IE の条件付きコメント <!--[if …]> … <![endif]--> は残す）
+- 真偽属性は名前だけにする（async="async"・disabled="" → async・disabled）。タグの中の空白は1つに
+- <style> と style="" は CSS を詰め、<script type="application/ld+json"> は JSON を詰める（読めなければそのまま）
+- <pre>・<textarea>・<script>（JSON-LD 以外）の中身は1バイトも変えない
+  python3 tools/html_minify.py [--dry-run] [--json report.json] [ページ ...]
+ページを省くとサイト全体（check_links.pages() の .html）。報告はページごとの削減バイト（生と gzip 後）。
+"""
+import re, sys, json, time, zlib, argparse, statistics
+from pathlib import Path
+from check_links import pages
+from site_writer import SiteWriter
+
+ROOT = Path(__file__).resolve().parent.parent
+# 中身で改行が終わる要素（開始直後・終了直前の空白は行頭・行末なので描画されない）
+BLOCK = {"html", "head", "body", "div", "p", "ul", "ol", "li", "dl", "dt", "dd", "h1", "h2", "h3", "h4", "h5", "h6",
+         "section", "article", "aside", "header", "footer", "nav", "main", "figure", "figcaption", "blockquote",
+         "table", "caption", "thead", "tbody", "tfoot", "tr", "td", "th", "form", "fieldset", "legend",
+         "details", "summary", "address", "hr"}
+TABLE = {"table", "caption", "colgroup", "col", "thead", "tbody", "tfoot", "tr", "td", "th"}
+TOP = {"html", "head", "body", "!"}          # "!" = <!DOCTYPE> 等の宣言
+SVG_TEXT = {"text", "tspan", "textPath", "title", "desc"}
+RAW = {"script", "style", "textarea"}       # 中身はタグとして読まない要素
+BOOLEAN = {"allowfullscreen", "async", "autofocus", "autoplay", "checked", "controls", "default", "defer",
+           "disabled", "formnovalidate", "hidden", "inert", "ismap", "itemscope", "loop", "multiple", "muted",
+           "nomodule", "novalidate", "open", "playsinline", "readonly", "required", "reversed", "selected"}
+
+TAG_RE = re.compile(r"</?([a-zA-Z][\w:-]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>")
+NAME_RE = re.compile(r"</?([a-zA-Z][\w:-]*)[\s/>]")
+PARTIAL_RE = re.compile(r"</?[a-zA-Z]?[\w:-]*")
+ATTR_RE = re.compile(r"""([^\s"'>/=]+)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s"'>]+))?|(/)""")
+WS = " \t\n\r\f"
+WS_RE = re.compile(r"[ \t\n\r\f]+")
+TYPE_RE = re.compile(r"""\stype\s*=\s*["']?([^"'\s>]+)""", re.I)
+CONDITIONAL = ("<!--[if", "<!--<![endif]", "<!--<!")
+
+CSS_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)|([ \t\n\r\f]+)|(url\([^)"']*\))""", re.S)
+CSS_NO_SPACE_BEFORE = set("{};,>~)!")
+CSS_NO_SPACE_AFTER = set("{};,:>~(")
+
+def gz(data):
+    return len(zlib.compress(data, 6)) + 18
+
+def minify_css(css):
+    """コメントと余分な空白を落とす（文字列・url() の中は触らない）。セレクタの「a :hover」を壊さないよう : の前の空白は残す。"""
+    out, pos = [], 0
+    for m in CSS_RE.finditer(css):
+        out.append(css[pos:m.start()])
+        pos = m.end()
+        if m.group(2):
+            if m.group(2).startswith("/*!"):
+                out.append(m.group(2))
+            continue
+        if m.group(3):
+            prev = next((s[-1] for s in reversed(out) if s), "")
+            nxt = css[pos:pos + 1]
+            if prev and nxt and prev not in CSS_NO_SPACE_AFTER and prev not in WS and nxt not in CSS_NO_SPACE_BEFORE:
+                out.append(" ")
+            continue
+        out.append(m.group(0))
+    out.append(css[pos:])
+    return "".join(out).replace(";}", "}").strip(WS + ";")
+
+def minify_json(text):
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+
+class Minifier:
+    """m = Minifier(); out = m.feed(chunk) + … + m.close()。feed() は確定した分だけ返し、続きが要る末尾は持ち越す。"""
+    def __init__(self):
+        self.buf = ""
+        self.text = []          # まだ書き出していないテキスト（間のコメントは消えるのでまとめてから詰める）
+        self.prev = ("!", False)  # 直前のタグ (名前, 閉じタグか)。文書の頭は宣言扱い
+        self.in_head = False
+        self.pre = self.svg = self.svg_text = 0
+
+    # ---- 空白の判定
+    def _edge(self, tag, side):
+        """tag の側の空白を消してよいか。side="after": tag の後ろ、"before": tag の手前。"""
+        if tag is None:
+            return True
+        name, closing = tag
+        if name == "br" or name in TOP or self.in_head:
+            return True
+        if self.svg and not self.svg_text:
+            return True
+        return name in BLOCK and closing == (side == "before")
+
+    def _ws(self, ws, prev, nxt):
+        """タグとタグの間の空白だけのテキスト。"""
+        if nxt is None:
+            return "\n" if "\n" in ws else ""  # ファイル末尾の改行は残す
+        if self._edge(prev, "after") or self._edge(nxt, "before"):
+            if (prev[0] in TOP or nxt[0] in TOP or self.in_head) and "\n" in ws:
+                return "\n"
+            return ""
+        if prev and nxt and prev[0] in TABLE and nxt[0] in TABLE:
+            return ""
+        return "\n" if "\n" in ws else " "
+
+    def _flush(self, nxt):
+        text = "".join(self.text)
+        self.text = []
+        if not text:
+            return ""
+        if self.pre:
+            return text
+        if not text.strip(WS):
+            return self._ws(text, self.prev, nxt)
+        body = WS_RE.sub(lambda m: "\n" if "\n" in m.group(0) else " ", text)
+        if body[0] in WS and self._edge(self.prev, "after"):
+            body = body[1:]
+        if body[-1] in WS and self._edge(nxt, "before"):
+            body = body[:-1]
+        return body
+
+    # ---- タグ
+    def _tag(self, m):
+        raw, name, attrs = m.group(0), m.group(1), m.group(2)
+        if raw.startswith("</"):
+            return f"</{name}>"
+        out, html_el = [name], not self.svg
+        for a in ATTR_RE.finditer(attrs):
+            key, val, slash = a.groups()
+            if slash:
+                out.append("/")
+                continue
+            low = key.lower()
+            if val is None or (html_el and low in BOOLEAN and val.strip("\"'").lower() in ("", low)):
+                out.append(key)
+            elif low == "style" and val[0] == '"':
+                out.append(f'{key}="{minify_css(val[1:-1])}"')
+            else:
+                out.append(f"{key}={val}")
+        s = " ".join(out)
+        if s.endswith(" /") and ("=" not in out[-2] or out[-2][-1] in "\"'"):  # 引用符なしの値の直後は空白が要る
+            s = s[:-2] + "/"
+        return f"<{s}>"
+
+    def _track(self, name, closing):
+        low = name.lower()
+        step = -1 if closing else 1
+        if low == "head":
+            self.in_head = not closing
+        elif low == "body":
+            self.in_head = False
+        elif low == "pre":
+            self.pre = max(0, self.pre + step)
+        elif low == "svg":
+            self.svg = max(0, self.svg + step)
+        elif self.svg and name in SVG_TEXT:
+            self.svg_text = max(0, self.svg_text + step)
+
+    # ---- 本体
+    def feed(self, chunk, final=False):
+        self.buf += chunk
+        buf, pos, out = self.buf, 0, []
+        while pos < len(buf):
+            lt = buf.find("<", pos)
+            if lt < 0:
+                if not final:
+                    break
+                self.text.append(buf[pos:])
+                pos = len(buf)
+                break
+            if lt > pos:
+                self.text.append(buf[pos:lt])
+                pos = lt
+            if buf.startswith("<!--", pos):
+                end = buf.find("-->", pos + 4)
+                if end < 0:
+                    if not final:
+                        break
+                    end = len(buf) - 3
+                comment = buf[pos:end + 3]
+                pos = end + 3
+                if comment.startswith(CONDITIONAL):
+                    out.append(self._flush(("!", False)))
+                    out.append(comment)
+                    self.prev = ("!", False)
+                continue
+            if buf.startswith("<!", pos) or buf.startswith("<?", pos):
+                end = buf.find(">", pos)
+                if end < 0:
+                    if not final:
+                        break
+                    end = len(buf) - 1
+                out.append(self._flush(("!", False)))
+                out.append(buf[pos:end + 1])
+                self.prev = ("!", False)
+                pos = end + 1
+                continue
+            m = TAG_RE.match(buf, pos)
+            if not m:
+                if not final and (NAME_RE.match(buf, pos) or PARTIAL_RE.fullmatch(buf, pos)):
+                    break  # タグの途中で切れている（続きを待つ）
+                self.text.append("<")  # タグではない「<」
+                pos += 1
+                continue
+            name = m.group(1)
+            low = name.lower()
+            closing = buf[pos + 1] == "/"
+            if not closing and low in RAW:
+                end = re.compile(rf"</{low}\s*>", re.I).search(buf, m.end())
+                if not end:
+                    if not final:
+                        break
+                    end = re.compile(r"\Z").search(buf)
+                out.append(self._flush((low, False)))
+                out.append(self._tag(m) + self._raw(low, m.group(2), buf[m.end():end.start()]) + buf[end.start():end.end()])
+                self.prev = (low, True)
+                pos = end.end()
+                continue
+            out.append(self._flush((low, closing)))
+            out.append(buf[pos:m.end()] if self.pre else self._tag(m))
+            self._track(name, closing)
+            self.prev = (low, closing)
+            pos = m.end()
+        self.buf = buf[pos:]
+        if final:
+            out.append(self._flush(None))
+        return "".join(out)
+
+    def _raw(self, low, attrs, body):
+        if low == "style":
+            return minify_css(body)
+        if low == "script":
+            t = TYPE_RE.search(attrs)
+            if t and t.group(1).lower() == "application/ld+json":
+                return minify_json(body)
+        return body  # その他の <script>・<textarea> はそのまま
+
+    def close(self):
+        return self.feed("", final=True)
+
+def minify(html):
+    m = Minifier()
+    return m.feed(html) + m.close()
+
+def minify_stream(chunks):
+    """文字列の断片の iterable → 最小化した断片のジェネレータ（ファイルを丸ごと持たずに流す用）。"""
+    m = Minifier()
+    for c in chunks:
+        if out := m.feed(c):
+            yield out
+    if out := m.close():
+        yield out
+
+def run(w, targets, root=ROOT, dry_run=False):
+    """戻り値: [{page, before, after, before_gz, after_gz}]"""
+    rows = []
+    for p in targets:
+        text = p.read_text(encoding="utf-8")
+        new = minify(text)
+        before, after = text.encode("utf-8"), new.encode("utf-8")
+        rows.append({"page": p.relative_to(root).as_posix(), "before": len(before), "after": len(after),
+                     "before_gz": gz(before), "after_gz": gz(after)})
+        if not dry_run:
+            w.write_text(p, new)
+    return rows
+
+def main():
+    ap = argparse.ArgumentParser(description="HTML を描画の変わらない範囲で最小化する")
+    ap.add_argument("pages", nargs="*", help="対象ページ（省略時はサイト全体）")
+    ap.add_argument("--dry-run", action="store_true", help="報告だけ（書き換えない）")
+    ap.add_argument("--json", help="ページごとの結果を JSON で保存")
+    args = ap.parse_args()
+    t0 = time.perf_counter()
+    targets = [Path(p).resolve() for p in args.pages] or [p for p in pages(ROOT) if p.suffix == ".html"]
+    w = SiteWriter(ROOT)
+    rows = run(w, targets, ROOT, args.dry_run)
+    for x in rows:
+        if x["before"] != x["after"]:
+            print(f"  {x['page']}: {x['before']:,} -> {x['after']:,}B (-{x['before'] - x['after']:,}B / "
+                  f"gzip {x['before_gz']:,} -> {x['after_gz']:,}B)")
+    if rows:
+        saved = [x["before"] - x["after"] for x in rows]
+        saved_gz = [x["before_gz"] - x["after_gz"] for x in rows]
+        before = sum(x["before"] for x in rows)
+        print(f"{len(rows)} pages: {before:,} -> {before - sum(saved):,}B (-{sum(saved) / before:.1%}), "
+              f"median {statistics.median(saved):,.0f}B/page (gzip {statistics.median(saved_gz):,.0f}B), "
+              f"total gzip -{sum(saved_gz):,}B")
+    print(f"  ({round((time.perf_counter() - t0) * 1000)}ms)" + ("" if args.dry_run else f"  files: {w.summary()}"))
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, ensure_ascii=False, indent=1), encoding="utf-8")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
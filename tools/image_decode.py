@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""大きな元画像を「縮小後に必要なぶん」だけの解像度でデコードする。
+- JPEG は draft モードで DCT 段階の 1/2・1/4・1/8 縮小デコード（全画素を展開しない）
+- それ以外（PNG 等）は全体をデコードした直後に Image.reduce で整数倍の箱縮小をかけ、大きい配列をすぐ手放す
+どちらも最終幅の REDUCING_GAP 倍以上は残すので、仕上げの LANCZOS の画質は全解像度からと見分けがつかない
+（Pillow の thumbnail(reducing_gap=2.0) と同じ考え方）。
+並列エンコードのメモリ上限は decode_cost() の見積もりで imap_bounded が守る。
+"""
+import os
+from PIL import Image
+
+REDUCING_GAP = 2.0
+REDUCIBLE = {"RGB", "RGBA", "L", "LA"}
+
+def _draft_scale(w, floor):
+    """JPEG draft が選ぶ縮小率（1/2・1/4・1/8 のうち幅が floor 以上を保つ最大）。"""
+    scale = 1
+    while scale < 8 and w / (scale * 2) >= floor:
+        scale *= 2
+    return scale
+
+def open_scaled(fp, maxw, gap=REDUCING_GAP):
+    """fp を開き、幅 maxw への縮小に要るぶん（maxw*gap 以上）まで縮めた load 済み画像を返す。
+    元が十分小さければ普通に開いたのと同じ。最終的な resize は呼び出し側で行う。"""
+    im = Image.open(fp)
+    floor = maxw * gap
+    if im.width <= floor:
+        return im
+    if im.format == "JPEG":
+        im.draft(None, (int(floor), int(im.height * floor / im.width)))
+    im.load()
+    factor = int(im.width // floor)
+    if factor >= 2:
+        if im.mode not in REDUCIBLE:
+            im = im.convert("RGBA" if "A" in im.mode else "RGB")
+        im = im.reduce(factor)
+    return im
+
+def decode_cost(p, maxw, gap=REDUCING_GAP):
+    """open_scaled(p, maxw) のピークメモリ見積もり（バイト。ヘッダだけ読む）。
+    デコード結果と、変換・縮小で並ぶもう1枚ぶん（RGBA 換算）。"""
+    with Image.open(p) as im:
+        w, h = im.size
+        if im.format == "JPEG" and w > maxw * gap:
+            s = _draft_scale(w, maxw * gap)
+            w, h = -(-w // s), -(-h // s)
+    return w * h * 4 * 2
+
+def default_budget():
+    """並列デコードに使ってよいメモリの既定値（物理メモリの半分。取れなければ 2GB）。"""
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 2
+    except (ValueError, OSError, AttributeError):
+        return 2 << 30
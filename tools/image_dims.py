@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""HTML が宣言する画像サイズを実ファイルに合わせる（ビルダーの決め打ち 1200x675 / 1024x576 等のずれ直し）。
+実寸は画像のヘッダだけ読んで取る（PIL の遅延オープン。画素はデコードしない。SVG は width/height/viewBox）。
+JPEG の EXIF 回転（5〜8）はブラウザと同じく縦横を入れ替えて扱う。
+- <img width height>: 無ければ実寸を足す／片方だけなら実寸の比で足す／実寸より大きく宣言していれば実寸に／
+  比がずれていれば width を残して height を直す（実寸より小さい同じ比の宣言は HiDPI 用の表示サイズなのでそのまま）
+- og:image が自サイトの画像なら og:image:width / og:image:height を実寸に（無ければ og:image の直後に足す）
+  python3 tools/image_dims.py [--dry-run]
+記事エンジン（article_engine.py）と auto_blog_generator.py も書き出し前に fix_html() を通す。
+終了コード: --dry-run でずれが見つかれば 1。
+"""
+import re, sys, time, argparse
+from pathlib import Path
+from PIL import Image
+from check_links import resolve, pages
+from site_writer import SiteWriter
+
+ROOT = Path(__file__).resolve().parent.parent
+IMG_RE = re.compile(r"<img\b[^>]*>")
+SRC_RE = re.compile(r'\ssrc="([^"]+)"')
+DIM_RES = {k: re.compile(rf'\s{k}="(\d+)"') for k in ("width", "height")}
+OG_RE = re.compile(r'^([ \t]*)(<meta\b[^>]*\bproperty="og:image"[^>]*>)', re.M)
+OG_DIM_RE = re.compile(r'(<meta\b[^>]*\bproperty="og:image:(width|height)"[^>]*\bcontent=")(\d*)(")')
+CONTENT_RE = re.compile(r'\bcontent="([^"]*)"')
+SVG_ROOT_RE = re.compile(r"<svg\b[^>]*>", re.S)
+SVG_LEN_RE = {k: re.compile(rf'\s{k}="([\d.]+)(?:px)?"') for k in ("width", "height")}
+VIEWBOX_RE = re.compile(r'\sviewBox="[-\d.]+[\s,]+[-\d.]+[\s,]+([\d.]+)[\s,]+([\d.]+)"')
+ASPECT_TOL = 0.01
+ROTATED = {5, 6, 7, 8}
+
+def svg_size(p):
+    m = SVG_ROOT_RE.search(p.read_text(encoding="utf-8", errors="ignore")[:4096])
+    if not m:
+        return None
+    w, h = (SVG_LEN_RE[k].search(m.group(0)) for k in ("width", "height"))
+    if w and h:
+        return round(float(w.group(1))), round(float(h.group(1)))
+    vb = VIEWBOX_RE.search(m.group(0))
+    return (round(float(vb.group(1))), round(float(vb.group(2)))) if vb else None
+
+class Sizes:
+    """パス -> (幅, 高さ) or None。1回の実行の中で同じ画像は1回だけ読む。"""
+    def __init__(self):
+        self.sizes = {}
+
+    def __call__(self, p):
+        if p not in self.sizes:
+            self.sizes[p] = self._read(p)
+        return self.sizes[p]
+
+    @staticmethod
+    def _read(p):
+        if not p.is_file():
+            return None
+        if p.suffix.lower() == ".svg":
+            return svg_size(p)
+        try:
+            with Image.open(p) as im:
+                w, h = im.size
+                if im.format == "JPEG" and im.getexif().get(0x0112) in ROTATED:
+                    w, h = h, w
+                return w, h
+        except OSError:
+            return None
+
+def local_file(page_rel, url, root):
+    rel = resolve(page_rel, url)
+    return root / rel if rel and not rel.endswith("/") else None
+
+def fix_img(tag, actual):
+    """戻り値: (新しいタグ, (旧w, 旧h, 新w, 新h) or None)"""
+    W, H = actual
+    cur = {k: (int(m.group(1)) if (m := r.search(tag)) else None) for k, r in DIM_RES.items()}
+    w, h = cur["width"], cur["height"]
+    if w is None and h is None:
+        nw, nh = W, H
+    elif h is None:
+        nw, nh = w, round(w * H / W)
+    elif w is None:
+        nw, nh = round(h * W / H), h
+    elif w > W or h > H:
+        nw, nh = W, H
+    elif h == 0 or abs(w / h - W / H) > ASPECT_TOL * W / H:
+        nw, nh = w, round(w * H / W)
+    else:
+        return tag, None
+    for k, v in (("width", nw), ("height", nh)):
+        if DIM_RES[k].search(tag):
+            tag = DIM_RES[k].sub(f' {k}="{v}"', tag, count=1)
+        else:
+            end = len(tag) - (2 if tag.endswith("/>") else 1)
+            tag = tag[:end].rstrip() + f' {k}="{v}"' + tag[end:]
+    return tag, (w, h, nw, nh)
+
+def fix_html(html, page_rel, root=ROOT, sizes=None):
+    """戻り値: (直した html, ずれの説明のリスト)"""
+    sizes = sizes or Sizes()
+    notes = []
+    def img(m):
+        src = SRC_RE.search(m.group(0))
+        p = src and local_file(page_rel, src.group(1), root)
+        actual = p and sizes(p)
+        if not actual:
+            return m.group(0)
+        tag, change = fix_img(m.group(0), actual)
+        if change:
+            w, h, nw, nh = change
+            notes.append(f"<img {src.group(1)}> {w or '-'}x{h or '-'} -> {nw}x{nh}（実寸 {actual[0]}x{actual[1]}）")
+        return tag
+    html = IMG_RE.sub(img, html)
+    og = OG_RE.search(html)
+    url = og and CONTENT_RE.search(og.group(2))
+    p = url and local_file(page_rel, url.group(1), root)
+    actual = p and sizes(p)
+    if actual:
+        want = {"width": actual[0], "height": actual[1]}
+        found = {}
+        def dim(m):
+            found[m.group(2)] = m.group(3)
+            return m.group(1) + str(want[m.group(2)]) + m.group(4)
+        html = OG_DIM_RE.sub(dim, html)
+        missing = [k for k in want if k not in found]
+        if missing:
+            og = OG_RE.search(html)
+            extra = "".join(f'\n{og.group(1)}<meta property="og:image:{k}" content="{want[k]}">' for k in missing)
+            html = html[:og.end()] + extra + html[og.end():]
+        if any(found.get(k) != str(v) for k, v in want.items()):
+            notes.append(f"og:image {found.get('width', '-')}x{found.get('height', '-')} -> {actual[0]}x{actual[1]}")
+    return html, notes
+
+def main():
+    ap = argparse.ArgumentParser(description="HTML の画像サイズ宣言（width/height・og:image:*）を実寸に合わせる")
+    ap.add_argument("--dry-run", action="store_true", help="ずれの表示だけ（書き換えない）")
+    args = ap.parse_args()
+    t0 = time.perf_counter()
+    w = SiteWriter(ROOT)
+    sizes = Sizes()
+    npages = nfix = 0
+    for page in (p for p in pages(ROOT) if p.suffix == ".html"):
+        rel = page.relative_to(ROOT).as_posix()
+        text = page.read_text(encoding="utf-8")
+        new, notes = fix_html(text, rel, ROOT, sizes)
+        if notes:
+            npages += 1
+            nfix += len(notes)
+            for n in notes:
+                print(f"  {rel}: {n}")
+            if not args.dry_run:
+                w.write_text(page, new)
+    ms = round((time.perf_counter() - t0) * 1000)
+    print(f"{nfix} mismatches in {npages} pages / {len(sizes.sizes)} images read ({ms}ms)")
+    if not args.dry_run:
+        print(f"  files: {w.summary()}")
+    return 1 if args.dry_run and nfix else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""画像最適化の作業台帳（.cache/image_manifest.json）。
+出力ファイルごとに {src: 元画像の sha1, settings: エンコード設定, out: 出力の sha1, mtime, size} を持つ。
+- 出力の stat（mtime_ns・サイズ）と設定が記録どおりなら読まずに「済み」と判定（再実行は stat だけ）
+- stat が違っても出力の中身ハッシュが記録どおりなら済み（touch・チェックアウトし直し）
+- 元画像の中身か設定が変わったときだけ再エンコードする
+書き込みは file_cache.save と同じ一時ファイル＋os.replace。
+"""
+import json, hashlib
+from pathlib import Path
+import file_cache
+
+VERSION = 1
+
+def sha1(data):
+    return hashlib.sha1(data).hexdigest()
+
+def settings_key(settings):
+    return json.dumps(settings, sort_keys=True, separators=(",", ":"))
+
+class ImageManifest:
+    def __init__(self, path, root):
+        self.path, self.root = Path(path), Path(root)
+        self.entries = file_cache.load(self.path, VERSION)
+        self.dirty = False
+
+    def _key(self, out):
+        return Path(out).relative_to(self.root).as_posix()
+
+    def get(self, out):
+        return self.entries.get(self._key(out))
+
+    def done(self, out, settings, src=None):
+        """out が settings（と、渡されれば元画像ハッシュ src）で作った最新版のままか。"""
+        ent = self.get(out)
+        if not ent or ent["settings"] != settings_key(settings) or (src is not None and ent["src"] != src):
+            return False
+        try:
+            st = Path(out).stat()
+        except OSError:
+            return False
+        if (ent["mtime"], ent["size"]) == (st.st_mtime_ns, st.st_size):
+            return True
+        if ent["size"] != st.st_size or sha1(Path(out).read_bytes()) != ent["out"]:
+            return False
+        ent["mtime"] = st.st_mtime_ns
+        self.dirty = True
+        return True
+
+    def record(self, out, src, settings, data):
+        st = Path(out).stat()
+        self.entries[self._key(out)] = {"src": src, "settings": settings_key(settings), "out": sha1(data),
+                                        "mtime": st.st_mtime_ns, "size": st.st_size}
+        self.dirty = True
+
+    def outputs(self, op):
+        """settings の op が一致するエントリの出力 Path 一覧（このツールが作ったファイルの掃除用）。"""
+        return [self.root / k for k, ent in self.entries.items() if json.loads(ent["settings"]).get("op") == op]
+
+    def forget(self, out):
+        if self.entries.pop(self._key(out), None) is not None:
+            self.dirty = True
+
+    def prune(self):
+        """出力が消えたエントリを落とす。戻り値: 落とした件数"""
+        gone = [k for k in self.entries if not (self.root / k).exists()]
+        for k in gone:
+            del self.entries[k]
+        self.dirty |= bool(gone)
+        return len(gone)
+
+    def save(self):
+        if self.dirty:
+            file_cache.save(self.path, VERSION, self.entries)
+            self.dirty = False
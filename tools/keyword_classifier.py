@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""キーワード → カテゴリ判定の共通分類器（build_blog_index.detect() と auto_blog_generator.determine_category() が共有）。
+[(ラベル, [キーワード…]), …] を上のバケットから順に in で調べ、最初に当たったバケットのラベルを返す。
+正規表現のトライ・バケットごとの選択（|）にもしてみたが、タイトル程度の短い文字列でも記事本文でも
+str の in を並べる方が速かった（python3 -m bench.bench_classifier）ので、判定は素直なループのまま。
+大文字小文字の正規化（.lower()）は呼び出し側で行うこと。
+"""
+
+def compile_classifier(buckets, default):
+    """buckets=[(label, [kw, …]), …] から classify(text) -> label を作る（空のキーワードは無視）。"""
+    table = [(label, tuple(kw for kw in kws if kw)) for label, kws in buckets]
+
+    def classify(text):
+        for label, kws in table:
+            for kw in kws:
+                if kw in text:
+                    return label
+        return default
+
+    return classify
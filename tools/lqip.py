@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""記事ヒーロー画像の低画質プレースホルダ（LQIP）と代表色。
+- 16px 幅に縮めて軽くぼかした WebP を base64 の data URI に（200 バイト前後）
+- 代表色は 64px サムネイルを 8 色に減色していちばん面積の多い色
+- <div class="hero-image"> に style="background:<代表色> url(data:…) center/cover no-repeat" として焼き込む
+  → 本物の画像が届くまで、ぼかした絵（古いブラウザでも代表色）が枠を埋める。画像が読み込まれれば上に重なって消える
+- 結果は画像の sha1 ごとに .cache/lqip.json にキャッシュ（同じ画像なら2回目からデコードもしない）
+焼き込んだ div には data-lqip="<sha1 先頭10桁>" を付け、画像が差し替わったら作り直す（何度実行しても同じ結果）。
+optimize_blog_images.py の 5) と記事エンジン（article_engine.py）から使う。
+"""
+import io, os, re, base64, hashlib
+from pathlib import Path
+from PIL import Image, ImageFilter
+import file_cache
+from image_decode import open_scaled
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE = ROOT / ".cache" / "lqip.json"
+CACHE_VERSION = 1
+LQIP_W = 16
+LQIP_Q = 40
+THUMB = 64
+COLORS = 8
+HERO_RE = re.compile(r'<div class="hero-image"(?P<attrs>[^>]*)>(?P<body>\s*(?:<picture>.*?</picture>|<img\b[^>]*>))', re.S)
+SRC_RE = re.compile(r'<img\b[^>]*?\bsrc="([^"]+)"')
+OURS_RE = re.compile(r'\s(?:style|data-lqip)="[^"]*"')
+
+def compute(raw):
+    """戻り値: {"color": "#rrggbb", "uri": "data:image/webp;base64,…"}"""
+    with open_scaled(io.BytesIO(raw), THUMB) as im:
+        im = im.convert("RGB")
+        thumb = im.resize((THUMB, max(1, round(im.height * THUMB / im.width))), Image.BOX)
+    q = thumb.quantize(COLORS, method=Image.Quantize.FASTOCTREE)
+    _, idx = max(q.getcolors())
+    r, g, b = q.getpalette()[idx * 3: idx * 3 + 3]
+    tiny = thumb.resize((LQIP_W, max(1, round(thumb.height * LQIP_W / thumb.width))), Image.BOX)
+    buf = io.BytesIO()
+    tiny.filter(ImageFilter.GaussianBlur(0.6)).save(buf, "WEBP", quality=LQIP_Q, method=6)
+    return {"color": f"#{r:02x}{g:02x}{b:02x}", "uri": "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode()}
+
+class Placeholders:
+    """画像の sha1 -> {color, uri}。prune=True で save すると、今回使わなかったエントリを落とす。"""
+    def __init__(self, path=CACHE):
+        self.path = Path(path)
+        self.entries = file_cache.load(self.path, CACHE_VERSION)
+        self.used, self.computed = set(), 0
+
+    def get(self, p):
+        """戻り値: (sha1, {color, uri})"""
+        raw = Path(p).read_bytes()
+        digest = hashlib.sha1(raw).hexdigest()
+        if digest not in self.entries:
+            self.entries[digest] = compute(raw)
+            self.computed += 1
+        self.used.add(digest)
+        return digest, self.entries[digest]
+
+    def save(self, prune=False):
+        entries = {k: v for k, v in self.entries.items() if k in self.used} if prune else self.entries
+        if entries != file_cache.load(self.path, CACHE_VERSION):
+            file_cache.save(self.path, CACHE_VERSION, entries)
+
+def style(info):
+    return f"background:{info['color']} url({info['uri']}) center/cover no-repeat"
+
+def _resolve(page_dir, src):
+    if "://" in src or src.startswith(("//", "data:")):
+        return None
+    path = src.split("?")[0]
+    p = ROOT / path.lstrip("/") if path.startswith("/") else Path(os.path.normpath(Path(page_dir) / path))
+    return p if p.is_file() else None
+
+def inline_heroes(html, page_dir, cache, resolve=None):
+    """html 内の <div class="hero-image"> にプレースホルダを焼き込む。resolve(src) -> Path|None（既定は page_dir 基準）。"""
+    resolve = resolve or (lambda src: _resolve(page_dir, src))
+    def repl(m):
+        src = SRC_RE.search(m.group("body"))
+        p = src and resolve(src.group(1))
+        attrs = m.group("attrs")
+        if not p or ("style=" in attrs and "data-lqip=" not in attrs):
+            return m.group(0)  # 画像が無い・手書きの style があるものは触らない
+        digest, info = cache.get(p)
+        attrs = OURS_RE.sub("", attrs)
+        return f'<div class="hero-image"{attrs} style="{style(info)}" data-lqip="{digest[:10]}">{m.group("body")}'
+    return HERO_RE.sub(repl, html)
@@ -2,95 +2,442 @@
 """ブログ画像の容量最適化（一括）。
 1) プロフィール画像(blog_profile_ryo.jpg)を 144x144 にリサイズ（.jpgのまま=HTML変更不要）
 2) 250KB超の写真系ラスター(PNG/JPG)を WebP化（最大幅1280・q82）、元ファイル削除
-3) blog配下の全HTML と sitemap.xml の参照(basename)を .png/.jpg -> .webp に一括置換
+   blog/ に加えて images/ も対象
+3) blog・ルート直下・app の HTML、css、sitemap.xml の参照(basename)を .png/.jpg -> .webp に置換
+   （basename -> 参照ファイル の逆引きで該当ファイルだけ開き、1本の正規表現で1パス。MIME は該当タグだけ直す）
+4) 記事の <img> が指す画像に幅違い（360/720/1280w）の AVIF・WebP を作り、<img> を <picture>/srcset に包む
+   （og:image・JSON-LD は元の1枚のまま。元画像と設定が台帳どおりなら作り直さない）
+   sizes は <img> の width 属性（無ければ元画像の幅）から見積もり、本文幅 672px で頭打ち。
+   使われなくなった幅違いの掃除は、台帳に記録された自分の出力だけが対象
+5) 記事のヒーロー（<div class="hero-image">）にぼかしプレースホルダと代表色を焼き込む（lqip.py。画像ハッシュでキャッシュ）
+書き込みはすべて SiteWriter 経由（中身が同じなら触らない・アトミック置換）。
+--jobs N で 2) のエンコードをプロセス並列化（書き込み・ログ・置換マップは元の順序のまま親プロセスで行う）。
+大きな元画像は image_decode.open_scaled で縮小デコード（JPEG draft / Image.reduce）してから LANCZOS で仕上げる。
+並列時に同時にデコードする画像の見積もりメモリは --max-mem（既定は物理メモリの半分）以内に抑える。
+元画像ハッシュ・設定・出力ハッシュを .cache/image_manifest.json に記録し、済んだ画像は stat だけで飛ばす
+（設定か元画像が変わったときだけ作り直す＝JPEG の再圧縮劣化が積み重ならない）。
+--quality-target ssim:0.95 / kb:150 で 2) の q を画像ごとに二分探索（quality_search.py。決めた q は元画像ハッシュごとにキャッシュ）。
+  幅違い（4）は固定 q のまま。
 """
-import sys
+import io, os, re, sys, argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from PIL import Image, ImageOps
+from site_writer import SiteWriter
+from image_manifest import ImageManifest, sha1
+import quality_search
+from image_decode import open_scaled, decode_cost, default_budget
+import lqip
+from quality_search import QualityCache
+import file_cache
 
 ROOT = Path("/Users/satoshioka/mirai-toushi-navi")
 BLOG = ROOT / "blog"
+IMAGE_DIRS = [BLOG, ROOT / "images"]   # 2) の WebP 化対象（images/ はトップ・料金ページ等のキャラクター画像）
 MAXW = 1280
 WEBP_Q = 82
 SIZE_THRESHOLD = 256 * 1024
 PROFILE_NAME = "blog_profile_ryo.jpg"
 PROFILE_PX = 144
+PROFILE_Q = 85
+WEBP_METHOD = 6
+# 台帳に記録する設定。ここが変わった画像だけ作り直す。
+PROFILE_SETTINGS = {"op": "profile", "px": PROFILE_PX, "quality": PROFILE_Q}
+WEBP_SETTINGS = {"op": "webp", "maxw": MAXW, "quality": WEBP_Q, "method": WEBP_METHOD}
+MANIFEST = ROOT / ".cache" / "image_manifest.json"
+# レスポンシブ用の幅違い（記事本文 .container は最大 720px・左右 padding 24px、スマホは 16px）
+VARIANT_WIDTHS = (360, 720, 1280)
+VARIANT_FORMATS = ("avif", "webp")   # <source> の並び順＝ブラウザが試す順
+VARIANT_Q = {"avif": 55, "webp": WEBP_Q}
+SIZES = "(max-width: 720px) calc(100vw - 32px), 672px"   # 本文幅いっぱいに出る画像
+CONTENT_W = 672                      # 本文の最大幅（720 - padding 24*2）
+PHONE_GUTTER = 32                    # スマホの左右 padding 合計
+WIDTH_RE = re.compile(r'\bwidth="(\d+)"')
+RASTER_EXTS = {".webp", ".jpg", ".jpeg", ".png"}
+GENERATED_DIRS = {"category", "search"}
+VARIANT_RE = re.compile(r"-\d+w\.(webp|avif)$")
+IMG_RE = re.compile(r"<img\b[^>]*>")
+SRC_RE = re.compile(r'\bsrc="([^"]+)"')
+IMAGE_NAME_RE = re.compile(rb"[\w.%-]+\.(?:png|jpe?g)(?![\w-])", re.I)
+OG_IMAGE_RE = re.compile(r'\b(?:property|name)="og:image(?::url|:secure_url)?"')
+OG_TYPE_RE = re.compile(r'\b(?:property|name)="og:image:type"')
+MIME_RE = re.compile(r'"image/(?:png|jpeg)"')
+REFS_CACHE = ROOT / ".cache" / "image_refs.json"
+REFS_CACHE_VERSION = 1
+SOURCES_CACHE = ROOT / ".cache" / "image_sources.json"   # 派生元画像の {sha1, data: {width}}（stat が同じなら読まない）
+SOURCES_CACHE_VERSION = 1
+PICTURE_RE = re.compile(r"<picture>(?:<source\b[^>]*>)*(<img\b[^>]*>)</picture>")
 
 def human(n): return f"{n/1024:.0f}KB"
 
-def resize_profiles():
-    saved = 0
-    for p in BLOG.rglob(PROFILE_NAME):
-        before = p.stat().st_size
-        with Image.open(p) as im:
-            im = im.convert("RGB")
-            im = ImageOps.fit(im, (PROFILE_PX, PROFILE_PX), Image.LANCZOS)
-            im.save(p, "JPEG", quality=85, optimize=True)
-        after = p.stat().st_size
-        saved += before - after
-        print(f"  profile {p.relative_to(ROOT)}: {human(before)} -> {human(after)}")
-    return saved
+def encode_profile(raw):
+    with Image.open(io.BytesIO(raw)) as im:
+        im = im.convert("RGB")
+        im = ImageOps.fit(im, (PROFILE_PX, PROFILE_PX), Image.LANCZOS)
+        buf = io.BytesIO()
+        im.save(buf, "JPEG", quality=PROFILE_Q, optimize=True)
+    return buf.getvalue()
+
+def is_small_profile(raw):
+    """台帳に無い（初回・別マシン）ときの判定：既に 144x144 の JPEG なら作り直さない（ヘッダだけ読む）。"""
+    with Image.open(io.BytesIO(raw)) as im:
+        return im.format == "JPEG" and im.size == (PROFILE_PX, PROFILE_PX)
+
+def resize_profiles(w, man):
+    """戻り値: (削減バイト, スキップ件数)"""
+    saved = skipped = 0
+    encoded = {}  # 元画像 sha1 -> 結果（同じ写真が記事の数だけ置かれているので1回だけエンコード）
+    for p in sorted(BLOG.rglob(PROFILE_NAME)):
+        if man.done(p, PROFILE_SETTINGS):
+            skipped += 1
+            continue
+        raw = p.read_bytes()
+        src = sha1(raw)
+        if man.get(p) is None and is_small_profile(raw):
+            man.record(p, src, PROFILE_SETTINGS, raw)
+            skipped += 1
+            continue
+        if src not in encoded:
+            encoded[src] = encode_profile(raw)
+        data = encoded[src]
+        w.write_bytes(p, data)
+        man.record(p, src, PROFILE_SETTINGS, data)
+        saved += len(raw) - len(data)
+        print(f"  profile {p.relative_to(ROOT)}: {human(len(raw))} -> {human(len(data))}")
+    return saved, skipped
+
+def encode_webp(p, target=None, known=None):
+    """1枚ぶんのデコード→縮小→WebPエンコード（プロセスプールからも呼ばれる）。
+    target があれば q を探索（known はキャッシュ済みの結果）。戻り値: (WebP のバイト列, {q, ssim, baseline})"""
+    with open_scaled(p, MAXW) as im:
+        if im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA" if "A" in im.mode else "RGB")
+        iw, ih = im.size
+        if iw > MAXW:
+            im = im.resize((MAXW, round(ih * MAXW / iw)), Image.LANCZOS)
+        return quality_search.encode(im, target, WEBP_Q, WEBP_METHOD, known)
+
+def encode_webp_task(task):
+    return encode_webp(*task)
+
+def imap_bounded(fn, items, jobs=1, cost=None, budget=None):
+    """fn(item) を items の順に yield する。jobs>1 ならプロセス並列。
+    同時に抱える仕事は jobs*2 件まで（デコード済み画像や結果のバイト列を溜め込まない）。
+    cost(item)（見積もりバイト）と budget を渡すと、抱えている仕事の合計が budget を超えないよう投入を待つ
+    （1件だけなら超えていても流す）。"""
+    if jobs <= 1:
+        yield from map(fn, items)
+        return
+    window = jobs * 2
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        pending = deque()
+        held = 0
+        for item in items:
+            c = cost(item) if cost and budget else 0
+            while pending and (len(pending) >= window or (c and held + c > budget)):
+                fut, fc = pending.popleft()
+                held -= fc
+                yield fut.result()
+            pending.append((ex.submit(fn, item), c))
+            held += c
+        while pending:
+            yield pending.popleft()[0].result()
 
-def convert_to_webp():
-    """戻り値: (old_basename -> new_basename) の置換マップ, 削減バイト"""
+def convert_to_webp(w, man, jobs=1, target=None, budget=None):
+    """戻り値: (old_basename -> new_basename) の置換マップ, 削減バイト, 固定 q 比の削減バイト"""
     mapping = {}
-    saved = 0
+    saved = vs_base = 0
+    settings = {**WEBP_SETTINGS, "quality": quality_search.target_key(target, WEBP_METHOD)} if target else WEBP_SETTINGS
+    qcache = QualityCache() if target else None
     targets = []
     for ext in ("*.png", "*.jpg", "*.jpeg"):
-        for p in BLOG.rglob(ext):
+        for p in (q for d in IMAGE_DIRS for q in d.rglob(ext)):
             if p.name == PROFILE_NAME:
                 continue
             if p.stat().st_size > SIZE_THRESHOLD:
                 targets.append(p)
-    for p in sorted(targets, key=lambda x: -x.stat().st_size):
-        before = p.stat().st_size
+    targets.sort(key=lambda x: -x.stat().st_size)  # 大きい順（並列時も重いものから先に流す）
+    # 元画像の中身・設定が台帳どおりで WebP も無傷なら、エンコードせずにそのまま差し替える
+    plan = []
+    for p in targets:
         out = p.with_suffix(".webp")
-        with Image.open(p) as im:
-            if im.mode not in ("RGB", "RGBA"):
-                im = im.convert("RGBA" if "A" in im.mode else "RGB")
-            w, h = im.size
-            if w > MAXW:
-                im = im.resize((MAXW, round(h * MAXW / w)), Image.LANCZOS)
-            im.save(out, "WEBP", quality=WEBP_Q, method=6)
-        after = out.stat().st_size
+        src = sha1(p.read_bytes())
+        plan.append((p, out, src, man.done(out, settings, src=src)))
+    # 探索済みの q は親で引いて子に渡す（キャッシュの読み書きは親だけ）
+    key = lambda src: QualityCache.key(src, target, WEBP_METHOD)
+    tasks = [(p, target, qcache.get(key(src)) if target else None) for p, _, src, reuse in plan if not reuse]
+    encoded = imap_bounded(encode_webp_task, tasks, jobs, cost=lambda t: decode_cost(t[0], MAXW), budget=budget)
+    for p, out, src, reuse in plan:
+        before = p.stat().st_size
+        info = qcache.get(key(src)) if target else None
+        if reuse:
+            after = out.stat().st_size
+        else:
+            data, info = next(encoded)
+            w.write_bytes(out, data)
+            man.record(out, src, settings, data)
+            after = len(data)
+            if target:
+                qcache.put(key(src), info)
         saved += before - after
         mapping[p.name] = out.name
-        p.unlink()
-        print(f"  webp {p.relative_to(ROOT)}: {human(before)} -> {out.name} {human(after)}")
-    return mapping, saved
+        w.remove(p)
+        note = ""
+        if target and info:
+            vs_base += info["baseline"] - after
+            note = f" q{info['q']} ssim {info['ssim']}（q{WEBP_Q} なら {human(info['baseline'])}）"
+        print(f"  webp {p.relative_to(ROOT)}: {human(before)} -> {out.name} {human(after)}{note}" + ("（台帳から再利用）" if reuse else ""))
+    if qcache:
+        qcache.save()
+    return mapping, saved, vs_base
+
+def extract_image_refs(p, raw):
+    """1ファイルに出てくる PNG/JPEG のファイル名（basename）一覧（file_cache から、プロセスプール経由でも呼ばれる）。"""
+    return sorted({m.decode("utf-8", "ignore") for m in IMAGE_NAME_RE.findall(raw)})
+
+def ref_files():
+    """画像を参照しうるファイル：ブログ・ルート直下・app/ の HTML、css/ のスタイルシート、sitemap.xml。"""
+    return (sorted(BLOG.rglob("*.html")) + sorted(ROOT.glob("*.html")) + sorted((ROOT / "app").rglob("*.html"))
+            + sorted((ROOT / "css").rglob("*.css")) + [ROOT / "sitemap.xml"])
 
-def rewrite_refs(mapping):
+def ref_index(jobs=1):
+    """画像 basename -> それを参照しているファイル の逆引き。ファイルごとの抽出結果は内容ハッシュでキャッシュ。"""
+    files = [f for f in ref_files() if f.exists()]
+    items = [(f.relative_to(ROOT).as_posix(), f) for f in files]
+    cache = file_cache.load(REFS_CACHE, REFS_CACHE_VERSION)
+    fresh, _ = file_cache.refresh(items, cache, extract_image_refs, jobs=jobs)
+    if fresh != cache:
+        file_cache.save(REFS_CACHE, REFS_CACHE_VERSION, fresh)
+    index = {}
+    for rel, ent in fresh.items():
+        for name in ent["data"]:
+            index.setdefault(name, []).append(ROOT / rel)
+    return index
+
+def rewrite_text(txt, mapping, names_re, pass_re):
+    """1パスで置換する。タグ（と本文中の名前）を1本の正規表現で拾い、
+    変換した画像を参照しているタグの中だけ type="image/png|jpeg" を image/webp に、
+    変換した og:image の直後の og:image:type も image/webp にそろえる。"""
+    og_converted = False
+    def swap(m):
+        return mapping[m.group(0)]
+    def repl(m):
+        nonlocal og_converted
+        tag = m.group(1)
+        if tag is None:
+            return mapping[m.group(2)]  # タグの外（JSON-LD・sitemap の <image:loc> 本文など）
+        new = names_re.sub(swap, tag)
+        if OG_TYPE_RE.search(tag):
+            return MIME_RE.sub('"image/webp"', tag) if og_converted else tag
+        if OG_IMAGE_RE.search(tag):
+            og_converted = new != tag
+        return MIME_RE.sub('"image/webp"', new) if new != tag else tag
+    return pass_re.sub(repl, txt)
+
+def rewrite_refs(mapping, w, jobs=1):
+    """置換マップの画像を参照しているファイルだけ（逆引きで）開いて1パスで書き換える。"""
     if not mapping:
         return 0
-    files = list(BLOG.rglob("*.html")) + [ROOT / "sitemap.xml"]
+    index = ref_index(jobs)
+    targets = sorted({f for old in mapping for f in index.get(old, [])})
+    names_re = re.compile(r"(?<![\w.-])(?:" + "|".join(map(re.escape, sorted(mapping, key=len, reverse=True))) + r")(?![\w-]|\.\w)")
+    pass_re = re.compile(rf"(<[A-Za-z][^>]*>)|({names_re.pattern})")
     changed = 0
-    for f in files:
-        if not f.exists():
-            continue
+    for f in targets:
         txt = f.read_text(encoding="utf-8")
-        orig = txt
-        for old, new in mapping.items():
-            if old in txt:
-                txt = txt.replace(old, new)
-        # og:image:type / 拡張子由来のMIME（あれば）
-        if "blog_" in orig or "-image" in orig or "-hero" in orig:
-            txt = txt.replace('content="image/png"', 'content="image/webp"')
-            txt = txt.replace('content="image/jpeg"', 'content="image/webp"')
-        if txt != orig:
-            f.write_text(txt, encoding="utf-8")
+        new = rewrite_text(txt, mapping, names_re, pass_re)
+        if new != txt and w.write_text(f, new):
             changed += 1
             print(f"  refs updated: {f.relative_to(ROOT)}")
     return changed
 
+def article_pages():
+    """<img> を書き換える対象の記事HTML（自動生成の一覧・カテゴリ・検索は除く）。"""
+    return [f for f in sorted(BLOG.rglob("*.html"))
+            if f != BLOG / "index.html" and f.relative_to(BLOG).parts[0] not in GENERATED_DIRS]
+
+def img_target(page, src):
+    """<img src> をファイルに解決する。同じサイト内のラスター画像だけ（外部 URL・プロフィールは対象外）。"""
+    if "://" in src or src.startswith(("//", "data:")):
+        return None
+    path = src.split("?")[0]
+    # /assets/shared/… のようなサイトルート基準のパス（dedup_assets で共有化された画像）も辿る
+    p = ROOT / path.lstrip("/") if path.startswith("/") else Path(os.path.normpath(page.parent / path))
+    if p.suffix.lower() not in RASTER_EXTS or p.name == PROFILE_NAME or VARIANT_RE.search(p.name) or not p.is_file():
+        return None
+    return p
+
+def variant_plan(p, width):
+    """[(幅, 形式, 出力パス)]。MAXW 以下の元画像はその幅も候補にし、元が WebP ならその WebP は元ファイルをそのまま使う。"""
+    widths = [x for x in VARIANT_WIDTHS if x < width] + ([width] if width <= MAXW else [])
+    return [(x, fmt, p.with_name(f"{p.stem}-{x}w.{fmt}")) for x in widths for fmt in VARIANT_FORMATS
+            if not (fmt == "webp" and x == width and p.suffix.lower() == ".webp")]
+
+def variant_settings(width, fmt):
+    return {"op": "variant", "format": fmt, "width": width, "quality": VARIANT_Q[fmt]}
+
+def encode_variants(task):
+    """1枚を1回だけデコードし、指定の (幅, 形式) をすべてエンコードする（プロセスプールからも呼ばれる）。"""
+    p, todo = task
+    out = []
+    with open_scaled(p, max(x for x, _ in todo)) as im:
+        im = im.convert("RGBA" if "A" in im.mode else "RGB")
+        for x, fmt in todo:
+            v = im if x == im.width else im.resize((x, round(im.height * x / im.width)), Image.LANCZOS)
+            buf = io.BytesIO()
+            if fmt == "avif":
+                v.save(buf, "AVIF", quality=VARIANT_Q[fmt])
+            else:
+                v.save(buf, "WEBP", quality=VARIANT_Q[fmt], method=WEBP_METHOD)
+            out.append(buf.getvalue())
+    return out
+
+def source_info(p, raw):
+    """派生元画像の幅（file_cache から、ヘッダだけ読む）。"""
+    with Image.open(io.BytesIO(raw)) as im:
+        return {"width": im.width}
+
+def source_index(paths, jobs=1):
+    """元画像 Path -> (sha1, 幅)。stat が前回どおりの画像は読みもハッシュもしない。"""
+    items = [(p.relative_to(ROOT).as_posix(), p) for p in paths]
+    cache = file_cache.load(SOURCES_CACHE, SOURCES_CACHE_VERSION)
+    fresh, _ = file_cache.refresh(items, cache, source_info, jobs=jobs)
+    if fresh != cache:
+        file_cache.save(SOURCES_CACHE, SOURCES_CACHE_VERSION, fresh)
+    return {p: (fresh[k]["sha1"], fresh[k]["data"]["width"]) for k, p in items}
+
+def make_variants(w, man, jobs=1, budget=None):
+    """記事の <img> が指すラスター画像ごとに幅違い WebP/AVIF を作る（元画像と設定が同じなら作り直さない）。
+    元画像の sha1・幅は source_index() から取るので、何も変わっていない再実行は画像1枚につき stat だけ。
+    掃除するのは台帳にこのツールの派生として記録された出力だけ（人が置いた同名ファイルには触らない）。
+    戻り値: (元画像 Path -> (元画像の幅, [(幅, 形式, 出力パス)]), 新規エンコード枚数)"""
+    plans, tasks, metas, sources = {}, [], [], {}
+    for page in article_pages():
+        for m in IMG_RE.finditer(page.read_text(encoding="utf-8")):
+            src = SRC_RE.search(m.group(0))
+            p = src and img_target(page, src.group(1))
+            if p:
+                sources.setdefault(p, None)
+    for p, (digest, width) in source_index(list(sources), jobs).items():
+        plan = variant_plan(p, width)
+        plans[p] = (width, plan)
+        if len(plan) < 2:
+            continue  # 小さすぎて出し分けの意味が無い
+        todo = [(x, fmt, out) for x, fmt, out in plan if not man.done(out, variant_settings(x, fmt), src=digest)]
+        if todo:
+            tasks.append((p, [(x, fmt) for x, fmt, _ in todo]))
+            metas.append((digest, todo))
+    encoded = 0
+    cost = lambda t: decode_cost(t[0], max(x for x, _ in t[1]))
+    for (p, _), (digest, todo), datas in zip(tasks, metas, imap_bounded(encode_variants, tasks, jobs, cost, budget)):
+        for (x, fmt, out), data in zip(todo, datas):
+            w.write_bytes(out, data)
+            man.record(out, digest, variant_settings(x, fmt), data)
+            encoded += 1
+        print(f"  variants {p.relative_to(ROOT)}: " + ", ".join(f"{x}w.{fmt} {human(len(d))}" for (x, fmt, _), d in zip(todo, datas)))
+    plans = {p: v for p, v in plans.items() if len(v[1]) >= 2}
+    # 参照されなくなった元画像の派生ファイルを掃除（前回までにこのツールが作ったものだけ）
+    live = {out for _, plan in plans.values() for _, _, out in plan}
+    for f in man.outputs("variant"):
+        if f not in live:
+            w.remove(f)
+            man.forget(f)
+    return plans, encoded
+
+def sizes_attr(img, width):
+    """<img> の width 属性（無ければ元画像の幅）で表示幅を見積もり、本文幅 672px で頭打ちにした sizes。"""
+    m = WIDTH_RE.search(img)
+    shown = min(int(m.group(1)) if m else width, CONTENT_W)
+    if shown >= CONTENT_W:
+        return SIZES
+    return f"(max-width: {shown + PHONE_GUTTER}px) calc(100vw - {PHONE_GUTTER}px), {shown}px"
+
+def picture_html(img, src, plan, sizes=SIZES):
+    head, sep, name = src.split("?")[0].rpartition("/")
+    base = head + sep
+    sources = []
+    for fmt in VARIANT_FORMATS:
+        cands = sorted((x, out.name) for x, f, out in plan if f == fmt)
+        if fmt == "webp" and name.lower().endswith(".webp"):
+            width = max(x for x, _, _ in plan)
+            if all(x != width for x, _ in cands):
+                cands.append((width, name))
+        srcset = ", ".join(f"{base}{n} {x}w" for x, n in cands)
+        sources.append(f'<source type="image/{fmt}" srcset="{srcset}" sizes="{sizes}">')
+    return "<picture>" + "".join(sources) + img + "</picture>"
+
+def rewrite_pictures(plans, w):
+    """記事の <img> を <picture>（AVIF → WebP → 元の img）に包む。og:image 等の meta は元ファイルのまま。
+    既に包んである分は一度ほどいて作り直すので、何度実行しても同じ結果になる。"""
+    changed = 0
+    for page in article_pages():
+        txt = page.read_text(encoding="utf-8")
+        def wrap(m):
+            img = m.group(0)
+            src = SRC_RE.search(img)
+            p = src and img_target(page, src.group(1))
+            if p not in plans:
+                return img
+            width, plan = plans[p]
+            return picture_html(img, src.group(1), plan, sizes_attr(img, width))
+        new = IMG_RE.sub(wrap, PICTURE_RE.sub(r"\1", txt))
+        if new != txt and w.write_text(page, new):
+            changed += 1
+            print(f"  picture: {page.relative_to(ROOT)}")
+    return changed
+
+def inline_placeholders(w):
+    """戻り値: (書き換えたページ数, ヒーロー枚数, 新たに計算した枚数)"""
+    cache = lqip.Placeholders()
+    changed = 0
+    for page in article_pages():
+        txt = page.read_text(encoding="utf-8")
+        new = lqip.inline_heroes(txt, page.parent, cache, resolve=lambda src: img_target(page, src))
+        if new != txt and w.write_text(page, new):
+            changed += 1
+            print(f"  lqip: {page.relative_to(ROOT)}")
+    cache.save(prune=True)
+    return changed, len(cache.used), cache.computed
+
 def main():
+    ap = argparse.ArgumentParser(description="ブログ画像の容量最適化（プロフィール縮小・WebP化・参照更新）")
+    ap.add_argument("--jobs", type=int, default=1, help="エンコードを N プロセスで並列化（ログ・結果の順序は直列と同じ）")
+    ap.add_argument("--max-mem", type=int, metavar="MB",
+                    help="並列デコードで同時に抱える画像の見積もりメモリ上限（既定は物理メモリの半分）")
+    ap.add_argument("--quality-target", metavar="SPEC",
+                    help="WebP の q を画像ごとに探索（ssim:0.95 / kb:150、カンマで併用）。省略時は q%d 固定" % WEBP_Q)
+    ap.add_argument("--no-lqip", action="store_true", help="ヒーローのプレースホルダを焼き込まない")
+    ap.add_argument("--no-variants", action="store_true", help="幅違い WebP/AVIF と <picture> 書き換えをしない")
+    args = ap.parse_args()
+    target = quality_search.parse_target(args.quality_target)
+    budget = args.max_mem << 20 if args.max_mem else default_budget()
+    w = SiteWriter(ROOT)
+    man = ImageManifest(MANIFEST, ROOT)
     print("== 1) プロフィール画像リサイズ ==")
-    s1 = resize_profiles()
+    s1, skipped = resize_profiles(w, man)
     print("== 2) 写真をWebP化 ==")
-    mapping, s2 = convert_to_webp()
+    mapping, s2, vs_base = convert_to_webp(w, man, jobs=args.jobs, target=target, budget=budget)
     print("== 3) HTML / sitemap 参照更新 ==")
-    n = rewrite_refs(mapping)
+    n = rewrite_refs(mapping, w, jobs=args.jobs)
+    plans, nv, npic = {}, 0, 0
+    if not args.no_variants:
+        print("== 4) 幅違い WebP/AVIF と <picture> ==")
+        plans, nv = make_variants(w, man, jobs=args.jobs, budget=budget)
+        npic = rewrite_pictures(plans, w)
+    nl = (0, 0, 0)
+    if not args.no_lqip:
+        print("== 5) ヒーローのプレースホルダ ==")
+        nl = inline_placeholders(w)
     print("\n== サマリ ==")
     print(f"  WebP変換: {len(mapping)}枚 / 参照更新: {n}ファイル")
+    if target:
+        print(f"  q 探索（{args.quality_target}）: 固定 q{WEBP_Q} 比 {vs_base/1024:.0f}KB 削減")
+    print(f"  幅違い: 元画像 {len(plans)}枚 / 新規エンコード {nv}ファイル / <picture> 更新 {npic}ページ")
+    print(f"  プレースホルダ: ヒーロー {nl[1]}枚（新規計算 {nl[2]}）/ 更新 {nl[0]}ページ")
+    print(f"  ファイル: {w.summary()}")
+    print(f"  台帳: プロフィール {skipped}枚は処理済みでスキップ / 出力の消えたエントリ {man.prune()}件を削除")
+    man.save()
     print(f"  削減合計: {(s1+s2)/1048576:.1f}MB（profile {s1/1048576:.1f}MB + webp {s2/1048576:.1f}MB）")
 
 if __name__ == "__main__":
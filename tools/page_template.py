@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""記事ページのプリコンパイル済みテンプレート（記事エンジンの page() 用）。
+骨組みの文字列を1回だけ「静的チャンクの列＋型付きスロット」に分解し、描画はリストのコピーに値を差し込んで join するだけ。
+- {{name}}   テキストスロット。値は esc() してから入れる（同じフィールドが何か所に出ても escape は1ページ1回）
+- {{{name}}} 生HTMLスロット（本文・リード・目次など組み立て済みのHTML）
+- {{@name}}  コンパイル時定数（参考記事から抜いた <style>・YouTubeバナーや GA タグなど）。静的チャンクに焼き込む
+隣り合う静的チャンクはコンパイル時に1つにまとめる。
+コンパイル結果は「骨組み＋定数」の sha1 ごとに .cache/page_template.json にキャッシュし、
+参考記事・骨組みが変わらない限り、次の実行からは参考記事の正規表現抽出もパースもしない。
+"""
+import re, hashlib
+from pathlib import Path
+import file_cache
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE = ROOT / ".cache" / "page_template.json"
+CACHE_VERSION = 1
+SLOT_RE = re.compile(r"\{\{\{(\w+)\}\}\}|\{\{(@?\w+)\}\}")
+
+def esc(s):
+    return s.replace("&", "&amp;").replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
+
+class Template:
+    """parts: 静的チャンク（スロットの位置は空文字）、slots: [(位置, フィールド名, escape するか)]"""
+    def __init__(self, parts, slots):
+        self.parts = parts
+        self.slots = [tuple(s) for s in slots]
+        # 同じフィールド（と escape の有無）のスロット位置をまとめておく → 描画時は1フィールド1回だけ値を作る
+        groups = {}
+        for i, name, escape in self.slots:
+            groups.setdefault((name, escape), []).append(i)
+        self.groups = [(name, escape, tuple(pos)) for (name, escape), pos in groups.items()]
+
+    def render(self, fields):
+        out = self.parts[:]
+        for name, escape, pos in self.groups:
+            v = esc(fields[name]) if escape else fields[name]
+            for i in pos:
+                out[i] = v
+        return "".join(out)
+
+def compile_template(skeleton, consts):
+    parts, slots, static = [], [], []
+    pos = 0
+    for m in SLOT_RE.finditer(skeleton):
+        static.append(skeleton[pos:m.start()])
+        pos = m.end()
+        raw, name = m.group(1), m.group(2)
+        if name and name.startswith("@"):
+            static.append(consts[name[1:]])
+            continue
+        parts.append("".join(static))
+        static = []
+        slots.append((len(parts), raw or name, raw is None))
+        parts.append("")
+    static.append(skeleton[pos:])
+    parts.append("".join(static))
+    return Template(parts, slots)
+
+def load(skeleton, source_hash, consts, cache_path=CACHE):
+    """source_hash: 定数の出どころ（参考記事）の sha1。consts(): 定数 dict を返す関数（キャッシュに無いときだけ呼ぶ）。
+    戻り値: (Template, キャッシュが効いたか)"""
+    key = hashlib.sha1(f"{source_hash}\0{skeleton}".encode()).hexdigest()
+    cache = file_cache.load(cache_path, CACHE_VERSION)
+    if key in cache:
+        return Template(**cache[key]), True
+    tpl = compile_template(skeleton, consts())
+    file_cache.save(cache_path, CACHE_VERSION, {key: {"parts": tpl.parts, "slots": tpl.slots}})
+    return tpl, False
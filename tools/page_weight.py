@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""全 HTML ページの重さ（転送バイト）を見積もり、予算超えのページを報告する。
+対象はルート直下の *.html / blog/ / app/（check_links と同じ）。1ページの内訳:
+- HTML 本体（gzip 後）と、その中のインライン <style>・<svg>・<script>（生バイト。HTML に含まれる内訳として表示）
+- ローカルの CSS・JS・画像（check_links.resolve で実ファイルに解決。テキストは gzip 後、画像はそのまま）
+- 外部スクリプト（gtag・adsbygoogle 等）は THIRD_PARTY の目安値（ダウンロードして測りはしない）
+クリティカルパス = HTML + 描画をブロックする CSS・同期スクリプト + 最初の lazy でない <img>（ヒーロー＝LCP 候補）。
+<picture> は <img> の src（フォールバック）1枚で数える。og:image・canonical 等の読み込まれない参照は数えない。
+ページごとの抽出結果は .cache/page_weight.json に内容ハッシュでキャッシュ、--jobs N で並列化。
+  python3 tools/page_weight.py [--budget-kb 1200] [--critical-kb 200] [--json report.json] [--md report.md]
+終了コード: 予算超えのページがあれば 1。
+--baseline PATH を付けると、そのファイルに記録済みの予算超え（既知の重いページ）は重くならない限り通し、
+新たに超えたページと悪化したページだけで 1 を返す（tools/auto-push の関門。記録は git 管理の
+tools/page_weight_baseline.json）。ファイルが無い・読めないときは黙って作らずに 2 で止める。
+--update-baseline で今の予算超えを既知として記録し直す（これを commit する）。
+"""
+import re, sys, json, time, zlib, argparse
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit
+import file_cache
+from check_links import resolve, target_exists, site_files, pages, SITE_HOSTS, SKIP_SCHEMES
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE = ROOT / ".cache" / "page_weight.json"
+CACHE_VERSION = 2
+BUDGET_KB = 1200      # 1ページの転送量の上限（画像・外部スクリプト込み）
+CRITICAL_KB = 200     # 初回描画までに要る転送量の上限
+TOP = 10
+BASELINE = ROOT / "tools" / "page_weight_baseline.json"
+BASELINE_VERSION = 1
+SLACK = 1024          # baseline 比でこれ以下の増加は悪化とみなさない（gzip の揺れ）
+TEXT_EXTS = {".html", ".css", ".js", ".mjs", ".json", ".svg", ".xml", ".txt"}
+# 外部リソースの転送量の目安（gzip 後・2026年時点の実測の丸め）。(ホスト, パスの先頭) -> KB
+THIRD_PARTY = {
+    ("www.googletagmanager.com", "/gtag/js"): 150,
+    ("pagead2.googlesyndication.com", "/pagead/js/adsbygoogle.js"): 60,
+    ("fonts.googleapis.com", "/css"): 300,   # CSS 自体は小さいが Noto Sans JP の woff2 サブセットを含めた目安
+    ("cdnjs.cloudflare.com", "/ajax/libs/xlsx/"): 290,
+}
+INLINE_RES = {
+    "style": re.compile(r"<style\b.*?</style>", re.S | re.I),
+    "svg": re.compile(r"<svg\b.*?</svg>", re.S | re.I),
+    "script": re.compile(r"<script\b(?![^>]*\bsrc=)[^>]*>.*?</script>", re.S | re.I),
+}
+
+def gz(raw):
+    return len(zlib.compress(raw, 6)) + 18  # gzip のヘッダ・トレーラぶん
+
+class WeightParser(HTMLParser):
+    """実際に読み込まれる参照だけを [種類, URL, クリティカルか] で集める。"""
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.refs = []
+        self.in_head = False
+        self.in_noscript = False
+        self.hero = False
+
+    def add(self, kind, url, critical):
+        if url and url.strip():
+            self.refs.append([kind, url.strip(), critical])
+
+    def handle_starttag(self, tag, attrs):
+        a = {k: v for k, v in attrs if k}
+        if tag == "head":
+            self.in_head = True
+        elif tag == "body":
+            self.in_head = False
+        elif tag == "noscript":
+            self.in_noscript = True
+        elif self.in_noscript:
+            return  # JS 無効時だけの代替（preload した CSS の <link> 等）は数えない
+        elif tag == "link":
+            rel = (a.get("rel") or "").lower().split()
+            if "stylesheet" in rel:
+                self.add("css", a.get("href"), (a.get("media") or "all") != "print")
+            elif "preload" in rel and a.get("as") == "style":
+                self.add("css", a.get("href"), False)  # onload で stylesheet に切り替える非同期 CSS
+            elif "icon" in rel:
+                self.add("img", a.get("href"), False)
+        elif tag == "script" and a.get("src"):
+            sync = "async" not in a and "defer" not in a and a.get("type") != "module"
+            self.add("js", a["src"], sync)
+        elif tag == "img":
+            eager = (a.get("loading") or "").lower() != "lazy"
+            critical = eager and not self.hero and not self.in_head
+            self.hero |= critical
+            self.add("img", a.get("src"), critical)
+        elif tag == "video" and a.get("poster"):
+            self.add("img", a["poster"], False)
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.in_head = False
+        elif tag == "noscript":
+            self.in_noscript = False
+
+    handle_startendtag = handle_starttag
+
+def extract(p, raw):
+    """1ページ分の HTML サイズ・インライン内訳・参照（file_cache から、プロセスプール経由でも呼ばれる）。"""
+    text = raw.decode("utf-8", errors="ignore")
+    inline = {k: sum(len(m.group(0).encode("utf-8")) for m in r.finditer(text)) for k, r in INLINE_RES.items()}
+    parser = WeightParser()
+    try:
+        parser.feed(text)
+        parser.close()
+    except Exception:  # 壊れたHTMLでも拾えた分だけ
+        pass
+    return {"html": len(raw), "html_gz": gz(raw), "inline": inline, "refs": parser.refs}
+
+def third_party(url):
+    parts = urlsplit(url)
+    for (host, prefix), kb in THIRD_PARTY.items():
+        if parts.netloc.lower() == host and parts.path.startswith(prefix):
+            return kb * 1024
+    return 0
+
+class AssetSizes:
+    """ローカルアセットの転送サイズ（テキストは gzip 後）。ページ間で共有して1回だけ測る。"""
+    def __init__(self, root):
+        self.root, self.sizes = root, {}
+
+    def __call__(self, rel):
+        if rel not in self.sizes:
+            p = self.root / rel
+            self.sizes[rel] = gz(p.read_bytes()) if p.suffix.lower() in TEXT_EXTS else p.stat().st_size
+        return self.sizes[rel]
+
+def weigh(rel, data, files, dirs, size):
+    """1ページの内訳。同じアセットを何度参照しても1回（どれか1つがクリティカルならクリティカル）。"""
+    local, external = {}, {}
+    for kind, url, critical in data["refs"]:
+        if url.startswith(SKIP_SCHEMES):
+            continue
+        host = urlsplit(url).netloc.lower()
+        if host and host not in SITE_HOSTS:
+            ent = external.setdefault(url, {"kind": kind, "bytes": third_party(url), "critical": False})
+            ent["critical"] |= critical
+            continue
+        target = resolve(rel, url)
+        found = target and target_exists(target, files, dirs)
+        if not found:
+            continue  # 参照切れは check_links の担当
+        ent = local.setdefault(found, {"kind": kind, "bytes": size(found), "critical": False})
+        ent["critical"] |= critical
+    by_kind = {"html": data["html_gz"], "css": 0, "js": 0, "img": 0, "third_party": 0}
+    critical = data["html_gz"]
+    for ent in local.values():
+        by_kind[ent["kind"]] += ent["bytes"]
+        critical += ent["bytes"] if ent["critical"] else 0
+    for ent in external.values():
+        by_kind["third_party"] += ent["bytes"]
+        critical += ent["bytes"] if ent["critical"] else 0
+    return {"page": rel, "total": sum(by_kind.values()), "critical": critical, "by_kind": by_kind,
+            "html_raw": data["html"], "inline": data["inline"],
+            "assets": {k: v["bytes"] for k, v in local.items()},
+            "third_party": {k: v["bytes"] for k, v in external.items()}}
+
+def audit(root=ROOT, jobs=1, use_cache=True, budget_kb=BUDGET_KB, critical_kb=CRITICAL_KB, top=TOP):
+    t0 = time.perf_counter()
+    items = [(p.relative_to(root).as_posix(), p) for p in pages(root) if p.suffix == ".html"]
+    cache = file_cache.load(CACHE, CACHE_VERSION) if use_cache else {}
+    fresh, stats = file_cache.refresh(items, cache, extract, jobs=jobs)
+    if use_cache and fresh != cache:
+        file_cache.save(CACHE, CACHE_VERSION, fresh)
+    files, dirs = site_files(root)
+    size = AssetSizes(root)
+    rows = [weigh(rel, ent["data"], files, dirs, size) for rel, ent in fresh.items()]
+    over = [r for r in rows if r["total"] > budget_kb * 1024 or r["critical"] > critical_kb * 1024]
+    # アセット単位のワースト：サイズと、それを読み込むページ数（共有ファイルは1回キャッシュされる点に注意）
+    used = {}
+    for r in rows:
+        for a, n in list(r["assets"].items()) + list(r["third_party"].items()):
+            u = used.setdefault(a, {"asset": a, "bytes": n, "pages": 0})
+            u["pages"] += 1
+    return {"pages": len(rows), "budget_kb": budget_kb, "critical_kb": critical_kb,
+            "over": [r["page"] for r in over],
+            "heaviest": sorted(rows, key=lambda r: -r["total"])[:top],
+            "heaviest_critical": sorted(rows, key=lambda r: -r["critical"])[:top],
+            "largest_assets": sorted(used.values(), key=lambda u: -u["bytes"])[:top],
+            "median_kb": round(sorted(r["total"] for r in rows)[len(rows) // 2] / 1024) if rows else 0,
+            "rows": rows, "cache": stats, "ms": round((time.perf_counter() - t0) * 1000)}
+
+def load_baseline(path):
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data.get("pages", {}) if data.get("version") == BASELINE_VERSION else None
+
+def save_baseline(path, r):
+    rows = {x["page"]: x for x in r["rows"]}
+    pages = {p: [rows[p]["total"], rows[p]["critical"]] for p in sorted(r["over"])}
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps({"version": BASELINE_VERSION, "pages": pages}, ensure_ascii=False, indent=1),
+                          encoding="utf-8")
+
+def regressions(r, baseline):
+    """予算超えのうち、baseline に無いページと baseline より重くなったページ。"""
+    rows = {x["page"]: x for x in r["rows"]}
+    out = []
+    for p in r["over"]:
+        base = baseline.get(p)
+        if not base or rows[p]["total"] > base[0] + SLACK or rows[p]["critical"] > base[1] + SLACK:
+            out.append(p)
+    return out
+
+def kb(n):
+    return f"{n/1024:.0f}KB"
+
+def markdown(r):
+    out = ["# ページ重量レポート", "",
+           f"- 対象 {r['pages']} ページ / 予算: 合計 {r['budget_kb']}KB・クリティカル {r['critical_kb']}KB",
+           f"- 予算超え: **{len(r['over'])}** ページ / 中央値 {r['median_kb']}KB"]
+    if r.get("regressions") is not None:
+        out.append(f"- baseline からの悪化・新規: **{len(r['regressions'])}** ページ"
+                   + "".join(f"\n  - {p}" for p in r["regressions"]))
+    out.append("")
+    if r["over"]:
+        rows = {x["page"]: x for x in r["rows"]}
+        out += ["## 予算超え", "", "| ページ | 合計 | クリティカル |", "|---|---:|---:|"]
+        out += [f"| {p} | {kb(rows[p]['total'])} | {kb(rows[p]['critical'])} |" for p in r["over"]]
+        out.append("")
+    out += ["## 重いページ", "", "| ページ | 合計 | クリティカル | HTML | CSS | JS | 画像 | 外部 | インライン style/svg/script |",
+            "|---|---:|---:|---:|---:|---:|---:|---:|---|"]
+    for x in r["heaviest"]:
+        k, i = x["by_kind"], x["inline"]
+        out.append(f"| {x['page']} | {kb(x['total'])} | {kb(x['critical'])} | {kb(k['html'])} | {kb(k['css'])} | "
+                   f"{kb(k['js'])} | {kb(k['img'])} | {kb(k['third_party'])} | "
+                   f"{kb(i['style'])} / {kb(i['svg'])} / {kb(i['script'])} |")
+    out += ["", "## 大きいアセット", "", "| アセット | サイズ | 読み込むページ数 |", "|---|---:|---:|"]
+    out += [f"| {u['asset']} | {kb(u['bytes'])} | {u['pages']} |" for u in r["largest_assets"]]
+    return "\n".join(out) + "\n"
+
+def main():
+    ap = argparse.ArgumentParser(description="全 HTML ページの転送量を見積もり、予算超えを報告する")
+    ap.add_argument("--budget-kb", type=int, default=BUDGET_KB, help="1ページの合計の上限（KB）")
+    ap.add_argument("--critical-kb", type=int, default=CRITICAL_KB, help="クリティカルパスの上限（KB）")
+    ap.add_argument("--top", type=int, default=TOP, help="ワースト表示の件数")
+    ap.add_argument("--jobs", type=int, default=1, help="抽出を N プロセスで並列化")
+    ap.add_argument("--no-cache", action="store_true", help="抽出キャッシュを使わない")
+    ap.add_argument("--json", metavar="PATH", help="結果を JSON で書き出す")
+    ap.add_argument("--md", metavar="PATH", help="結果を Markdown で書き出す")
+    ap.add_argument("--baseline", metavar="PATH", nargs="?", const=str(BASELINE),
+                    help=f"既知の予算超えの記録（悪化・新規だけを失敗にする。PATH 省略時 {BASELINE.relative_to(ROOT)}）")
+    ap.add_argument("--update-baseline", action="store_true", help="今の予算超えを --baseline に記録し直す")
+    args = ap.parse_args()
+    r = audit(jobs=args.jobs, use_cache=not args.no_cache, budget_kb=args.budget_kb,
+              critical_kb=args.critical_kb, top=args.top)
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    if args.baseline and baseline is None and not args.update_baseline:
+        print(f"baseline が無いか読めません: {args.baseline}\n"
+              f"  今の予算超えを既知として受け入れるなら: python3 tools/page_weight.py --baseline {args.baseline} "
+              "--update-baseline（作ったファイルは commit する）", file=sys.stderr)
+        return 2
+    if args.baseline and args.update_baseline:
+        save_baseline(args.baseline, r)
+        print(f"baseline: {len(r['over'])} pages recorded in {args.baseline}")
+        baseline = load_baseline(args.baseline)
+    r["regressions"] = regressions(r, baseline) if baseline is not None else None
+    c = r["cache"]
+    print(f"audited {r['pages']} pages ({r['ms']}ms, cache hit {c['hit']} / parsed {c['parsed']}) median {r['median_kb']}KB")
+    print(f"予算超え（合計 {args.budget_kb}KB / クリティカル {args.critical_kb}KB）: {len(r['over'])}")
+    rows = {x["page"]: x for x in r["rows"]}
+    for p in r["over"]:
+        flag = "" if r["regressions"] is None or p not in r["regressions"] else "  << baseline より悪化・新規"
+        print(f"  OVER {p}: total {kb(rows[p]['total'])} / critical {kb(rows[p]['critical'])}{flag}")
+    print("重いページ:")
+    for x in r["heaviest"]:
+        print(f"  {kb(x['total']):>7s} (critical {kb(x['critical']):>6s}) {x['page']}")
+    print("大きいアセット:")
+    for u in r["largest_assets"]:
+        print(f"  {kb(u['bytes']):>7s} x{u['pages']:<4d} {u['asset']}")
+    for path, body in ((args.json, lambda: json.dumps(r, ensure_ascii=False, indent=1)), (args.md, lambda: markdown(r))):
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text(body(), encoding="utf-8")
+    return 1 if (r["over"] if r["regressions"] is None else r["regressions"]) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""WebP の quality を画像ごとに二分探索で決める（固定 q82 の代わり）。
+目標は2種類（併用可。併用時は低い方の q を採る）:
+  ssim:0.95  … 元画像との SSIM（輝度・8x8 窓）がこれ以上になる最小の q（ベタ塗りの図版は q が下がって軽くなる）
+  kb:120     … 出力がこのサイズ以下になる最大の q（細かい写真は予算いっぱいまで画質を上げる）
+SSIM は NumPy の積分画像で全画素の窓平均をまとめて計算する（ループなし）。
+決まった q は元画像の sha1 と目標ごとに .cache/quality_search.json に残し、次回は探索せず1回のエンコードで済ませる。
+固定 q（baseline）で出した場合のサイズも記録し、レポートで削減量を比べられるようにする。
+生成スクリプト（gen_*）からは環境変数 WEBP_QUALITY_TARGET=ssim:0.95 のように指定する（未指定なら従来どおり固定 q）。
+"""
+import io, os, json, hashlib
+from pathlib import Path
+import numpy as np
+from PIL import Image
+import file_cache
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE = ROOT / ".cache" / "quality_search.json"
+CACHE_VERSION = 1
+Q_MIN, Q_MAX = 40, 95
+WIN = 8
+C1, C2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+ENV = "WEBP_QUALITY_TARGET"
+
+def parse_target(spec):
+    """'ssim:0.95,kb:120' -> {"ssim": 0.95, "max_bytes": 122880}。空なら None。"""
+    if not spec:
+        return None
+    out = {}
+    for part in spec.split(","):
+        kind, _, val = part.strip().partition(":")
+        if kind == "ssim":
+            out["ssim"] = float(val)
+        elif kind == "kb":
+            out["max_bytes"] = int(float(val) * 1024)
+        else:
+            raise ValueError(f"quality target は ssim:<0-1> か kb:<サイズ>: {part}")
+    return out
+
+def env_target():
+    return parse_target(os.environ.get(ENV, ""))
+
+def target_key(target, method):
+    return json.dumps({**target, "method": method, "range": [Q_MIN, Q_MAX]}, sort_keys=True, separators=(",", ":"))
+
+def luma(img):
+    return np.asarray(img.convert("L"), dtype=np.float64)
+
+def _box(x, k):
+    """k×k 窓の平均（積分画像で全窓まとめて。出力は (H-k+1, W-k+1)）。"""
+    c = np.pad(x, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+    return (c[k:, k:] - c[:-k, k:] - c[k:, :-k] + c[:-k, :-k]) / (k * k)
+
+def ssim(a, b, k=WIN):
+    """輝度どうしの平均 SSIM。"""
+    mu_a, mu_b = _box(a, k), _box(b, k)
+    var_a = _box(a * a, k) - mu_a ** 2
+    var_b = _box(b * b, k) - mu_b ** 2
+    cov = _box(a * b, k) - mu_a * mu_b
+    m = ((2 * mu_a * mu_b + C1) * (2 * cov + C2)) / ((mu_a ** 2 + mu_b ** 2 + C1) * (var_a + var_b + C2))
+    return float(m.mean())
+
+def _encode(img, q, method):
+    buf = io.BytesIO()
+    img.save(buf, "WEBP", quality=q, method=method)
+    return buf.getvalue()
+
+def search(img, target, method=6):
+    """目標を満たす q を二分探索する。戻り値: (q, data, ssim)"""
+    ref = luma(img)
+    memo = {}
+    def enc(q):
+        if q not in memo:
+            data = _encode(img, q, method)
+            with Image.open(io.BytesIO(data)) as d:
+                memo[q] = (data, ssim(ref, luma(d)) if "ssim" in target else None)
+        return memo[q]
+    def bisect(good, want_low):
+        """good(q) が単調と仮定。want_low なら good を満たす最小の q、でなければ最大の q。"""
+        lo, hi = Q_MIN, Q_MAX
+        best = None
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if good(mid):
+                best = mid
+                hi, lo = (mid - 1, lo) if want_low else (hi, mid + 1)
+            else:
+                hi, lo = (hi, mid + 1) if want_low else (mid - 1, lo)
+        return best
+    qs = []
+    if "ssim" in target:
+        q = bisect(lambda q: enc(q)[1] >= target["ssim"], want_low=True)
+        qs.append(Q_MAX if q is None else q)
+    if "max_bytes" in target:
+        q = bisect(lambda q: len(enc(q)[0]) <= target["max_bytes"], want_low=False)
+        qs.append(Q_MIN if q is None else q)
+    q = min(qs)
+    data, score = enc(q)
+    if score is None:
+        with Image.open(io.BytesIO(data)) as d:
+            score = ssim(ref, luma(d))
+    return q, data, score
+
+def encode(img, target, baseline_q, method=6, known=None):
+    """target が None なら baseline_q 固定。known（キャッシュ済みの {q, ssim, baseline}）があれば探索しない。
+    戻り値: (data, {q, ssim, baseline})  baseline は固定 q で出した場合のバイト数。"""
+    if not target:
+        data = _encode(img, baseline_q, method)
+        return data, {"q": baseline_q, "ssim": None, "baseline": len(data)}
+    if known:
+        return _encode(img, known["q"], method), known
+    q, data, score = search(img, target, method)
+    base = len(data) if q == baseline_q else len(_encode(img, baseline_q, method))
+    return data, {"q": q, "ssim": round(score, 5), "baseline": base}
+
+class QualityCache:
+    """元画像 sha1 + 目標 -> {q, ssim, baseline}。プロセスプールの子では使わず、親で引いて渡す。"""
+    def __init__(self, path=CACHE):
+        self.path = Path(path)
+        self.entries = file_cache.load(self.path, CACHE_VERSION)
+        self.dirty = False
+
+    @staticmethod
+    def key(src_sha1, target, method=6):
+        return src_sha1 + ":" + hashlib.sha1(target_key(target, method).encode()).hexdigest()[:12]
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def put(self, key, info):
+        if self.entries.get(key) != info:
+            self.entries[key] = info
+            self.dirty = True
+
+    def save(self):
+        if self.dirty:
+            file_cache.save(self.path, CACHE_VERSION, self.entries)
+            self.dirty = False
+
+def save_webp(writer, img, out_path, baseline_q, method=6, raw=None):
+    """生成スクリプト用：環境変数の目標があれば探索して保存（raw を渡せばそのハッシュでキャッシュ）。戻り値: 情報 dict"""
+    target = env_target()
+    cache = key = None
+    if target and raw is not None:
+        cache = QualityCache()
+        key = QualityCache.key(hashlib.sha1(raw).hexdigest(), target, method)
+    data, info = encode(img, target, baseline_q, method, known=cache.get(key) if cache else None)
+    writer.write_bytes(out_path, data)
+    if cache:
+        cache.put(key, info)
+        cache.save()
+    if target:
+        print(f"  quality search: q{info['q']} ssim {info['ssim']} / {len(data)/1024:.0f}KB (q{baseline_q} なら {info['baseline']/1024:.0f}KB)")
+    return info
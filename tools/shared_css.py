@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""ページに毎回インラインで載っている <style> を、内容ハッシュ付きの共有 CSS 1ファイルに出す。
+- <head> の素の <style> が一字一句同じページが MIN_PAGES 以上あれば、その中身を
+  assets/shared/article.<sha1 先頭10桁>.css に1つだけ置く（netlify.toml で /assets/shared/* は immutable。
+  中身が変われば名前も変わるので、HTML が max-age=0 でも CSS は2ページ目から読み直さない）
+- ページに残すのはファーストビュー（<body> から目次・最初の <h2>・<article> の手前まで、最大 FOLD_CHARS 字）に
+  出てくるタグ・class・id に当たるルールだけ（<style data-critical>）。@media の中も同じ基準で絞る
+- ブログ一覧・カテゴリ別ページは各カテゴリが <h2> で始まり一覧がファーストビューに入るので、PAGE_TYPES で
+  区切りを FOLD_CHARS 字だけにし、共有 CSS も blog-index.<sha1>.css と別名にする
+- 共有 CSS は <link rel="preload" as="style" onload=…> で描画を止めずに読み、<noscript> に普通の <link> を置く
+- 共有 CSS が既にある <style> は1ページだけでも同じ形にそろえる（記事エンジン・ブログ一覧は書き出し時に split() を通す）
+書き換えたページの元の <style> は full_style() で共有 CSS から1バイト違わず復元できる。
+  python3 tools/shared_css.py [--dry-run] [--min-pages 3] [--json report.json]
+報告は1ページビューあたりの削減バイト（HTML の差分＝共有 CSS がキャッシュ済みの2ページ目以降）を生と gzip 後で。
+"""
+import re, sys, json, time, zlib, hashlib, argparse, statistics
+from functools import lru_cache
+from pathlib import Path
+from check_links import pages
+from dedup_assets import share, shared_rel
+from site_writer import SiteWriter
+
+ROOT = Path(__file__).resolve().parent.parent
+MIN_PAGES = 3
+SHARED_NAME = "article.css"
+FOLD_CHARS = 8000
+FOLD_RE = re.compile(r'<nav class="toc"|<h2\b|<article\b')
+# (ページの相対パス, 共有 CSS の名前, ファーストビューの区切り)。どれにも当たらなければ記事扱い
+PAGE_TYPES = [
+    (re.compile(r"blog/(?:index\.html|category/)"), "blog-index.css", None),
+]
+STYLE_RE = re.compile(r"<style>(.*?)</style>", re.S)   # 属性なしの <style> だけ（data-critical 等は対象外）
+HEAD_END = "</head>"
+SHARED_LINK_RE = re.compile(r'<noscript><link rel="stylesheet" href="/(assets/shared/[\w.-]+\.css)"></noscript>')
+OPEN_TAG_RE = re.compile(r"<([a-zA-Z][\w-]*)([^>]*)>")
+CLASS_RE = re.compile(r'\sclass="([^"]*)"')
+ID_RE = re.compile(r'\sid="([^"]*)"')
+COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+NESTED_AT_RE = re.compile(r"@(?:media|supports|layer|container)\b")
+KEEP_AT = ("@font-face", "@import", "@charset")
+ATTR_SEL_RE = re.compile(r"\[[^\]]*\]")
+PSEUDO_RE = re.compile(r"::?[\w-]+(?:\([^)]*\))?")
+COMBINATOR_RE = re.compile(r"\s*[>+~]\s*|\s+")
+SEL_TAG_RE = re.compile(r"^([a-zA-Z][\w-]*|\*)")
+WS_RE = re.compile(r"\s+")
+ALWAYS_TAGS = {"html", "body", "*"}
+
+def gz(data):
+    return len(zlib.compress(data, 6)) + 18
+
+# ---------------------------------------------------------------- CSS
+
+def _close(css, i):
+    """css[i:] で対応する } の位置（入れ子の {} と文字列は飛ばす）。"""
+    depth = 1
+    while i < len(css):
+        c = css[i]
+        if c in "\"'":
+            i = css.find(c, i + 1)
+            if i < 0:
+                return len(css)
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if not depth:
+                return i
+        i += 1
+    return len(css)
+
+def _block(css, i):
+    out, start = [], i
+    while i < len(css):
+        c = css[i]
+        if c in "\"'":
+            j = css.find(c, i + 1)
+            i = len(css) if j < 0 else j + 1
+            continue
+        if c == "{":
+            prelude = css[start:i].strip()
+            if NESTED_AT_RE.match(prelude):
+                children, i = _block(css, i + 1)
+                out.append((prelude, tuple(children)))
+            else:
+                j = _close(css, i + 1)
+                out.append((prelude, css[i + 1:j].strip()))
+                i = j
+            start = i + 1
+        elif c == "}":
+            return out, i
+        elif c == ";" and css[start:i].lstrip().startswith("@"):
+            out.append((css[start:i].strip(), None))  # @import / @charset
+            start = i + 1
+        i += 1
+    return out, i
+
+@lru_cache(maxsize=8)
+def parse(css):
+    """戻り値: ((prelude, 宣言文字列 | 入れ子のタプル | None), …)。コメントは落とす。"""
+    return tuple(_block(COMMENT_RE.sub("", css), 0)[0])
+
+def serialize(rules):
+    out = []
+    for prelude, body in rules:
+        prelude = WS_RE.sub(" ", prelude)
+        if body is None:
+            out.append(prelude + ";")
+        elif isinstance(body, tuple):
+            out.append(prelude + "{" + serialize(body) + "}")
+        else:
+            out.append(prelude + "{" + WS_RE.sub(" ", body) + "}")
+    return "".join(out)
+
+def page_type(rel):
+    """ページの相対パス → (共有 CSS の名前, ファーストビューの区切りの正規表現 | None)"""
+    for pat, name, fold in PAGE_TYPES:
+        if pat.match(rel):
+            return name, fold
+    return SHARED_NAME, FOLD_RE
+
+def fold_tokens(html, fold_re=FOLD_RE):
+    """ファーストビューに出てくる (タグ, class, id) の集合。fold_re が None なら先頭 FOLD_CHARS 字。"""
+    b = html.find("<body")
+    body = html[b:] if b >= 0 else html
+    m = fold_re.search(body, 0, FOLD_CHARS) if fold_re else None
+    body = body[:m.start() if m else FOLD_CHARS]
+    tags, classes, ids = set(ALWAYS_TAGS), set(), set()
+    for t in OPEN_TAG_RE.finditer(body):
+        tags.add(t.group(1).lower())
+        if c := CLASS_RE.search(t.group(2)):
+            classes.update(c.group(1).split())
+        if i := ID_RE.search(t.group(2)):
+            ids.add(i.group(1))
+    return tags, classes, ids
+
+def matches(selector, fold):
+    """セレクタがファーストビューの要素に当たりうるか（擬似クラス・属性は無視して多めに拾う）。
+    祖先・前の兄弟はその要素より前に開くので、右端だけでなくすべての複合セレクタのタグ・class・id が揃っている必要がある。"""
+    tags, classes, ids = fold
+    for part in COMBINATOR_RE.split(ATTR_SEL_RE.sub("", selector).strip()):
+        part = PSEUDO_RE.sub("", part)
+        tag = SEL_TAG_RE.match(part)
+        if tag and tag.group(1).lower() not in tags:
+            return False
+        if not (set(re.findall(r"\.([\w-]+)", part)) <= classes and set(re.findall(r"#([\w-]+)", part)) <= ids):
+            return False
+    return True
+
+def pick(rules, fold):
+    out = []
+    for prelude, body in rules:
+        if isinstance(body, tuple):
+            inner = pick(body, fold)
+            if inner:
+                out.append((prelude, tuple(inner)))
+        elif prelude.startswith("@"):
+            if prelude.startswith(KEEP_AT):
+                out.append((prelude, body))
+        elif any(matches(s, fold) for s in re.split(r",(?![^()]*\))", prelude)):
+            out.append((prelude, body))
+    return out
+
+def critical(css, html, fold_re=FOLD_RE):
+    """css のうち html のファーストビューに要るルールだけ（空白を詰めた1行）。"""
+    return serialize(pick(parse(css), fold_tokens(html, fold_re)))
+
+# ---------------------------------------------------------------- ページ
+
+def head_style(html):
+    """<head> の中の素の <style> の match（無ければ None）。"""
+    end = html.find(HEAD_END)
+    return STYLE_RE.search(html, 0, end if end >= 0 else len(html))
+
+def full_style(html, root=ROOT):
+    """ページ本来の <style>…</style>。共有 CSS に出したページは共有ファイルから復元する。"""
+    m = head_style(html)
+    if m:
+        return m.group(0)
+    link = SHARED_LINK_RE.search(html)
+    if not link:
+        raise ValueError("<style> も共有 CSS の <link> も無い")
+    return "<style>" + (root / link.group(1)).read_text(encoding="utf-8") + "</style>"
+
+def css_url(css, name=SHARED_NAME):
+    return "/" + shared_rel(name, hashlib.sha1(css.encode("utf-8")).hexdigest())
+
+def publish(w, css, name=SHARED_NAME):
+    """共有 CSS を置いて URL を返す（同じ中身なら何もしない）。"""
+    return share(w, css.encode("utf-8"), name)
+
+def split(html, url=None, fold_re=FOLD_RE):
+    """html の <head> の <style> を「ファーストビュー分だけのインライン＋共有 CSS の非同期読み込み」に置き換える。
+    url を省くと中身から決まる共有 CSS の URL（ファイルは publish() で別に置くこと）。"""
+    m = head_style(html)
+    if not m:
+        return html
+    css = m.group(1)
+    url = url or css_url(css)
+    block = (f'<style data-critical>{critical(css, html, fold_re)}</style>\n'
+             f'<link rel="preload" href="{url}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+             f'<noscript><link rel="stylesheet" href="{url}"></noscript>')
+    return html[:m.start()] + block + html[m.end():]
+
+def apply(w, html, rel):
+    """ビルダー用: html（出力先の相対パス rel）の <style> を共有 CSS に置いて split() する（<style> が無ければそのまま）。"""
+    m = head_style(html)
+    if not m:
+        return html
+    name, fold_re = page_type(rel)
+    return split(html, publish(w, m.group(1), name), fold_re)
+
+def run(w, root=ROOT, min_pages=MIN_PAGES, dry_run=False):
+    """戻り値: {pages, groups, css: [{url, bytes, gz, pages}], rows: [{page, before, after, before_gz, after_gz}]}"""
+    found = {}
+    for p in (p for p in pages(root) if p.suffix == ".html"):
+        text = p.read_text(encoding="utf-8")
+        m = head_style(text)
+        if m:
+            rel = p.relative_to(root).as_posix()
+            found.setdefault((m.group(1), page_type(rel)), []).append((rel, p, text))
+    groups = {key: hits for key, hits in found.items()
+              if len(hits) >= min_pages or (root / css_url(key[0], key[1][0]).lstrip("/")).exists()}
+    rows, shared = [], []
+    for (css, (name, fold_re)), hits in sorted(groups.items(), key=lambda g: -len(g[1])):
+        raw = css.encode("utf-8")
+        url = css_url(css, name) if dry_run else publish(w, css, name)
+        shared.append({"url": url, "bytes": len(raw), "gz": gz(raw), "pages": len(hits)})
+        for rel, p, text in hits:
+            new = split(text, url, fold_re)
+            before, after = text.encode("utf-8"), new.encode("utf-8")
+            rows.append({"page": rel, "before": len(before), "after": len(after),
+                         "before_gz": gz(before), "after_gz": gz(after)})
+            if not dry_run:
+                w.write_text(p, new)
+    return {"pages": sum(len(h) for h in found.values()), "groups": len(groups), "css": shared, "rows": rows}
+
+def main():
+    ap = argparse.ArgumentParser(description="共通のインライン <style> を内容ハッシュ付きの共有 CSS に出す")
+    ap.add_argument("--dry-run", action="store_true", help="報告だけ（書き換えない）")
+    ap.add_argument("--min-pages", type=int, default=MIN_PAGES, help="同じ <style> がこのページ数以上なら共有 CSS にする")
+    ap.add_argument("--json", help="ページごとの結果を JSON で保存")
+    args = ap.parse_args()
+    t0 = time.perf_counter()
+    w = SiteWriter(ROOT)
+    r = run(w, ROOT, args.min_pages, args.dry_run)
+    for c in r["css"]:
+        print(f"  {c['url']}: {c['bytes']:,}B (gzip {c['gz']:,}B) x {c['pages']} pages")
+    for x in r["rows"]:
+        print(f"  {x['page']}: {x['before']:,} -> {x['after']:,}B (gzip {x['before_gz']:,} -> {x['after_gz']:,}B)")
+    rows = r["rows"]
+    if rows:
+        saved = [x["before"] - x["after"] for x in rows]
+        saved_gz = [x["before_gz"] - x["after_gz"] for x in rows]
+        css_gz = sum(c["gz"] for c in r["css"])
+        print(f"{len(rows)} pages -> {r['groups']} shared stylesheet(s) / saved per pageview: "
+              f"median {statistics.median(saved):,.0f}B (gzip {statistics.median(saved_gz):,.0f}B), "
+              f"total {sum(saved):,}B (gzip {sum(saved_gz):,}B) over one view of each page; "
+              f"first view also fetches {css_gz:,}B gzip of CSS once")
+    else:
+        print(f"no shared <style> ({r['pages']} pages still have their own inline <style>)")
+    print(f"  ({round((time.perf_counter() - t0) * 1000)}ms)" + ("" if args.dry_run else f"  files: {w.summary()}"))
+    if args.json:
+        Path(args.json).write_text(json.dumps(r, ensure_ascii=False, indent=1), encoding="utf-8")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
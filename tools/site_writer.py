@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""サイト出力ファイルの共通ライター（中身が同じなら書かない・書くときはアトミック）。
+- 既存ファイルと中身を比べ（サイズが違えば読まない）、同一なら触らない（mtime も変えない）
+  → Netlify の再アップロードや auto-push の空コミットを防ぐ
+- 書くときは同じディレクトリの一時ファイルに書いて os.replace（途中で落ちても半端なファイルが残らない）
+- written / unchanged / removed を数えて summary() で報告する
+使い方:
+    out = SiteWriter()
+    out.write_text(path, html)
+    print(out.summary())
+"""
+import io, os
+from pathlib import Path
+
+def _open_tmp(path):
+    """path と同じディレクトリに一時ファイルを排他作成する。モード 0o666 に umask をかけるのはカーネル任せ
+    （os.umask を読み替えないので、スレッド・プロセスプールと競合しない）。戻り値: (fd, 一時ファイル名)"""
+    while True:
+        tmp = path.with_name(f".{path.name}.{os.urandom(4).hex()}.tmp")
+        try:
+            return os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666), tmp
+        except FileExistsError:
+            continue
+
+class SiteWriter:
+    def __init__(self, root=None, verbose=False):
+        self.root = Path(root) if root else None
+        self.verbose = verbose
+        self.written, self.unchanged, self.removed = [], [], []
+
+    def _rel(self, path):
+        if self.root:
+            try:
+                return path.relative_to(self.root)
+            except ValueError:
+                pass
+        return path
+
+    def same(self, path, data):
+        """path が既に data と同じ中身か（サイズで先に弾き、同サイズのときだけ読んで比較）。"""
+        try:
+            if path.stat().st_size != len(data):
+                return False
+            return path.read_bytes() == data
+        except OSError:
+            return False
+
+    def write_bytes(self, path, data):
+        """戻り値: 実際に書いたら True、同一でスキップしたら False。"""
+        path = Path(path)
+        if self.same(path, data):
+            self.unchanged.append(path)
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            mode = path.stat().st_mode & 0o7777   # 既存ファイルはパーミッションを引き継ぐ
+        except OSError:
+            mode = None                           # 新規は 0o666 & ~umask のまま
+        fd, tmp = _open_tmp(path)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            if mode is not None:
+                os.chmod(tmp, mode)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self.written.append(path)
+        if self.verbose:
+            print(f"  write {self._rel(path)}")
+        return True
+
+    def write_text(self, path, text, encoding="utf-8"):
+        return self.write_bytes(path, text.encode(encoding))
+
+    def copy(self, src, dst):
+        return self.write_bytes(dst, Path(src).read_bytes())
+
+    def save_image(self, img, path, format, **params):
+        """PIL Image をメモリ上でエンコードしてから write_bytes する。"""
+        buf = io.BytesIO()
+        img.save(buf, format, **params)
+        return self.write_bytes(path, buf.getvalue())
+
+    def remove(self, path):
+        path = Path(path)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        self.removed.append(path)
+        if self.verbose:
+            print(f"  remove {self._rel(path)}")
+        return True
+
+    def summary(self):
+        return f"written {len(self.written)} / unchanged {len(self.unchanged)} / removed {len(self.removed)}"
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+# tools/ の各スクリプトは「python3 tools/xxx.py」で動かす前提で兄弟モジュールを直接 import するので、テストでも同じ並びにする。
+#   python3 -m pytest -q tools/tests
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""html_minify：中身を変えてはいけない要素・条件付きコメント、feed() の区切り方によらず同じ出力になるか。"""
+import random
+import pytest
+from html_minify import Minifier, minify, minify_stream
+
+PAGE = """<!DOCTYPE html>
+<html lang="ja">
+<head>
+  <meta charset="utf-8">
+  <!--[if lt IE 9]><script src="html5shiv.js"></script><![endif]-->
+  <style> .a  > b { color : red ; }  /* c */ </style>
+  <script type="application/ld+json">
+    { "@type" : "Article",  "name" : "a  b" }
+  </script>
+</head>
+<body>
+  <!-- 消えるコメント -->
+  <div class="x"  id='y'>
+    <p>今日は
+    明日は　<b>太字</b> <i>斜体</i></p>
+  </div>
+  <pre>  一行目
+     <b>二行目</b>  </pre>
+  <textarea name="t">  <p>タグではない</p>
+  </textarea>
+  <script>  var s = "<!-- x -->";  if (a < b) {  }  </script>
+  <input type="checkbox" checked="checked" disabled="">
+</body>
+</html>
+"""
+
+def test_raw_elements_untouched():
+    out = minify(PAGE)
+    assert "<pre>  一行目\n     <b>二行目</b>  </pre>" in out
+    assert '<textarea name="t">  <p>タグではない</p>\n  </textarea>' in out
+    assert '<script>  var s = "<!-- x -->";  if (a < b) {  }  </script>' in out
+
+def test_comments():
+    out = minify(PAGE)
+    assert "消えるコメント" not in out
+    assert '<!--[if lt IE 9]><script src="html5shiv.js"></script><![endif]-->' in out
+
+def test_text_whitespace_and_attributes():
+    out = minify(PAGE)
+    assert "<p>今日は\n明日は　<b>太字</b> <i>斜体</i></p>" in out      # 改行・全角空白・語間は描画されるので残す
+    assert '<div class="x" id=\'y\'>' in out
+    assert "<input type=\"checkbox\" checked disabled>" in out
+    assert '<script type="application/ld+json">{"@type":"Article","name":"a  b"}</script>' in out
+
+def test_idempotent():
+    once = minify(PAGE)
+    assert minify(once) == once
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_chunk_size_does_not_matter(size):
+    want = minify(PAGE)
+    chunks = [PAGE[i:i + size] for i in range(0, len(PAGE), size)]
+    assert "".join(minify_stream(chunks)) == want
+
+def test_random_chunks():
+    want = minify(PAGE)
+    rnd = random.Random(0)
+    for _ in range(200):
+        m, out, pos = Minifier(), [], 0
+        while pos < len(PAGE):
+            n = rnd.randint(0, 20)
+            out.append(m.feed(PAGE[pos:pos + n]))
+            pos += n
+        out.append(m.close())
+        assert "".join(out) == want
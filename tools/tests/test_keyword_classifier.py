@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""keyword_classifier：従来の「上のバケットから順に in で調べ、最初に当たったもの」と同じ判定になるか。"""
+import random
+import pytest
+from keyword_classifier import compile_classifier
+import build_blog_index as bbi
+
+def legacy(buckets, default, text):
+    for label, kws in buckets:
+        for kw in kws:
+            if kw in text:
+                return label
+    return default
+
+@pytest.mark.parametrize("text, want", [
+    ("", "資産運用"),
+    ("日々の家計メモ", "資産運用"),
+    ("オルカンと新nisaの話", "新NISA"),             # 後ろに出ても上のバケットが勝つ
+    ("sbi証券で米国etf", "米国株・指数"),
+    ("ideco と年金", "年金・ライフプラン"),
+    ("ゴールドと債券", "債券・資産防衛"),
+    ("s&p500 fund", "米国株・指数"),
+])
+def test_detect_examples(text, want):
+    assert bbi.detect(text, "", "") == want
+    assert legacy(bbi.BUCKETS, bbi.DEFAULT_BUCKET, text) == want
+
+def test_overlapping_and_prefix_keywords():
+    # 「idec」と「ideco」、重なった「ab」「bc」のように接頭辞・重なりがあっても優先順位は崩れない
+    buckets = [("A", ["bc"]), ("B", ["ab", "idec"]), ("C", ["ideco", "abc"])]
+    classify = compile_classifier(buckets, "-")
+    for text in ["abc", "xabcx", "ideco", "idecoab", "a", "b c", ""]:
+        assert classify(text) == legacy(buckets, "-", text), text
+
+def test_matches_legacy_on_random_text():
+    rnd = random.Random(0)
+    alphabet = [kw for _, kws in bbi.BUCKETS for kw in kws] + list("abcdefinos &-_ 米国株") + ["の", "　"]
+    classify = compile_classifier(bbi.BUCKETS, bbi.DEFAULT_BUCKET)
+    for _ in range(3000):
+        # キーワードを切れ端にして混ぜ、キーワードの一部だけ・またがりのケースを作る
+        text = "".join(rnd.choice(alphabet)[:rnd.randint(1, 4)] for _ in range(rnd.randint(0, 12)))
+        assert classify(text) == legacy(bbi.BUCKETS, bbi.DEFAULT_BUCKET, text), text
+
+def test_empty_buckets_return_default():
+    assert compile_classifier([], "x")("nisa") == "x"
+    assert compile_classifier([("A", [""])], "x")("nisa") == "x"
+
+def test_determine_category(tmp_path):
+    abg = pytest.importorskip("auto_blog_generator", exc_type=ImportError)
+    cases = [
+        ("nisa-plan.txt", "", ("nisa", "新NISA")),
+        ("memo.txt", "退職後の life plan と mutual fund", ("mutual-fund", "投資信託")),
+        ("retire.txt", "", ("life-plan", "ライフプラン")),
+        ("memo.txt", "家計の見直し", ("asset", "資産運用")),
+        ("fun", "d", ("asset", "資産運用")),        # ファイル名と本文をまたいだ「fund」は当てない
+    ]
+    for name, body, want in cases:
+        p = tmp_path / name
+        p.write_text(body, encoding="utf-8")
+        assert abg.determine_category(p) == want, name
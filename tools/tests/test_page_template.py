@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""page_template：{{name}} の escape・{{{name}}} の生HTML・{{@name}} のコンパイル時焼き込み・キャッシュ。"""
+from page_template import compile_template, esc, load, Template
+
+SKELETON = "<title>{{title}}</title>{{@style}}<h1>{{title}}</h1><main>{{{body}}}</main>{{@ga}}"
+CONSTS = {"style": "<style>a{}</style>", "ga": "<script>gtag()</script>"}
+
+def test_escape():
+    assert esc('a&b "c" <d>') == "a&amp;b &quot;c&quot; &lt;d&gt;"
+    out = compile_template(SKELETON, CONSTS).render({"title": '<A & "B">', "body": "<p>x</p>"})
+    assert out == ('<title>&lt;A &amp; &quot;B&quot;&gt;</title><style>a{}</style>'
+                   '<h1>&lt;A &amp; &quot;B&quot;&gt;</h1><main><p>x</p></main><script>gtag()</script>')
+
+def test_consts_baked_into_static_chunks():
+    tpl = compile_template(SKELETON, CONSTS)
+    # 定数はスロットにならず、隣の静的チャンクとまとめられている
+    assert [name for _, name, _ in tpl.slots] == ["title", "title", "body"]
+    assert "</title><style>a{}</style><h1>" in tpl.parts
+    assert tpl.parts[-1] == "</main><script>gtag()</script>"
+    # 定数の中の {{…}} は描画時に展開されない
+    out = compile_template("{{@c}}{{x}}", {"c": "{{x}}"}).render({"x": "1"})
+    assert out == "{{x}}1"
+
+def test_render_does_not_mutate_template():
+    tpl = compile_template(SKELETON, CONSTS)
+    a = tpl.render({"title": "a", "body": "A"})
+    b = tpl.render({"title": "b", "body": "B"})
+    assert "<h1>a</h1>" in a and "<h1>b</h1>" in b and "<h1>a</h1>" not in b
+
+def test_load_cache(tmp_path):
+    cache = tmp_path / "page_template.json"
+    calls = []
+    def consts():
+        calls.append(1)
+        return CONSTS
+    fields = {"title": "t", "body": "b"}
+    tpl, hit = load(SKELETON, "h1", consts, cache_path=cache)
+    assert not hit
+    tpl2, hit = load(SKELETON, "h1", consts, cache_path=cache)
+    assert hit and len(calls) == 1
+    assert isinstance(tpl2, Template) and tpl2.render(fields) == tpl.render(fields)
+    _, hit = load(SKELETON, "h2", consts, cache_path=cache)    # 参考記事が変わればコンパイルし直す
+    assert not hit and len(calls) == 2
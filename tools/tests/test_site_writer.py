@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""site_writer：中身が同じなら書かない（mtime も inode も変えない）、違えば原子的に置き換える。"""
+import os
+from site_writer import SiteWriter
+
+def test_unchanged_content_leaves_file_alone(tmp_path):
+    p = tmp_path / "a" / "b.html"
+    w = SiteWriter(tmp_path)
+    assert w.write_text(p, "<p>x</p>")                 # 親ディレクトリも作る
+    os.utime(p, (1_000_000, 1_000_000))
+    st = p.stat()
+    assert not w.write_text(p, "<p>x</p>")
+    st2 = p.stat()
+    assert (st2.st_mtime_ns, st2.st_ino) == (st.st_mtime_ns, st.st_ino)
+    assert w.summary() == "written 1 / unchanged 1 / removed 0"
+
+def test_changed_content_is_replaced(tmp_path):
+    p = tmp_path / "b.html"
+    p.write_text("<p>x</p>", encoding="utf-8")
+    os.chmod(p, 0o640)
+    w = SiteWriter(tmp_path)
+    assert w.write_text(p, "<p>y</p>")                 # 同じサイズでも中身が違えば書く
+    assert p.read_text(encoding="utf-8") == "<p>y</p>"
+    assert p.stat().st_mode & 0o777 == 0o640           # パーミッションは引き継ぐ
+    assert [q.name for q in tmp_path.iterdir()] == ["b.html"]   # 一時ファイルが残らない
+
+def test_remove(tmp_path):
+    p = tmp_path / "c.html"
+    p.write_bytes(b"x")
+    w = SiteWriter(tmp_path)
+    assert w.remove(p) and not p.exists()
+    assert not w.remove(p)
+    assert w.summary() == "written 0 / unchanged 0 / removed 1"
+
+def test_new_file_mode_follows_umask(tmp_path):
+    old = os.umask(0o027)
+    try:
+        p = tmp_path / "d.html"
+        SiteWriter(tmp_path).write_text(p, "x")
+    finally:
+        os.umask(old)
+    assert p.stat().st_mode & 0o777 == 0o640